@@ -0,0 +1,18 @@
+use std::fs;
+
+/// Exposes the version of the ruff parser, taken from the tag of the `ruff_python_parser` dependency in `Cargo.toml`,
+/// as the `RUFF_VERSION` environment variable at compile time, so that the key of the import cache follows upgrades of
+/// ruff without having to be updated by hand.
+fn main() {
+    println!("cargo::rerun-if-changed=Cargo.toml");
+
+    let manifest = fs::read_to_string("Cargo.toml").expect("Cargo.toml should be readable");
+    let ruff_version = manifest
+        .lines()
+        .find(|line| line.starts_with("ruff_python_parser "))
+        .and_then(|line| line.split("tag = \"").nth(1))
+        .and_then(|tag| tag.split('"').next())
+        .expect("ruff_python_parser should be a git dependency with a tag in Cargo.toml");
+
+    println!("cargo::rustc-env=RUFF_VERSION={ruff_version}");
+}
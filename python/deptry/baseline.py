@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from deptry.exceptions import BaselineNotFoundError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from deptry.violations import Violation
+
+
+def get_fingerprint(violation: Violation) -> str:
+    """
+    Get the fingerprint of a violation, made of its error code, the name of the module or dependency it is about, and
+    the file it is located in. Lines and columns are left out, so that violations are still recognized after code is
+    moved around in the file.
+    """
+    return f"{violation.error_code} {violation.issue.name} {violation.location.file.as_posix()}"
+
+
+def load_baseline(path: Path) -> frozenset[str]:
+    """Load the fingerprints of the violations recorded in the baseline file at `path`."""
+    try:
+        content = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise BaselineNotFoundError(path) from None
+
+    return frozenset(line for line in content.splitlines() if line)
+
+
+def save_baseline(path: Path, violations: Iterable[Violation]) -> None:
+    """
+    Record the fingerprints of `violations` in the baseline file at `path`, one per line, sorted and without duplicates,
+    so that changes to the baseline are easy to review.
+    """
+    fingerprints = sorted({get_fingerprint(violation) for violation in violations})
+    path.write_text("".join(f"{fingerprint}\n" for fingerprint in fingerprints), encoding="utf-8")
+
+    logging.info("Recorded %d dependency issues in baseline file '%s'.", len(fingerprints), path)
+
+
+def filter_baseline_violations(violations: list[Violation], baseline: frozenset[str]) -> list[Violation]:
+    """Remove the violations whose fingerprint is recorded in `baseline`."""
+    filtered = [violation for violation in violations if get_fingerprint(violation) not in baseline]
+
+    if len(filtered) < len(violations):
+        logging.debug("Ignoring %d violations recorded in the baseline.", len(violations) - len(filtered))
+
+    return filtered
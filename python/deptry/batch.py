@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.python_file_finder import get_all_python_files_in
+from deptry.rust import ParsedFiles
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from deptry.core import Core
+
+PROJECT_FILES = ("pyproject.toml", "requirements.txt")
+
+# Directories that are never searched for projects, as they either contain installed packages, or test fixtures that
+# are projects themselves.
+SKIPPED_DIRECTORIES_PATTERN = re.compile(r"(venv|\..*|tests|node_modules|__pycache__)")
+
+
+@dataclass
+class Project:
+    directory: Path
+    core: Core
+
+
+def find_projects(path: Path) -> list[Path]:
+    """
+    Find the directories of the projects to check. If `path` is a directory, projects are all the directories inside it
+    (including itself) that contain a `pyproject.toml` or a `requirements.txt` file. Otherwise, `path` is a manifest that
+    lists the directories of the projects, one per line, relative to the directory of the manifest. Empty lines and lines
+    starting with `#` are ignored in manifests.
+    """
+    if path.is_dir():
+        return _find_projects_in(path)
+
+    return [
+        Path(os.path.normpath(path.parent / line))
+        for line in (line.strip() for line in path.read_text().splitlines())
+        if line and not line.startswith("#")
+    ]
+
+
+def _find_projects_in(directory: Path) -> list[Path]:
+    projects = []
+
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(name for name in dirs if not SKIPPED_DIRECTORIES_PATTERN.fullmatch(name))
+
+        if any(project_file in files for project_file in PROJECT_FILES):
+            projects.append(Path(os.path.normpath(root)))
+
+    return projects
+
+
+@contextmanager
+def within_directory(directory: Path) -> Generator[None, None, None]:
+    """Change the working directory for the duration of the context, as deptry resolves paths from it."""
+    cwd = Path.cwd()
+    os.chdir(directory)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+@dataclass
+class Batch:
+    """
+    Check several projects in the same process, so that the metadata of installed distributions is only indexed once,
+    Python files of all projects are found in a few walks of the file tree, instead of one per project, and files shared
+    by several projects (e.g. through symbolic links) are only parsed once.
+
+    Each project is checked as if deptry was run from its directory with `.` as root, using the configuration parsed in
+    that directory. Files of a project nested in another one are only checked as part of the nested project.
+    """
+
+    projects: list[Project]
+
+    def run(self) -> None:
+        python_files = self._find_python_files()
+        parsed_files = ParsedFiles()
+
+        projects_with_violations = 0
+        for project in self.projects:
+            logging.info("\n%s", project.directory)
+
+            with within_directory(project.directory):
+                if project.core.check(python_files.get(project.directory), parsed_files):
+                    projects_with_violations += 1
+
+        if projects_with_violations:
+            logging.info(
+                "\nFound dependency issues in %d of %d projects.", projects_with_violations, len(self.projects)
+            )
+        else:
+            logging.info("\nNo dependency issues found in %d projects.", len(self.projects))
+
+        sys.exit(bool(projects_with_violations))
+
+    def _find_python_files(self) -> dict[Path, list[Path]]:
+        """
+        Find the Python files of all projects, relative to the directory of their project. Projects are walked together
+        when they share the options that the walk depends on. Since exclusion patterns are matched from the start of the
+        paths, the ones of each project are prefixed with the directory of the project. To keep exclusion patterns of a
+        project from applying to the projects nested in it, nested projects are walked separately from their parents,
+        which do not descend into them.
+        """
+        projects_directories = {project.directory for project in self.projects}
+        groups: defaultdict[tuple[int, bool, bool, int], list[Project]] = defaultdict(list)
+
+        for project in self.projects:
+            if project.core.is_incremental:
+                # Incremental runs do not walk the file tree, as files are read from the import cache.
+                continue
+
+            depth = sum(parent in projects_directories for parent in project.directory.parents)
+            groups[
+                depth, project.core.using_default_exclude, project.core.ignore_notebooks, project.core.walk_threads
+            ].append(project)
+
+        python_files: dict[Path, list[Path]] = {}
+
+        for (_, using_default_exclude, ignore_notebooks, walk_threads), projects in groups.items():
+            excluded_patterns = [
+                pattern
+                for project in projects
+                for pattern in self._get_excluded_patterns(project, projects_directories)
+            ]
+
+            files_by_project = self._group_files_by_project(
+                get_all_python_files_in(
+                    tuple(project.directory for project in projects),
+                    tuple(excluded_patterns),
+                    (),
+                    using_default_exclude,
+                    ignore_notebooks,
+                    walk_threads,
+                ),
+                {project.directory for project in projects},
+            )
+
+            for project in projects:
+                python_files[project.directory] = files_by_project.get(project.directory, [])
+
+        return python_files
+
+    @staticmethod
+    def _get_excluded_patterns(project: Project, projects_directories: set[Path]) -> Iterable[str]:
+        prefix = "" if project.directory == Path() else f"{_escape(project.directory.as_posix())}/"
+
+        if patterns := (*project.core.exclude, *project.core.extend_exclude):
+            yield f"{prefix}(?:{'|'.join(patterns)})"
+
+        for directory in projects_directories:
+            if project.directory in directory.parents:
+                yield f"{_escape(directory.as_posix())}$"
+
+    @staticmethod
+    def _group_files_by_project(files: Iterable[Path], projects_directories: set[Path]) -> dict[Path, list[Path]]:
+        files_by_project: defaultdict[Path, list[Path]] = defaultdict(list)
+
+        for file in files:
+            directory = next(parent for parent in file.parents if parent in projects_directories)
+            files_by_project[directory].append(file.relative_to(directory))
+
+        return files_by_project
+
+
+def _escape(path: str) -> str:
+    # Spaces are escaped by `re.escape`, which the regular expressions engine used to walk the file tree rejects.
+    return re.escape(path).replace("\\ ", " ")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.exceptions import GitChangedFilesError
+from deptry.rust import filter_walked_files
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def get_files_changed_since(ref: str) -> list[Path]:
+    """
+    Get the files that changed since the git reference `ref`, relative to the current directory. This includes files
+    that are not committed yet, untracked files, and files that were deleted. Renamed files are listed under both their
+    old and new paths.
+    """
+    changed_files = _run_git_command("diff", "--name-only", "--relative", "--no-renames", ref, "--", ref=ref)
+    untracked_files = _run_git_command("ls-files", "--others", "--exclude-standard", ref=ref)
+
+    return [Path(file) for file in dict.fromkeys([*changed_files, *untracked_files])]
+
+
+def _run_git_command(*args: str, ref: str) -> list[str]:
+    try:
+        result = subprocess.run(["git", *args], capture_output=True, text=True, check=True)  # noqa: S603, S607
+    except FileNotFoundError as e:
+        raise GitChangedFilesError(ref, str(e)) from None
+    except subprocess.CalledProcessError as e:
+        raise GitChangedFilesError(ref, e.stderr.strip()) from None
+
+    return result.stdout.splitlines()
+
+
+def filter_python_files(
+    files: Iterable[Path],
+    directories: tuple[Path, ...],
+    exclude: tuple[str, ...],
+    extend_exclude: tuple[str, ...],
+    using_default_exclude: bool,
+    ignore_notebooks: bool = False,
+) -> list[Path]:
+    """
+    Keep the files that would have been found by `get_all_python_files_in` when searching Python files in `directories`,
+    i.e. existing Python files (and notebooks, unless `ignore_notebooks` is set) that are located in one of the
+    directories and are neither excluded nor ignored by ignore files like `.gitignore`. Files are returned relative to
+    the directory they are located in, the same way they are returned by `get_all_python_files_in`, so that they can be
+    compared to each other.
+    """
+    suffixes = {".py"} if ignore_notebooks else {".py", ".ipynb"}
+    absolute_directories = [(directory, directory.absolute()) for directory in directories]
+
+    located_files: dict[tuple[Path, Path], None] = {}
+    for file in files:
+        if file.suffix not in suffixes:
+            continue
+
+        location = _locate_in_directories(file, absolute_directories)
+        if location is not None:
+            located_files[location] = None
+
+    # Exclusions and ignore files are applied by the same walker as the one that finds Python files, only listing the
+    # directories leading to each file.
+    return [
+        Path(file)
+        for file in filter_walked_files(
+            list(located_files), exclude, extend_exclude, using_default_exclude, ignore_notebooks
+        )
+    ]
+
+
+def _locate_in_directories(file: Path, absolute_directories: list[tuple[Path, Path]]) -> tuple[Path, Path] | None:
+    """Find the first directory containing `file`, and return it alongside the path of the file relative to it."""
+    absolute_file = file.absolute()
+
+    for directory, absolute_directory in absolute_directories:
+        if absolute_file.is_relative_to(absolute_directory):
+            return directory, absolute_file.relative_to(absolute_directory)
+
+    return None
@@ -10,9 +10,12 @@ from typing import TYPE_CHECKING
 
 import click
 
+from deptry.batch import Batch, Project, find_projects, within_directory
 from deptry.config import read_configuration_from_pyproject_toml
 from deptry.core import Core
 from deptry.deprecations import handle_deprecations
+from deptry.exceptions import NoProjectFoundError, UpdateBaselineWithoutBaselineError, WatchInBatchModeError
+from deptry.reporters.json import JSON_OUTPUT_FORMATS
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, MutableMapping, Sequence
@@ -220,6 +223,18 @@ def display_deptry_version(ctx: click.Context, _param: click.Parameter, value: b
     help="""If specified, a summary of the dependency issues found will be written to the output location specified. e.g. `deptry . -o deptry.json`""",
     show_default=True,
 )
+@click.option(
+    "--json-output-format",
+    type=click.Choice(JSON_OUTPUT_FORMATS),
+    help="""Format of the file written with `--json-output`: an indented JSON array (`json`), a JSON array without whitespace (`json-compact`), or one issue per line (`jsonl`).""",
+    default="json",
+    show_default=True,
+)
+@click.option(
+    "--sarif-output",
+    type=str,
+    help="""If specified, the dependency issues found will be written in SARIF format to the output location specified, to be uploaded to code scanning tools. e.g. `deptry . --sarif-output deptry.sarif`""",
+)
 @click.option(
     "--github-output",
     "-go",
@@ -275,6 +290,58 @@ def display_deptry_version(ctx: click.Context, _param: click.Parameter, value: b
     is_flag=True,
     help="Enable experimental support for namespace package (PEP 420) when detecting local modules (https://peps.python.org/pep-0420/).",
 )
+@click.option(
+    "--experimental-import-scanner",
+    is_flag=True,
+    help="Enable experimental search of imports in Python files without fully parsing them, when they only use constructs supported by the scanner, which is faster on large files. Syntax errors are not reported for files handled by the scanner.",
+)
+@click.option(
+    "--walk-threads",
+    type=click.IntRange(min=0),
+    help="Number of threads used to walk the directories in which Python files are searched. 0 chooses the number of threads based on the number of CPUs, and 1 walks directories sequentially.",
+    default=0,
+    show_default=True,
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory in which imports extracted from Python files are cached, so that files that did not change are not parsed again in subsequent runs.",
+    default=".deptry_cache",
+    show_default=True,
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable the cache of imports extracted from Python files.",
+)
+@click.option(
+    "--changed-files",
+    type=COMMA_SEPARATED_TUPLE,
+    help="""A comma-separated list of files that changed since the last run. Only those files are parsed, while imports of
+    other files are read from the cache populated by a previous run. e.g. `deptry . --changed-files src/foo.py,src/bar.py`""",
+    default=(),
+)
+@click.option(
+    "--since",
+    type=str,
+    help="""A git reference (e.g. a branch, a tag or a commit). Only files that changed since this reference are parsed, while
+    imports of other files are read from the cache populated by a previous run. e.g. `deptry . --since HEAD`""",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running after the first scan, and report dependency issues that appear or are resolved each time Python files or dependency definitions change.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="File recording dependency issues to ignore, e.g. existing issues when adopting deptry on a project. Issues are identified by their error code, module and file, regardless of their line.",
+)
+@click.option(
+    "--update-baseline",
+    is_flag=True,
+    help="Record all dependency issues found in the baseline file set with '--baseline', instead of reporting them.",
+)
 # This flag is not exposed because it is used in functional tests to have consistent output between platforms.
 @click.option(
     "--enforce-posix-paths",
@@ -297,6 +364,8 @@ def cli(
     requirements_files_dev: tuple[str, ...],
     known_first_party: tuple[str, ...],
     json_output: str,
+    json_output_format: str,
+    sarif_output: str,
     github_output: bool,
     github_warning_errors: tuple[str, ...],
     package_module_name_map: MutableMapping[str, tuple[str, ...]],
@@ -304,6 +373,15 @@ def cli(
     optional_dependencies_dev_groups: tuple[str, ...],
     non_dev_dependency_groups: tuple[str, ...],
     experimental_namespace_package: bool,
+    experimental_import_scanner: bool,
+    walk_threads: int,
+    cache_dir: Path,
+    no_cache: bool,
+    changed_files: tuple[str, ...],
+    since: str | None,
+    watch: bool,
+    baseline: Path | None,
+    update_baseline: bool,
     enforce_posix_paths: bool,
 ) -> None:
     """Find dependency issues in your Python project.
@@ -318,36 +396,95 @@ def cli(
 
         deptry src worker
 
+    To check several projects at once, e.g. in a monorepo, see `deptry-batch --help`.
     """
 
+    create_core(ctx).run()
+
+
+def create_core(ctx: click.Context) -> Core:
+    """Create the `Core` object from the options parsed by `cli` in the given context."""
     handle_deprecations(ctx)
 
-    Core(
-        root=root,
-        config=config,
-        no_ansi=no_ansi,
-        exclude=exclude or DEFAULT_EXCLUDE,
-        extend_exclude=extend_exclude,
-        using_default_exclude=not exclude,
-        ignore_notebooks=ignore_notebooks,
-        ignore=ignore,
-        per_rule_ignores=per_rule_ignores,
-        requirements_files=requirements_files or DEFAULT_REQUIREMENTS_FILES,
-        using_default_requirements_files=not requirements_files,
-        requirements_files_dev=requirements_files_dev,
-        known_first_party=known_first_party,
-        json_output=json_output,
-        github_output=github_output,
-        github_warning_errors=github_warning_errors,
-        package_module_name_map=package_module_name_map,
-        optional_dependencies_dev_groups=pep621_dev_dependency_groups or optional_dependencies_dev_groups,
-        non_dev_dependency_groups=non_dev_dependency_groups,
-        experimental_namespace_package=experimental_namespace_package,
-        enforce_posix_paths=enforce_posix_paths,
-    ).run()
+    options = ctx.params
+
+    if options["update_baseline"] and options["baseline"] is None:
+        raise UpdateBaselineWithoutBaselineError
+
+    return Core(
+        root=options["root"],
+        config=options["config"],
+        no_ansi=options["no_ansi"],
+        exclude=options["exclude"] or DEFAULT_EXCLUDE,
+        extend_exclude=options["extend_exclude"],
+        using_default_exclude=not options["exclude"],
+        ignore_notebooks=options["ignore_notebooks"],
+        walk_threads=options["walk_threads"],
+        ignore=options["ignore"],
+        per_rule_ignores=options["per_rule_ignores"],
+        requirements_files=options["requirements_files"] or DEFAULT_REQUIREMENTS_FILES,
+        using_default_requirements_files=not options["requirements_files"],
+        requirements_files_dev=options["requirements_files_dev"],
+        known_first_party=options["known_first_party"],
+        json_output=options["json_output"],
+        json_output_format=options["json_output_format"],
+        sarif_output=options["sarif_output"],
+        github_output=options["github_output"],
+        github_warning_errors=options["github_warning_errors"],
+        package_module_name_map=options["package_module_name_map"],
+        optional_dependencies_dev_groups=(
+            options["pep621_dev_dependency_groups"] or options["optional_dependencies_dev_groups"]
+        ),
+        non_dev_dependency_groups=options["non_dev_dependency_groups"],
+        experimental_namespace_package=options["experimental_namespace_package"],
+        experimental_import_scanner=options["experimental_import_scanner"],
+        enforce_posix_paths=options["enforce_posix_paths"],
+        cache_dir=None if options["no_cache"] else options["cache_dir"],
+        changed_files=tuple(Path(file) for file in options["changed_files"]),
+        since=options["since"],
+        watch=options["watch"],
+        baseline=options["baseline"],
+        update_baseline=options["update_baseline"],
+    )
+
+
+@click.command(context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False})
+@click.argument("path", type=click.Path(exists=True, path_type=Path))
+@click.argument("deptry_options", nargs=-1, type=click.UNPROCESSED)
+@click.pass_context
+def batch_cli(ctx: click.Context, path: Path, deptry_options: tuple[str, ...]) -> None:
+    """Find dependency issues in several projects in a single run, e.g. in a monorepo.
+
+    PATH is either a directory in which to search for projects, i.e. directories that contain a 'pyproject.toml' or a
+    'requirements.txt' file, or a file that lists the directories of the projects, one per line, relative to the file.
+
+    Each project is checked as if deptry was run with '.' as root from the directory of the project, using the
+    configuration of the project. DEPTRY_OPTIONS are options of deptry that are applied to all projects, on top of their
+    configuration. For instance:
+
+        deptry-batch . --ignore DEP004
+    """
+    projects = []
+
+    for directory in find_projects(path):
+        with within_directory(directory):
+            project_ctx = cli.make_context("deptry", [".", *deptry_options], max_content_width=ctx.max_content_width)
+            projects.append(Project(directory, create_core(project_ctx)))
+
+    if not projects:
+        raise NoProjectFoundError(path)
+
+    if any(project.core.watch for project in projects):
+        raise WatchInBatchModeError
+
+    Batch(projects).run()
 
 
 def deptry() -> None:
     column_size, _line_size = shutil.get_terminal_size()
-
     cli(max_content_width=column_size)
+
+
+def deptry_batch() -> None:
+    column_size, _line_size = shutil.get_terminal_size()
+    batch_cli(max_content_width=column_size)
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from deptry.baseline import filter_baseline_violations, load_baseline, save_baseline
+from deptry.changed_files import filter_python_files, get_files_changed_since
+from deptry.dependency import DependenciesIndex
 from deptry.dependency_getter.builder import DependencyGetterBuilder
-from deptry.imports.extract import get_imported_modules_from_list_of_files
+from deptry.distributions import get_distributions_index
+from deptry.imports.cache import load_import_cache, save_import_cache
+from deptry.imports.extract import get_import_table_from_directories, get_import_table_from_list_of_files
 from deptry.module import ModuleBuilder, ModuleLocations
-from deptry.python_file_finder import get_all_python_files_in
-from deptry.reporters import GithubReporter, JSONReporter, TextReporter
+from deptry.python_file_finder import get_all_python_files_and_directories_in
+from deptry.reporters import GithubReporter, JSONReporter, SarifReporter, TextReporter, WatchReporter
 from deptry.violations.finder import find_violations
+from deptry.watch import watch_files
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
-    from pathlib import Path
+    from collections.abc import Iterable, Mapping
 
     from deptry.dependency_getter.base import DependenciesExtract
+    from deptry.rust import ImportCache, ParsedFiles
     from deptry.violations import Violation
 
 
@@ -32,22 +41,97 @@ class Core:
     extend_exclude: tuple[str, ...]
     using_default_exclude: bool
     ignore_notebooks: bool
+    walk_threads: int
     requirements_files: tuple[str, ...]
     using_default_requirements_files: bool
     requirements_files_dev: tuple[str, ...]
     known_first_party: tuple[str, ...]
     json_output: str
+    json_output_format: str
+    sarif_output: str
     package_module_name_map: Mapping[str, tuple[str, ...]]
     optional_dependencies_dev_groups: tuple[str, ...]
     non_dev_dependency_groups: tuple[str, ...]
     experimental_namespace_package: bool
+    experimental_import_scanner: bool
     enforce_posix_paths: bool
     github_output: bool
     github_warning_errors: tuple[str, ...]
+    cache_dir: Path | None
+    changed_files: tuple[Path, ...]
+    since: str | None
+    watch: bool
+    baseline: Path | None
+    update_baseline: bool
 
     def run(self) -> None:
+        # The cache is shared with watch mode, so that imports are kept in memory even if the cache is not persisted.
+        import_cache = load_import_cache(self.cache_dir)
+        violations = self.check(import_cache=import_cache)
+
+        if self.watch:
+            violations = self._watch(import_cache, violations)
+
+        self._exit(violations)
+
+    def check(
+        self,
+        python_files: list[Path] | None = None,
+        parsed_files: ParsedFiles | None = None,
+        import_cache: ImportCache | None = None,
+    ) -> list[Violation]:
+        """
+        Find and report violations, without exiting. If `python_files` is set, these files are scanned instead of the
+        ones found in `root`, so that files of several projects can be found in a single walk of the file tree. If
+        `parsed_files` is set, files that were already parsed when checking another project are not parsed again. If
+        `import_cache` is not set, the cache is loaded from `cache_dir`.
+        """
         self._log_config()
 
+        dependencies_extract = self._get_dependencies()
+
+        if import_cache is None:
+            import_cache = load_import_cache(self.cache_dir)
+        if python_files is None:
+            python_files = self._find_python_files(import_cache)
+        else:
+            # Files found outside of `root` (e.g. without the projects nested in it) are not an index of the project.
+            import_cache.index_scope = None
+
+        violations = self._find_violations(python_files, import_cache, dependencies_extract, parsed_files)
+        save_import_cache(import_cache, self.cache_dir)
+
+        if self.baseline is not None:
+            if self.update_baseline:
+                # All violations are recorded in the baseline, so none of them is reported.
+                save_baseline(self.baseline, violations)
+                violations = []
+            else:
+                violations = filter_baseline_violations(violations, load_baseline(self.baseline))
+
+        TextReporter(violations, enforce_posix_paths=self.enforce_posix_paths, use_ansi=not self.no_ansi).report()
+
+        if self.json_output:
+            JSONReporter(
+                violations,
+                enforce_posix_paths=self.enforce_posix_paths,
+                json_output=self.json_output,
+                json_output_format=self.json_output_format,
+            ).report()
+
+        if self.sarif_output:
+            SarifReporter(
+                violations, enforce_posix_paths=self.enforce_posix_paths, sarif_output=self.sarif_output
+            ).report()
+
+        if self.github_output:
+            GithubReporter(
+                violations, enforce_posix_paths=self.enforce_posix_paths, warning_ids=self.github_warning_errors
+            ).report()
+
+        return violations
+
+    def _get_dependencies(self) -> DependenciesExtract:
         dependency_getter = DependencyGetterBuilder(
             self.config,
             self.package_module_name_map,
@@ -62,10 +146,39 @@ class Core:
 
         self._log_dependencies(dependencies_extract)
 
-        python_files = self._find_python_files()
+        return dependencies_extract
+
+    def _find_violations(
+        self,
+        python_files: list[Path] | None,
+        import_cache: ImportCache,
+        dependencies_extract: DependenciesExtract,
+        parsed_files: ParsedFiles | None = None,
+    ) -> list[Violation]:
         local_modules = self._get_local_modules()
         standard_library_modules = self._get_standard_library_modules()
 
+        dependencies_index = DependenciesIndex.from_dependencies(dependencies_extract.dependencies)
+        dev_dependencies_index = DependenciesIndex.from_dependencies(dependencies_extract.dev_dependencies)
+
+        if python_files is None:
+            import_table = get_import_table_from_directories(
+                self.root,
+                self.exclude,
+                self.extend_exclude,
+                self.using_default_exclude,
+                self.ignore_notebooks,
+                self.walk_threads,
+                import_cache,
+                parsed_files,
+                self.experimental_import_scanner,
+            )
+            import_cache.index_scope = self._index_scope
+        else:
+            import_table = get_import_table_from_list_of_files(
+                python_files, import_cache, parsed_files, self.experimental_import_scanner
+            )
+
         imported_modules_with_locations = [
             ModuleLocations(
                 ModuleBuilder(
@@ -74,46 +187,159 @@ class Core:
                     standard_library_modules,
                     dependencies_extract.dependencies,
                     dependencies_extract.dev_dependencies,
+                    dependencies_index,
+                    dev_dependencies_index,
                 ).build(),
-                locations,
+                import_table.get_locations(module_index),
             )
-            for module, locations in get_imported_modules_from_list_of_files(python_files).items()
+            for module_index, module in enumerate(import_table.modules)
         ]
 
-        violations = find_violations(
+        return find_violations(
             imported_modules_with_locations,
             dependencies_extract.dependencies,
             self.ignore,
             self.per_rule_ignores,
             standard_library_modules,
+            dependencies_index,
         )
-        TextReporter(violations, enforce_posix_paths=self.enforce_posix_paths, use_ansi=not self.no_ansi).report()
 
-        if self.json_output:
-            JSONReporter(
-                violations, enforce_posix_paths=self.enforce_posix_paths, json_output=self.json_output
-            ).report()
+    def _watch(self, import_cache: ImportCache, violations: list[Violation]) -> list[Violation]:
+        """
+        Watch Python files and dependency definitions for changes, and report violations that appeared or were resolved
+        after each change, until interrupted. Only changed files are parsed again, as imports of other files are kept in
+        the import cache, and the file tree is only walked again when directories are created or deleted. Return the
+        violations found after the last change.
+        """
+        dependencies_extract = self._get_dependencies()
+        baseline = load_baseline(self.baseline) if self.baseline is not None else frozenset()
 
-        if self.github_output:
-            GithubReporter(
-                violations, enforce_posix_paths=self.enforce_posix_paths, warning_ids=self.github_warning_errors
-            ).report()
+        logging.info("\nWatching for changes... Press Ctrl+C to stop.")
 
-        self._exit(violations)
+        try:
+            for changed_files, python_files in watch_files(
+                self._find_python_files_to_watch,
+                self._filter_python_files,
+                [self.config, *(Path(file) for file in (*self.requirements_files, *self.requirements_files_dev))],
+            ):
+                start = time.perf_counter()
+                logging.info(
+                    "\nDetected changes in %d %s.", len(changed_files), "files" if len(changed_files) > 1 else "file"
+                )
+
+                if self.config in changed_files or any(
+                    str(file) in self.requirements_files or str(file) in self.requirements_files_dev
+                    for file in changed_files
+                ):
+                    # Dependencies were likely installed or removed alongside the change of their definitions.
+                    get_distributions_index.cache_clear()
+                    dependencies_extract = self._get_dependencies()
+
+                new_violations = filter_baseline_violations(
+                    self._find_violations(python_files, import_cache, dependencies_extract), baseline
+                )
+                import_cache.index_scope = self._index_scope
+                save_import_cache(import_cache, self.cache_dir)
+
+                WatchReporter(
+                    new_violations,
+                    enforce_posix_paths=self.enforce_posix_paths,
+                    use_ansi=not self.no_ansi,
+                    previous_violations=violations,
+                ).report()
+                logging.debug("Updated violations in %.0f ms.", (time.perf_counter() - start) * 1000)
 
-    def _find_python_files(self) -> list[Path]:
-        logging.debug("Collecting Python files to scan...")
+                violations = new_violations
+        except KeyboardInterrupt:
+            logging.info("\nStopped watching for changes.")
 
-        python_files = get_all_python_files_in(
-            self.root, self.exclude, self.extend_exclude, self.using_default_exclude, self.ignore_notebooks
+        return violations
+
+    def _find_python_files_to_watch(self) -> tuple[list[Path], list[Path]]:
+        logging.debug("Collecting Python files to watch...")
+
+        return get_all_python_files_and_directories_in(
+            self.root,
+            self.exclude,
+            self.extend_exclude,
+            self.using_default_exclude,
+            self.ignore_notebooks,
+            self.walk_threads,
         )
 
+    def _find_python_files(self, import_cache: ImportCache) -> list[Path] | None:
+        """
+        Find the Python files to scan on incremental runs. Return `None` when all Python files in `root` are scanned, as
+        they are then found while being scanned.
+        """
+        if not self.is_incremental:
+            return None
+
+        if import_cache.index_scope != self._index_scope:
+            logging.info(
+                "No import index of the files in %s found in the cache, scanning all Python files instead of changed"
+                " ones.",
+                ", ".join(str(root) for root in self.root),
+            )
+            return None
+
+        python_files = self._find_python_files_incrementally(import_cache)
+
         logging.debug(
             "Python files to scan for imports:\n%s\n", "\n".join(str(python_file) for python_file in python_files)
         )
 
         return python_files
 
+    @property
+    def is_incremental(self) -> bool:
+        return bool(self.changed_files) or self.since is not None
+
+    @property
+    def _index_scope(self) -> str:
+        """
+        Identify the options that the Python files found in `root` depend on, so that files indexed in the import cache
+        are only used by incremental runs with the same options as the walk of the file tree that indexed them.
+        """
+        return json.dumps([
+            [str(root) for root in self.root],
+            self.exclude,
+            self.extend_exclude,
+            self.using_default_exclude,
+            self.ignore_notebooks,
+        ])
+
+    def _find_python_files_incrementally(self, import_cache: ImportCache) -> list[Path]:
+        """
+        Get Python files to scan from the files indexed in the import cache by a previous walk of the file tree with the
+        same options, and the files that changed since then, instead of walking the file tree. Imports of unchanged
+        files are read from the cache, so that only changed files are parsed, while violations are still computed for
+        the whole project.
+        """
+        changed_files = list(self.changed_files)
+        if self.since is not None:
+            changed_files.extend(get_files_changed_since(self.since))
+
+        logging.debug(
+            "Collecting Python files to scan from the import index and %d changed files...", len(changed_files)
+        )
+
+        # Indexed files were found by a walk of the file tree with the same options, so only changed files are filtered.
+        indexed_files = [Path(file) for file in import_cache.files()]
+        changed_python_files = self._filter_python_files(changed_files)
+
+        python_files = list(dict.fromkeys([*indexed_files, *changed_python_files]))
+        deleted_files = {file.absolute() for file in changed_files if not file.exists()}
+        if deleted_files:
+            python_files = [file for file in python_files if file.absolute() not in deleted_files]
+
+        return python_files
+
+    def _filter_python_files(self, files: Iterable[Path]) -> list[Path]:
+        return filter_python_files(
+            files, self.root, self.exclude, self.extend_exclude, self.using_default_exclude, self.ignore_notebooks
+        )
+
     def _get_local_modules(self) -> set[str]:
         """
         Get all local Python modules from the source directories and `known_first_party` list.
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import logging
-import re
+from collections import defaultdict
 from contextlib import suppress
-from importlib import metadata
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from packaging.requirements import InvalidRequirement, Requirement
 
+from deptry.distributions import get_distributions_index
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
     from importlib.metadata import Distribution
     from pathlib import Path
 
@@ -33,16 +35,12 @@ class Dependency:
         definition_file: Path,
         module_names: Sequence[str] | None = None,
     ) -> None:
-        distribution = self.find_distribution(name)
-
         self.name = name
         self.definition_file = definition_file
-        self.found = distribution is not None
-        self.top_levels = self._get_top_levels(name, distribution, module_names)
+        self.found = self.find_distribution(name) is not None
+        self.top_levels = self._get_top_levels(name, module_names)
 
-    def _get_top_levels(
-        self, name: str, distribution: Distribution | None, module_names: Sequence[str] | None
-    ) -> set[str]:
+    def _get_top_levels(self, name: str, module_names: Sequence[str] | None) -> set[str]:
         """
         Get the top-level module names for a dependency. They are searched for in the following order:
                 1. If `module_names` is defined, simply use those as the top-level modules.
@@ -51,19 +49,14 @@ class Dependency:
 
         Args:
             name: The name of the dependency.
-            distribution: The metadata distribution of the package.
             module_names: If this is given, use these as the top-level modules instead of
                 searching for them in the metadata.
         """
         if module_names is not None:
             return set(module_names)
 
-        if distribution is not None:
-            with suppress(FileNotFoundError):
-                return self._get_top_level_module_names_from_top_level_txt(distribution)
-
-            with suppress(FileNotFoundError):
-                return self._get_top_level_module_names_from_record_file(distribution)
+        if self.found and (top_levels := get_distributions_index().get_top_levels(name)) is not None:
+            return top_levels
 
         # No metadata or other configuration has been found. As a fallback
         # we'll guess the name.
@@ -84,68 +77,60 @@ class Dependency:
 
     @staticmethod
     def find_distribution(name: str) -> Distribution | None:
-        try:
-            return metadata.distribution(name)
-        except metadata.PackageNotFoundError:
-            return None
+        return get_distributions_index().get_distribution(name)
 
-    @staticmethod
-    def _get_top_level_module_names_from_top_level_txt(distribution: Distribution) -> set[str]:
-        """
-        top-level.txt is a metadata file added by setuptools that looks as follows:
 
-        610faff656c4cfcbb4a3__mypyc
-        _black_version
-        black
-        blackd
-        blib2to3
+@dataclass
+class DependenciesIndex:
+    """
+    Inverted index of dependencies, to find in constant time the dependencies that have a given name, or that provide a
+    given top-level module. Dependencies are kept in the order they are defined in.
+    """
 
-        This function extracts these names, if a top-level.txt file exists.
-        """
-        metadata_top_levels = distribution.read_text("top_level.txt")
-        if metadata_top_levels is None:
-            raise FileNotFoundError("top_level.txt")
+    by_name: dict[str, list[Dependency]] = field(default_factory=dict)
+    by_top_level: dict[str, list[Dependency]] = field(default_factory=dict)
 
-        return {x for x in metadata_top_levels.splitlines() if x}
+    @classmethod
+    def from_dependencies(cls, dependencies: Iterable[Dependency]) -> DependenciesIndex:
+        by_name: defaultdict[str, list[Dependency]] = defaultdict(list)
+        by_top_level: defaultdict[str, list[Dependency]] = defaultdict(list)
 
-    @staticmethod
-    def _get_top_level_module_names_from_record_file(distribution: Distribution) -> set[str]:
-        """
-        Get the top-level module names from the RECORD file, whose contents usually look as follows:
-
-            ...
-            ../../../bin/black,sha256=<HASH>,247
-            __pycache__/_black_version.cpython-311.pyc,,
-            _black_version.py,sha256=<HASH>,19
-            black/trans.cpython-39-darwin.so,sha256=<HASH>
-            black/trans.py,sha256=<HASH>
-            blackd/__init__.py,sha256=<HASH>
-            blackd/__main__.py,sha256=<HASH>
-            ...
-
-        So if no file top-level.txt is provided, we can try and extract top-levels from this file, in
-        this case _black_version, black, and blackd.
-        """
-        metadata_records = distribution.read_text("RECORD")
+        for dependency in dependencies:
+            by_name[dependency.name].append(dependency)
+            for top_level in dependency.top_levels:
+                by_top_level[top_level].append(dependency)
+
+        return cls(dict(by_name), dict(by_top_level))
+
+    def has_dependency(self, name: str) -> bool:
+        return name in self.by_name
+
+    def get_dependencies_providing(self, module_name: str) -> list[Dependency]:
+        return self.by_top_level.get(module_name, [])
+
+
+def build_dependencies(
+    names: Iterable[str], definition_file: Path, package_module_name_map: Mapping[str, Sequence[str]]
+) -> list[Dependency]:
+    """
+    Build dependencies defined in the same file. Metadata of all the distributions is read in a single batch, in
+    parallel, before building the dependencies, instead of once per dependency.
+    """
+    names = list(names)
 
-        if metadata_records is None:
-            raise FileNotFoundError("RECORD")
+    get_distributions_index().load_top_levels(name for name in names if name not in package_module_name_map)
 
-        matches = re.finditer(r"^(?!__)([a-zA-Z0-9-_]+)(?:/|\.py,)", metadata_records, re.MULTILINE)
+    return [Dependency(name, definition_file, module_names=package_module_name_map.get(name)) for name in names]
 
-        return {x.group(1) for x in matches}
 
+def parse_pep_508_dependencies(
+    specifications: Iterable[str], definition_file: Path, package_module_name_map: Mapping[str, Sequence[str]]
+) -> list[Dependency]:
+    """Build dependencies from PEP 508 specifications, ignoring specifications that are not valid."""
+    names: list[str] = []
 
-def parse_pep_508_dependency(
-    specification: str, definition_file: Path, package_module_name_map: Mapping[str, Sequence[str]]
-) -> Dependency | None:
-    try:
-        requirement = Requirement(specification)
-    except InvalidRequirement:
-        return None
+    for specification in specifications:
+        with suppress(InvalidRequirement):
+            names.append(Requirement(specification).name)
 
-    return Dependency(
-        name=requirement.name,
-        definition_file=definition_file,
-        module_names=package_module_name_map.get(requirement.name),
-    )
+    return build_dependencies(names, definition_file, package_module_name_map)
@@ -4,7 +4,7 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from deptry.dependency import parse_pep_508_dependency
+from deptry.dependency import parse_pep_508_dependencies
 from deptry.dependency_getter.base import DependenciesExtract, DependencyGetter
 from deptry.dependency_getter.requirements_files import get_dependencies_from_requirements_files
 from deptry.utils import load_pyproject_toml
@@ -195,10 +195,4 @@ class PEP621DependencyGetter(DependencyGetter):
         """
         Given a list of dependency specifications (e.g. "django>2.1; os_name != 'nt'"), convert them to Dependency objects.
         """
-        extracted_dependencies: list[Dependency] = []
-
-        for dependency in dependencies:
-            if extracted_dependency := parse_pep_508_dependency(dependency, self.config, self.package_module_name_map):
-                extracted_dependencies.append(extracted_dependency)
-
-        return extracted_dependencies
+        return parse_pep_508_dependencies(dependencies, self.config, self.package_module_name_map)
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import contextlib
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from deptry.dependency import Dependency
+from deptry.dependency import build_dependencies
 from deptry.dependency_getter.pep621.base import PEP621DependencyGetter
 from deptry.utils import load_pyproject_toml
 
+if TYPE_CHECKING:
+    from deptry.dependency import Dependency
+
 
 @dataclass
 class PoetryDependencyGetter(PEP621DependencyGetter):
@@ -71,8 +74,6 @@ class PoetryDependencyGetter(PEP621DependencyGetter):
         return [*dev_dependencies, *self._extract_poetry_dependencies(poetry_dev_dependencies)]
 
     def _extract_poetry_dependencies(self, poetry_dependencies: dict[str, Any]) -> list[Dependency]:
-        return [
-            Dependency(dep, self.config, module_names=self.package_module_name_map.get(dep))
-            for dep in poetry_dependencies
-            if dep != "python"
-        ]
+        return build_dependencies(
+            (dep for dep in poetry_dependencies if dep != "python"), self.config, self.package_module_name_map
+        )
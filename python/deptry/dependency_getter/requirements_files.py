@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 import requirements
 
-from deptry.dependency import Dependency
+from deptry.dependency import build_dependencies
 from deptry.dependency_getter.base import DependenciesExtract, DependencyGetter
 
 if TYPE_CHECKING:
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
     from requirements.requirement import Requirement
 
+    from deptry.dependency import Dependency
+
 
 @dataclass
 class RequirementsTxtDependencyGetter(DependencyGetter):
@@ -67,26 +69,21 @@ def get_dependencies_from_requirements_file(
 ) -> list[Dependency]:
     logging.debug("Scanning %s for %s", file_name, "dev dependencies" if is_dev else "dependencies")
 
-    dependencies = []
     requirements_file = Path(file_name)
 
     with requirements_file.open() as requirements_file_content:
-        for requirement in requirements.parse(requirements_file_content):
-            if (
-                dependency := _build_dependency_from_requirement(
-                    requirement, requirements_file, package_module_name_map
-                )
-            ) is not None:
-                dependencies.append(dependency)
+        dependency_names = [
+            dependency_name
+            for requirement in requirements.parse(requirements_file_content)
+            if (dependency_name := _get_dependency_name_from_requirement(requirement)) is not None
+        ]
 
-    return dependencies
+    return build_dependencies(dependency_names, requirements_file, package_module_name_map)
 
 
-def _build_dependency_from_requirement(
-    requirement: Requirement, requirements_file: Path, package_module_name_map: Mapping[str, Sequence[str]]
-) -> Dependency | None:
+def _get_dependency_name_from_requirement(requirement: Requirement) -> str | None:
     """
-    Build a dependency from an extracted requirement.
+    Get the name of the dependency from an extracted requirement.
     """
     # Explicitly set types, as "name" and "uri" default to `None` in `Requirement`, and are not typed, so `mypy` always
     # assume that they both will be `None`.
@@ -97,14 +94,7 @@ def _build_dependency_from_requirement(
     if not dependency_name and dependency_uri:
         dependency_name = _extract_name_from_url(dependency_uri)
 
-    if dependency_name is None:
-        return None
-
-    return Dependency(
-        name=dependency_name,
-        definition_file=requirements_file,
-        module_names=package_module_name_map.get(dependency_name),
-    )
+    return dependency_name
 
 
 def _extract_name_from_url(line: str) -> str | None:
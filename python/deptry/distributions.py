@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.rust import find_distributions, get_top_level_module_names
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from importlib.metadata import Distribution
+
+
+def normalize_distribution_name(name: str) -> str:
+    """Normalize a distribution name, so that it can be compared to other names regardless of case and separators."""
+    return re.sub(r"[-_.]+", "_", name).lower()
+
+
+@dataclass
+class DistributionsIndex:
+    """
+    Index of the distributions installed in the environment, keyed by normalized distribution name.
+
+    The index is built in Rust, by listing the directories of the import path in parallel, and deriving the name of
+    each distribution from the name of its `.dist-info` or `.egg-info` directory, without reading any file. Metadata
+    files are only read when the distribution is looked up, and the result is memoized. If the same distribution is
+    installed in several directories, the one found first in the import path takes precedence, as with
+    `importlib.metadata`.
+
+    `metadata_directories` holds the path to the metadata directory of distributions installed in directories, which is
+    used to read their top-level module names in Rust. Distributions installed in archives (e.g. eggs) are not part of
+    it.
+    """
+
+    distributions: dict[str, Distribution]
+    metadata_directories: dict[str, str] = field(default_factory=dict)
+    _package_names: dict[str, str | None] = field(default_factory=dict, init=False, repr=False)
+    _top_levels: dict[str, set[str] | None] = field(default_factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> DistributionsIndex:
+        paths = [path or "." for path in paths]
+        distributions: dict[str, Distribution] = {}
+        metadata_directories: dict[str, str] = {}
+
+        for path, path_distributions in zip(paths, find_distributions(paths), strict=True):
+            if not path_distributions and os.path.isfile(path):  # noqa: PTH113
+                # Import path entries can also be archives (e.g. eggs), for which we rely on `importlib.metadata`, at
+                # the cost of reading the metadata of each distribution to get its name.
+                for distribution in metadata.distributions(path=[path]):
+                    if name := distribution.metadata["Name"]:
+                        distributions.setdefault(normalize_distribution_name(name), distribution)
+                continue
+
+            for name, metadata_directory in path_distributions:
+                normalized_name = normalize_distribution_name(name)
+                if normalized_name not in distributions:
+                    distributions[normalized_name] = metadata.PathDistribution(Path(metadata_directory))
+                    metadata_directories[normalized_name] = metadata_directory
+
+        logging.debug("Found %d installed distributions.", len(distributions))
+
+        return cls(distributions, metadata_directories)
+
+    def get_distribution(self, name: str) -> Distribution | None:
+        return self.distributions.get(normalize_distribution_name(name))
+
+    def get_package_name(self, name: str) -> str | None:
+        """Get the name of a distribution, as defined in its metadata, or `None` if the distribution is not installed."""
+        normalized_name = normalize_distribution_name(name)
+
+        try:
+            return self._package_names[normalized_name]
+        except KeyError:
+            distribution = self.distributions.get(normalized_name)
+            package_name = self._package_names[normalized_name] = (
+                None if distribution is None else distribution.metadata["Name"]
+            )
+            return package_name
+
+    def get_top_levels(self, name: str) -> set[str] | None:
+        """
+        Get the top-level module names of a distribution, read from `top_level.txt` or `RECORD` in its metadata
+        directory. Returns `None` if the distribution is not installed, or if none of these files exist.
+        """
+        normalized_name = normalize_distribution_name(name)
+
+        if normalized_name not in self._top_levels:
+            self.load_top_levels([normalized_name])
+
+        return self._top_levels[normalized_name]
+
+    def load_top_levels(self, names: Iterable[str]) -> None:
+        """
+        Read the top-level module names of several distributions at once, in parallel, so that subsequent calls to
+        `get_top_levels` for these distributions do not have to read any file.
+        """
+        names_in_directories: dict[str, None] = {}
+
+        for name in map(normalize_distribution_name, names):
+            if name in self._top_levels:
+                continue
+
+            if name in self.metadata_directories:
+                names_in_directories[name] = None
+            elif (distribution := self.distributions.get(name)) is not None:
+                # Distributions installed in archives are eggs, which always have a `top_level.txt` file.
+                top_level_txt = distribution.read_text("top_level.txt")
+                self._top_levels[name] = None if top_level_txt is None else {x for x in top_level_txt.splitlines() if x}
+            else:
+                self._top_levels[name] = None
+
+        top_levels = get_top_level_module_names([self.metadata_directories[name] for name in names_in_directories])
+        for name, module_names in zip(names_in_directories, top_levels, strict=True):
+            self._top_levels[name] = None if module_names is None else set(module_names)
+
+
+@cache
+def get_distributions_index() -> DistributionsIndex:
+    """Get the index of the distributions installed in the environment, building it on the first call."""
+    return DistributionsIndex.from_paths(sys.path)
@@ -26,3 +26,28 @@ class InvalidPyprojectTOMLOptionsError(UsageError):
         super().__init__(
             f"'[tool.deptry]' section in 'pyproject.toml' contains invalid configuration options: {invalid_options}."
         )
+
+
+class GitChangedFilesError(UsageError):
+    def __init__(self, ref: str, error: str) -> None:
+        super().__init__(f"Could not list files changed since git reference '{ref}': {error}")
+
+
+class NoProjectFoundError(UsageError):
+    def __init__(self, path: Path) -> None:
+        super().__init__(f"No project found in '{path}'.")
+
+
+class WatchInBatchModeError(UsageError):
+    def __init__(self) -> None:
+        super().__init__("'--watch' cannot be used in batch mode.")
+
+
+class BaselineNotFoundError(UsageError):
+    def __init__(self, path: Path) -> None:
+        super().__init__(f"Baseline file '{path}' not found. Create it by running deptry with '--update-baseline'.")
+
+
+class UpdateBaselineWithoutBaselineError(UsageError):
+    def __init__(self) -> None:
+        super().__init__("'--update-baseline' requires a baseline file to be set with '--baseline'.")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import logging
+from importlib.metadata import version
+from typing import TYPE_CHECKING
+
+from deptry.rust import ImportCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def load_import_cache(directory: Path | None) -> ImportCache:
+    """
+    Load the cache of imports extracted from files in a previous run. Entries written by another version of deptry are
+    discarded. If `directory` is `None`, the returned cache is empty and is never persisted.
+    """
+    cache = ImportCache(directory, version("deptry"))
+    logging.debug("Loaded %d cached %s from %s.", len(cache), "files" if len(cache) > 1 else "file", directory)
+    return cache
+
+
+def save_import_cache(cache: ImportCache, directory: Path | None) -> None:
+    """Persist the cache, so that files that do not change are not parsed again in the next run."""
+    try:
+        cache.save()
+    except OSError as e:
+        logging.warning("Could not write import cache to %s: %s", directory, e)
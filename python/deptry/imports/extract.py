@@ -2,56 +2,88 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import OrderedDict, defaultdict
 from typing import TYPE_CHECKING
 
-from deptry.rust import get_imports_from_ipynb_files, get_imports_from_py_files
+from deptry.imports.table import ImportTable
+from deptry.rust import get_imports_from_directories, get_imports_from_files
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from deptry.rust import Location as RustLocation
+    from deptry.imports.location import Location
+    from deptry.rust import ImportCache, ParsedFiles
 
-from deptry.imports.location import Location
 
-
-def get_imported_modules_from_list_of_files(list_of_files: list[Path]) -> dict[str, list[Location]]:
+def get_import_table_from_list_of_files(
+    list_of_files: list[Path],
+    cache: ImportCache | None = None,
+    parsed_files: ParsedFiles | None = None,
+    experimental_import_scanner: bool = False,
+) -> ImportTable:
     logging.info("Scanning %d %s...", len(list_of_files), "files" if len(list_of_files) > 1 else "file")
 
-    py_files = [str(file) for file in list_of_files if file.suffix == ".py"]
-    ipynb_files = [str(file) for file in list_of_files if file.suffix == ".ipynb"]
-
-    modules: dict[str, list[Location]] = defaultdict(list)
-
-    # Process all .py files in parallel using Rust
-    if py_files:
-        rust_result = get_imports_from_py_files(py_files)
-        for module, locations in _convert_rust_locations_to_python_locations(rust_result).items():
-            modules[module].extend(locations)
-
-    # Process all .ipynb files in parallel using Rust
-    if ipynb_files:
-        rust_result = get_imports_from_ipynb_files(ipynb_files)
-        for module, locations in _convert_rust_locations_to_python_locations(rust_result).items():
-            modules[module].extend(locations)
+    # Process all .py and .ipynb files in parallel using Rust
+    import_table = ImportTable.from_rust_import_table(
+        get_imports_from_files([str(file) for file in list_of_files], cache, parsed_files, experimental_import_scanner)
+    )
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        _log_modules_with_locations(import_table)
+
+    return import_table
+
+
+def get_import_table_from_directories(
+    directories: tuple[Path, ...],
+    exclude: tuple[str, ...],
+    extend_exclude: tuple[str, ...],
+    using_default_exclude: bool,
+    ignore_notebooks: bool = False,
+    walk_threads: int = 0,
+    cache: ImportCache | None = None,
+    parsed_files: ParsedFiles | None = None,
+    experimental_import_scanner: bool = False,
+) -> ImportTable:
+    """
+    Find Python files in `directories` and extract their imports in a single pass in Rust, so that parsing files starts
+    while the file tree is still being walked, and paths of the files found never go through Python.
+    """
+    logging.debug("Collecting and scanning Python files...")
+
+    rust_import_table, files_count = get_imports_from_directories(
+        directories,
+        exclude,
+        extend_exclude,
+        using_default_exclude,
+        ignore_notebooks,
+        walk_threads,
+        cache,
+        parsed_files,
+        experimental_import_scanner,
+    )
+    logging.info("Scanning %d %s...", files_count, "files" if files_count > 1 else "file")
+
+    import_table = ImportTable.from_rust_import_table(rust_import_table)
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Scanned Python files:\n%s\n", "\n".join(import_table.files))
+        _log_modules_with_locations(import_table)
+
+    return import_table
+
+
+def get_imported_modules_from_list_of_files(
+    list_of_files: list[Path], cache: ImportCache | None = None
+) -> dict[str, list[Location]]:
+    import_table = get_import_table_from_list_of_files(list_of_files, cache)
 
-    sorted_modules = OrderedDict(sorted(modules.items()))
-    _log_modules_with_locations(sorted_modules)
-    return sorted_modules
+    return {module: list(import_table.get_locations(index)) for index, module in enumerate(import_table.modules)}
 
 
-def _log_modules_with_locations(modules: dict[str, list[Location]]) -> None:
+def _log_modules_with_locations(import_table: ImportTable) -> None:
     modules_dict = {
-        module_name: [str(location) for location in locations] for module_name, locations in modules.items()
+        module_name: [str(location) for location in import_table.get_locations(index)]
+        for index, module_name in enumerate(import_table.modules)
     }
     modules_json = json.dumps(modules_dict, indent=2)
     logging.debug("All imported modules and their locations:\n%s", modules_json)
-
-
-def _convert_rust_locations_to_python_locations(
-    imported_modules: dict[str, list[RustLocation]],
-) -> dict[str, list[Location]]:
-    converted_modules: dict[str, list[Location]] = {}
-    for module, locations in imported_modules.items():
-        converted_modules[module] = [Location.from_rust_location_object(loc) for loc in locations]
-    return converted_modules
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, overload
+
+from deptry.imports.location import Location
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from deptry.rust import ImportTable as RustImportTable
+
+
+@dataclass
+class ImportTable:
+    """
+    Imports extracted from Python files, stored in a columnar layout, as returned by Rust.
+
+    Each row is an import of a module at a location. Rows reference files by their index in `files`, and are grouped by
+    module, so that rows of the module at index `i` in `modules` are the ones between `module_offsets[i]` and
+    `module_offsets[i + 1]`. Lines and columns are 1-based, 0 meaning that the value is unknown. Rule codes ignored
+    with inline comments are stored as a bitmask over `rule_codes`.
+
+    `Location` objects are only built on demand, so that imports that never lead to a violation do not need to be
+    converted to Python objects.
+    """
+
+    modules: list[str]
+    files: list[str]
+    rule_codes: list[str]
+    module_offsets: Sequence[int]
+    file_ids: Sequence[int]
+    lines: Sequence[int]
+    columns: Sequence[int]
+    ignored_rule_codes: Sequence[int]
+    _paths: dict[int, Path] = field(default_factory=dict, init=False, repr=False)
+    _rule_codes_by_mask: dict[int, tuple[str, ...]] = field(default_factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_rust_import_table(cls, table: RustImportTable) -> ImportTable:
+        return cls(
+            modules=table.modules,
+            files=table.files,
+            rule_codes=table.rule_codes,
+            module_offsets=memoryview(table.module_offsets()).cast("I"),
+            file_ids=memoryview(table.file_ids()).cast("I"),
+            lines=memoryview(table.lines()).cast("I"),
+            columns=memoryview(table.columns()).cast("I"),
+            ignored_rule_codes=memoryview(table.ignored_rule_codes()).cast("Q"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.file_ids)
+
+    def get_module_rows(self, module_index: int) -> range:
+        return range(self.module_offsets[module_index], self.module_offsets[module_index + 1])
+
+    def get_locations(self, module_index: int) -> LocationsView:
+        return LocationsView(self, self.get_module_rows(module_index))
+
+    def get_location(self, row: int) -> Location:
+        return Location(
+            file=self._get_path(self.file_ids[row]),
+            line=self.lines[row] or None,
+            column=self.columns[row] or None,
+            ignored_rule_codes=self._get_rule_codes(self.ignored_rule_codes[row]),
+        )
+
+    def _get_path(self, file_id: int) -> Path:
+        """Get the path of a file, creating a single `Path` object per file, shared by all its locations."""
+        try:
+            return self._paths[file_id]
+        except KeyError:
+            path = self._paths[file_id] = Path(self.files[file_id])
+            return path
+
+    def _get_rule_codes(self, mask: int) -> tuple[str, ...]:
+        if not mask:
+            return ()
+
+        try:
+            return self._rule_codes_by_mask[mask]
+        except KeyError:
+            rule_codes = self._rule_codes_by_mask[mask] = tuple(
+                rule_code for index, rule_code in enumerate(self.rule_codes) if mask & (1 << index)
+            )
+            return rule_codes
+
+
+class LocationsView(Sequence[Location]):
+    """
+    Read-only view over the locations of some rows of an import table. `Location` objects are built each time they are
+    accessed, and are not kept in memory by the view.
+    """
+
+    __slots__ = ("_import_table", "_rows")
+
+    def __init__(self, import_table: ImportTable, rows: range) -> None:
+        self._import_table = import_table
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> Location: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LocationsView: ...
+
+    def __getitem__(self, index: int | slice) -> Location | LocationsView:
+        if isinstance(index, slice):
+            return LocationsView(self._import_table, self._rows[index])
+        return self._import_table.get_location(self._rows[index])
+
+    def __iter__(self) -> Iterator[Location]:
+        return map(self._import_table.get_location, self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
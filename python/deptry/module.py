@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from importlib.metadata import PackageNotFoundError, metadata
 from importlib.util import find_spec
 from typing import TYPE_CHECKING
 
+from deptry.dependency import DependenciesIndex
+from deptry.distributions import get_distributions_index
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from deptry.dependency import Dependency
     from deptry.imports.location import Location
 
@@ -56,8 +60,14 @@ class Module:
 
 @dataclass
 class ModuleLocations:
+    """
+    An imported module and the locations it is imported at. Locations can be a lazy sequence (e.g. a view over an import
+    table), in which case `Location` objects are only built for modules whose locations are iterated, i.e. modules
+    leading to violations.
+    """
+
     module: Module
-    locations: list[Location] = field(default_factory=list)
+    locations: Sequence[Location] = field(default_factory=list)
 
 
 class ModuleBuilder:
@@ -68,6 +78,8 @@ class ModuleBuilder:
         standard_library_modules: frozenset[str],
         dependencies: list[Dependency] | None = None,
         dev_dependencies: list[Dependency] | None = None,
+        dependencies_index: DependenciesIndex | None = None,
+        dev_dependencies_index: DependenciesIndex | None = None,
     ) -> None:
         """
         Create a Module object that represents an imported module.
@@ -78,12 +90,19 @@ class ModuleBuilder:
             standard_library_modules: The list of Python stdlib modules
             dependencies: A list of the project's dependencies
             dev_dependencies: A list of the project's development dependencies
+            dependencies_index: An index of `dependencies`, to share between builders of multiple modules. Built from
+                `dependencies` if not provided.
+            dev_dependencies_index: Same as `dependencies_index`, for `dev_dependencies`.
         """
         self.name = name
         self.local_modules = local_modules
         self.standard_library_modules = standard_library_modules
         self.dependencies = dependencies or []
         self.dev_dependencies = dev_dependencies or []
+        self.dependencies_index = dependencies_index or DependenciesIndex.from_dependencies(self.dependencies)
+        self.dev_dependencies_index = dev_dependencies_index or DependenciesIndex.from_dependencies(
+            self.dev_dependencies
+        )
 
     def build(self) -> Module:
         """
@@ -98,8 +117,8 @@ class ModuleBuilder:
             return Module(self.name, local_module=True)
 
         package = self._get_package_name_from_metadata()
-        top_levels = self._get_corresponding_top_levels_from(self.dependencies)
-        dev_top_levels = self._get_corresponding_top_levels_from(self.dev_dependencies)
+        top_levels = self._get_corresponding_top_levels_from(self.dependencies_index)
+        dev_top_levels = self._get_corresponding_top_levels_from(self.dev_dependencies_index)
 
         is_provided_by_dependency = self._has_matching_dependency(package, top_levels)
         is_provided_by_dev_dependency = self._has_matching_dev_dependency(package, dev_top_levels)
@@ -116,12 +135,10 @@ class ModuleBuilder:
         """
         Most packages simply have a field called "Name" in their metadata. This method extracts that field.
         """
-        try:
-            name: str = metadata(self.name)["Name"]
-        except PackageNotFoundError:
+        name = get_distributions_index().get_package_name(self.name)
+        if name is None:
             return self.name if self._is_package_installed() else None
-        else:
-            return name
+        return name
 
     def _is_package_installed(self) -> bool:
         try:
@@ -129,7 +146,7 @@ class ModuleBuilder:
         except (ModuleNotFoundError, ValueError):
             return False
 
-    def _get_corresponding_top_levels_from(self, dependencies: list[Dependency]) -> list[str]:
+    def _get_corresponding_top_levels_from(self, dependencies_index: DependenciesIndex) -> list[str]:
         """
         Not all modules have associated metadata. e.g. `mpl_toolkits` from `matplotlib` has no metadata. However, it is
         in the top-level module names of package matplotlib. This function extracts all dependencies which have this
@@ -137,11 +154,7 @@ class ModuleBuilder:
         This can be multiple, e.g. `google-cloud-api` and `google-cloud-bigquery` both have `google` in their top-level
         module names.
         """
-        return [
-            dependency.name
-            for dependency in dependencies
-            if dependency.top_levels and self.name in dependency.top_levels
-        ]
+        return [dependency.name for dependency in dependencies_index.get_dependencies_providing(self.name)]
 
     def _in_standard_library(self) -> bool:
         return self.name in self.standard_library_modules
@@ -157,10 +170,10 @@ class ModuleBuilder:
         Check if this module is provided by a listed dependency. This is the case if either the package name that was
         found in the metadata is listed as a dependency, or if we found a top-level module name match earlier.
         """
-        return (package and (package in [dep.name for dep in self.dependencies])) or len(top_levels) > 0
+        return (package and self.dependencies_index.has_dependency(package)) or len(top_levels) > 0
 
     def _has_matching_dev_dependency(self, package: str | None, dev_top_levels: list[str]) -> bool:
         """
         Same as _has_matching_dependency, but for development dependencies.
         """
-        return (package and (package in [dep.name for dep in self.dev_dependencies])) or len(dev_top_levels) > 0
+        return (package and self.dev_dependencies_index.has_dependency(package)) or len(dev_top_levels) > 0
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from deptry.rust import find_python_files
+from deptry.rust import find_python_files, find_python_files_and_directories
 
 
 def get_all_python_files_in(
@@ -11,8 +11,26 @@ def get_all_python_files_in(
     extend_exclude: tuple[str, ...],
     using_default_exclude: bool,
     ignore_notebooks: bool = False,
+    walk_threads: int = 0,
 ) -> list[Path]:
     return [
         Path(f)
-        for f in find_python_files(directories, exclude, extend_exclude, using_default_exclude, ignore_notebooks)
+        for f in find_python_files(
+            directories, exclude, extend_exclude, using_default_exclude, ignore_notebooks, walk_threads
+        )
     ]
+
+
+def get_all_python_files_and_directories_in(
+    directories: tuple[Path, ...],
+    exclude: tuple[str, ...],
+    extend_exclude: tuple[str, ...],
+    using_default_exclude: bool,
+    ignore_notebooks: bool = False,
+    walk_threads: int = 0,
+) -> tuple[list[Path], list[Path]]:
+    """Same as `get_all_python_files_in`, but also return the directories that were walked to find the Python files."""
+    python_files, walked_directories = find_python_files_and_directories(
+        directories, exclude, extend_exclude, using_default_exclude, ignore_notebooks, walk_threads
+    )
+    return [Path(f) for f in python_files], [Path(d) for d in walked_directories]
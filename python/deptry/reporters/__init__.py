@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from deptry.reporters.github import GithubReporter
 from deptry.reporters.json import JSONReporter
+from deptry.reporters.sarif import SarifReporter
 from deptry.reporters.text import TextReporter
+from deptry.reporters.watch import WatchReporter
 
-__all__ = ("GithubReporter", "JSONReporter", "TextReporter")
+__all__ = ("GithubReporter", "JSONReporter", "SarifReporter", "TextReporter", "WatchReporter")
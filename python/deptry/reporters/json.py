@@ -8,31 +8,78 @@ from typing import TYPE_CHECKING
 from deptry.reporters.base import Reporter
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Iterator
+    from typing import Any, TextIO
+
+    from deptry.violations import Violation
+
+JSON_OUTPUT_FORMATS = ("json", "json-compact", "jsonl")
 
 
 @dataclass
 class JSONReporter(Reporter):
+    """
+    Write violations to a JSON file, one violation at a time, so that the whole output never has to be held in memory.
+
+    Supported formats are:
+    - `json`: an array of violations, indented with 4 spaces
+    - `json-compact`: an array of violations, without any whitespace
+    - `jsonl`: one violation per line (JSON Lines), without any whitespace
+    """
+
     json_output: str
+    json_output_format: str = "json"
 
     def report(self) -> None:
-        output: list[dict[str, str | dict[str, Any]]] = []
+        with Path(self.json_output).open("w", encoding="utf-8") as f:
+            if self.json_output_format == "jsonl":
+                self._write_json_lines(f)
+            elif self.json_output_format == "json-compact":
+                self._write_compact_json(f)
+            else:
+                self._write_json(f)
 
+    def _write_json(self, f: TextIO) -> None:
+        # Output is the same as `json.dump(violations, f, ensure_ascii=False, indent=4)`. Line breaks in each encoded
+        # violation are structural, as line breaks in strings are escaped, so violations are indented by one level by
+        # indenting each of their lines.
+        separator = "\n"
+        f.write("[")
+        for violation in self._serialize_violations():
+            f.write(separator)
+            f.write("    ")
+            f.write(json.dumps(violation, ensure_ascii=False, indent=4).replace("\n", "\n    "))
+            separator = ",\n"
+        f.write("]" if separator == "\n" else "\n]")
+
+    def _write_compact_json(self, f: TextIO) -> None:
+        separator = ""
+        f.write("[")
+        for violation in self._serialize_violations():
+            f.write(separator)
+            f.write(json.dumps(violation, ensure_ascii=False, separators=(",", ":")))
+            separator = ","
+        f.write("]")
+
+    def _write_json_lines(self, f: TextIO) -> None:
+        for violation in self._serialize_violations():
+            f.write(json.dumps(violation, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+
+    def _serialize_violations(self) -> Iterator[dict[str, Any]]:
         for violation in self.violations:
-            output.append(
-                {
-                    "error": {
-                        "code": violation.error_code,
-                        "message": violation.get_error_message(),
-                    },
-                    "module": violation.issue.name,
-                    "location": {
-                        "file": self._format_path(violation.location.file),
-                        "line": violation.location.line,
-                        "column": violation.location.column,
-                    },
-                },
-            )
+            yield self._serialize_violation(violation)
 
-        with Path(self.json_output).open("w", encoding="utf-8") as f:
-            json.dump(output, f, ensure_ascii=False, indent=4)
+    def _serialize_violation(self, violation: Violation) -> dict[str, Any]:
+        return {
+            "error": {
+                "code": violation.error_code,
+                "message": violation.get_error_message(),
+            },
+            "module": violation.issue.name,
+            "location": {
+                "file": self._format_path(violation.location.file),
+                "line": violation.location.line,
+                "column": violation.location.column,
+            },
+        }
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import contextlib
+import json
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.reporters.base import Reporter
+
+if TYPE_CHECKING:
+    from typing import Any, TextIO
+
+    from deptry.violations import Violation
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+
+# Size of the buffer of the output file, so that the many small writes of large reports are grouped into few system
+# calls.
+_BUFFER_SIZE = 1 << 20
+
+
+@dataclass
+class SarifReporter(Reporter):
+    """
+    Write violations to a SARIF file, that can be uploaded to code scanning tools, like GitHub code scanning.
+
+    The metadata of each rule is written once, with a message template. Each file is listed once, in the artifacts of
+    the run, and results refer to it by index. Results are written one at a time, so that the whole output never has to
+    be held in memory.
+    """
+
+    sarif_output: str
+
+    def report(self) -> None:
+        with Path(self.sarif_output).open("w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+            self._write_sarif(f)
+
+    def _write_sarif(self, f: TextIO) -> None:
+        rules = sorted({type(violation) for violation in self.violations}, key=lambda rule: rule.error_code)
+        rule_indexes = {rule.error_code: index for index, rule in enumerate(rules)}
+        artifact_indexes: dict[str, int] = {}
+
+        f.write(f'{{"$schema":{_dumps(SARIF_SCHEMA)},"version":{_dumps(SARIF_VERSION)},"runs":[{{"tool":')
+        f.write(_dumps({"driver": self._serialize_driver(rules)}))
+        f.write(',"results":[')
+        separator = "\n"
+        for violation in self.violations:
+            f.write(separator)
+            f.write(_dumps(self._serialize_result(violation, rule_indexes, artifact_indexes)))
+            separator = ",\n"
+        f.write('],"artifacts":')
+        # Artifacts are only known once all results are written, so they are written after them.
+        f.write(_dumps([{"location": {"uri": uri}} for uri in artifact_indexes]))
+        f.write("}]}\n")
+
+    @staticmethod
+    def _serialize_driver(rules: list[type[Violation]]) -> dict[str, Any]:
+        driver: dict[str, Any] = {"name": "deptry", "informationUri": "https://deptry.com"}
+
+        with contextlib.suppress(PackageNotFoundError):
+            driver["version"] = version("deptry")
+
+        driver["rules"] = [
+            {
+                "id": rule.error_code,
+                # SARIF message strings use numbered placeholders, filled with the arguments of each result.
+                "messageStrings": {"default": {"text": rule.error_template.format(name="{0}")}},
+                "defaultConfiguration": {"level": "error"},
+                "helpUri": "https://deptry.com/rules-violations/",
+            }
+            for rule in rules
+        ]
+
+        return driver
+
+    def _serialize_result(
+        self, violation: Violation, rule_indexes: dict[str, int], artifact_indexes: dict[str, int]
+    ) -> dict[str, Any]:
+        # SARIF URIs always use forward slashes, whatever the platform.
+        uri = violation.location.file.as_posix()
+        artifact_index = artifact_indexes.setdefault(uri, len(artifact_indexes))
+
+        # The URI is repeated next to the index, as some code scanning tools, like GitHub code scanning, do not resolve
+        # artifact indexes.
+        # For dependency files (like "pyproject.toml"), we don't extract a line, but code scanning tools, like GitHub
+        # code scanning, require one, so the first line is used in that case.
+        region: dict[str, Any] = {"startLine": violation.location.line or 1}
+        if violation.location.column is not None:
+            region["startColumn"] = violation.location.column
+        physical_location = {"artifactLocation": {"uri": uri, "index": artifact_index}, "region": region}
+
+        return {
+            "ruleId": violation.error_code,
+            "ruleIndex": rule_indexes[violation.error_code],
+            # The text is repeated next to the message string arguments, as some code scanning tools, like GitHub code
+            # scanning, do not resolve message strings.
+            "message": {
+                "text": violation.get_error_message(),
+                "id": "default",
+                "arguments": [violation.issue.name],
+            },
+            "locations": [{"physicalLocation": physical_location}],
+        }
+
+
+def _dumps(obj: object) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
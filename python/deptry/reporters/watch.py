@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from deptry.reporters.text import TextReporter
+
+if TYPE_CHECKING:
+    from deptry.violations import Violation
+
+
+@dataclass
+class WatchReporter(TextReporter):
+    """Report the violations that appeared and the ones that were resolved since the previous run in watch mode."""
+
+    previous_violations: list[Violation] = field(default_factory=list)
+
+    def report(self) -> None:
+        previous_keys = {self._get_violation_key(violation) for violation in self.previous_violations}
+        current_keys = {self._get_violation_key(violation) for violation in self.violations}
+
+        new_violations = [
+            violation for violation in self.violations if self._get_violation_key(violation) not in previous_keys
+        ]
+        resolved_violations = [
+            violation
+            for violation in self.previous_violations
+            if self._get_violation_key(violation) not in current_keys
+        ]
+
+        logging.info("")
+
+        for violation in new_violations:
+            logging.info(self._stylize("{BOLD}{RED}+{RESET} {error}", error=self._format_error(violation)))
+
+        for violation in resolved_violations:
+            logging.info(self._stylize("{BOLD}{GREEN}-{RESET} {error}", error=self._format_error(violation)))
+
+        if not new_violations and not resolved_violations:
+            logging.info("No change in dependency issues.")
+        else:
+            logging.info(
+                self._stylize(
+                    "{BOLD}{new} new, {resolved} resolved.{RESET}",
+                    new=len(new_violations),
+                    resolved=len(resolved_violations),
+                )
+            )
+
+        self._log_total_number_of_violations_found(self.violations)
+
+    @staticmethod
+    def _get_violation_key(violation: Violation) -> tuple[str, str, str, int | None, int | None]:
+        return (
+            violation.error_code,
+            violation.get_error_message(),
+            str(violation.location.file),
+            violation.location.line,
+            violation.location.column,
+        )
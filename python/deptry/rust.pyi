@@ -1,20 +1,74 @@
 from pathlib import Path
 
-from .rust import Location as RustLocation
-
-def get_imports_from_py_files(file_paths: list[str]) -> dict[str, list[RustLocation]]: ...
-def get_imports_from_ipynb_files(file_paths: list[str]) -> dict[str, list[RustLocation]]: ...
+def get_imports_from_files(
+    file_paths: list[str],
+    cache: ImportCache | None = None,
+    parsed_files: ParsedFiles | None = None,
+    experimental_import_scanner: bool = False,
+) -> ImportTable: ...
+def get_imports_from_directories(
+    directories: tuple[Path, ...],
+    exclude: tuple[str, ...],
+    extend_exclude: tuple[str, ...],
+    using_default_exclude: bool,
+    ignore_notebooks: bool = False,
+    walk_threads: int = 0,
+    cache: ImportCache | None = None,
+    parsed_files: ParsedFiles | None = None,
+    experimental_import_scanner: bool = False,
+) -> tuple[ImportTable, int]: ...
 def find_python_files(
     directories: tuple[Path, ...],
     exclude: tuple[str, ...],
     extend_exclude: tuple[str, ...],
     using_default_exclude: bool,
     ignore_notebooks: bool = False,
+    walk_threads: int = 0,
 ) -> list[str]: ...
+def find_python_files_and_directories(
+    directories: tuple[Path, ...],
+    exclude: tuple[str, ...],
+    extend_exclude: tuple[str, ...],
+    using_default_exclude: bool,
+    ignore_notebooks: bool = False,
+    walk_threads: int = 0,
+) -> tuple[list[str], list[str]]: ...
+def filter_walked_files(
+    files: list[tuple[Path, Path]],
+    exclude: tuple[str, ...],
+    extend_exclude: tuple[str, ...],
+    using_default_exclude: bool,
+    ignore_notebooks: bool = False,
+) -> list[str]: ...
+def find_distributions(paths: list[str]) -> list[list[tuple[str, str]]]: ...
+def get_top_level_module_names(metadata_directories: list[str]) -> list[list[str] | None]: ...
+
+class ImportCache:
+    index_scope: str | None
+    def __init__(self, directory: Path | None, version: str) -> None: ...
+    def save(self) -> None: ...
+    def files(self) -> list[str]: ...
+    def __len__(self) -> int: ...
+
+class ParsedFiles:
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+
+class ImportTable:
+    @property
+    def modules(self) -> list[str]: ...
+    @property
+    def files(self) -> list[str]: ...
+    @property
+    def rule_codes(self) -> list[str]: ...
+    def module_offsets(self) -> bytes: ...
+    def file_ids(self) -> bytes: ...
+    def lines(self) -> bytes: ...
+    def columns(self) -> bytes: ...
+    def ignored_rule_codes(self) -> bytes: ...
+    def __len__(self) -> int: ...
 
-class Location:
-    file: str
-    line: int
-    column: int
-    ignored_rule_codes: list[str]
-    def __init__(self, file: str, line: int, column: int, ignored_rule_codes: list[str] = ...) -> None: ...
+class FileWatcher:
+    def __init__(self) -> None: ...
+    def watch(self, directories: list[Path]) -> None: ...
+    def wait(self, debounce_delay: float) -> tuple[list[str], bool]: ...
@@ -16,9 +16,28 @@ else:
     import tomli as tomllib
 
 
+_pyproject_toml_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
 def load_pyproject_toml(config: Path) -> dict[str, Any]:
+    """
+    Load a pyproject.toml file. Parsed documents are cached by path, and only parsed again if the modification time or
+    the size of the file changed, so that the several components reading the file during a run share a single parsed
+    document. The returned document is shared between callers, so it must not be modified.
+    """
+    path = config.absolute()
+
     try:
-        with config.open("rb") as pyproject_file:
-            return tomllib.load(pyproject_file)
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        if (cached := _pyproject_toml_cache.get(path)) is not None and cached[0] == stamp:
+            return cached[1]
+
+        with path.open("rb") as pyproject_file:
+            pyproject_data = tomllib.load(pyproject_file)
     except FileNotFoundError:
         raise PyprojectFileNotFoundError(Path.cwd()) from None
+
+    _pyproject_toml_cache[path] = (stamp, pyproject_data)
+    return pyproject_data
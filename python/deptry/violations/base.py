@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
-    from deptry.dependency import Dependency
+    from deptry.dependency import DependenciesIndex, Dependency
     from deptry.imports.location import Location
     from deptry.module import Module, ModuleLocations
 
@@ -24,6 +24,8 @@ class ViolationsFinder(ABC):
         ignored_modules: A tuple of module names to ignore when scanning for issues. Defaults to an
             empty tuple.
         standard_library_modules: A set of modules that are part of the standard library
+        dependencies_index: An index of the project's dependencies, shared between finders. Finders that need it
+            build it from `dependencies` if it is not provided.
     """
 
     violation: ClassVar[type[Violation]]
@@ -31,6 +33,7 @@ class ViolationsFinder(ABC):
     dependencies: list[Dependency]
     standard_library_modules: frozenset[str]
     ignored_modules: tuple[str, ...] = ()
+    dependencies_index: DependenciesIndex | None = None
 
     @abstractmethod
     def find(self) -> list[Violation]:
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from deptry.violations.base import ViolationsFinder
 from deptry.violations.dep001_missing.violation import DEP001MissingDependencyViolation
+from deptry.violations.module_state import ModuleState, get_module_state
 
 if TYPE_CHECKING:
     from deptry.module import Module
@@ -39,12 +40,7 @@ class DEP001MissingDependenciesFinder(ViolationsFinder):
         return missing_dependencies
 
     def _is_missing(self, module: Module) -> bool:
-        if any([
-            module.package is not None,
-            module.is_provided_by_dependency,
-            module.is_provided_by_dev_dependency,
-            module.local_module,
-        ]):
+        if get_module_state(module) is not ModuleState.MISSING:
             return False
 
         if module.name in self.ignored_modules:
@@ -4,12 +4,14 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from deptry.dependency import DependenciesIndex
 from deptry.imports.location import Location
 from deptry.violations.base import ViolationsFinder
 from deptry.violations.dep002_unused.violation import DEP002UnusedDependencyViolation
 
 if TYPE_CHECKING:
     from deptry.dependency import Dependency
+    from deptry.module import Module
     from deptry.violations import Violation
 
 
@@ -33,16 +35,44 @@ class DEP002UnusedDependenciesFinder(ViolationsFinder):
         logging.debug("\nScanning for unused dependencies...")
         unused_dependencies: list[Violation] = []
 
+        used_dependencies = self._get_used_dependencies()
+
         for dependency in self.dependencies:
             logging.debug("Scanning module %s...", dependency.name)
 
-            if self._is_unused(dependency):
+            if self._is_unused(dependency, used_dependencies):
                 unused_dependencies.append(self.violation(dependency, Location(dependency.definition_file)))
 
         return unused_dependencies
 
-    def _is_unused(self, dependency: Dependency) -> bool:
-        if self._dependency_found_in_imported_modules(dependency) or self._any_of_the_top_levels_imported(dependency):
+    def _get_used_dependencies(self) -> set[str]:
+        """
+        Get the names of the dependencies that are used, i.e. that either have the name of the package of an imported
+        module, or that have an imported module in their top-level module names. Each imported module is only looked up
+        once in the index of dependencies, instead of checking each dependency against all imported modules.
+        """
+        dependencies_index = self.dependencies_index or DependenciesIndex.from_dependencies(self.dependencies)
+        used_dependencies: set[str] = set()
+
+        for module_with_locations in self.imported_modules_with_locations:
+            self.add_used_dependencies(module_with_locations.module, dependencies_index, used_dependencies)
+
+        return used_dependencies
+
+    @staticmethod
+    def add_used_dependencies(
+        module: Module, dependencies_index: DependenciesIndex, used_dependencies: set[str]
+    ) -> None:
+        """Add the names of the dependencies that an imported module uses to `used_dependencies`."""
+        if module.package is not None:
+            used_dependencies.add(module.package)
+
+        used_dependencies.update(
+            dependency.name for dependency in dependencies_index.get_dependencies_providing(module.name)
+        )
+
+    def _is_unused(self, dependency: Dependency, used_dependencies: set[str]) -> bool:
+        if dependency.name in used_dependencies:
             return False
 
         if dependency.name in self.ignored_modules:
@@ -51,21 +81,3 @@ class DEP002UnusedDependenciesFinder(ViolationsFinder):
 
         logging.debug("Dependency '%s' does not seem to be used.", dependency.name)
         return True
-
-    def _dependency_found_in_imported_modules(self, dependency: Dependency) -> bool:
-        return any(
-            module_with_locations.module.package == dependency.name
-            for module_with_locations in self.imported_modules_with_locations
-        )
-
-    def _any_of_the_top_levels_imported(self, dependency: Dependency) -> bool:
-        if not dependency.top_levels:
-            return False
-
-        return any(
-            any(
-                module_with_locations.module.name == top_level
-                for module_with_locations in self.imported_modules_with_locations
-            )
-            for top_level in dependency.top_levels
-        )
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from deptry.violations.base import ViolationsFinder
 from deptry.violations.dep003_transitive.violation import DEP003TransitiveDependencyViolation
+from deptry.violations.module_state import ModuleState, get_module_state
 
 if TYPE_CHECKING:
     from deptry.module import Module
@@ -47,12 +48,7 @@ class DEP003TransitiveDependenciesFinder(ViolationsFinder):
         return transitive_dependencies
 
     def _is_transitive(self, module: Module) -> bool:
-        if any([
-            module.package is None,
-            module.is_provided_by_dependency,
-            module.is_provided_by_dev_dependency,
-            module.local_module,
-        ]):
+        if get_module_state(module) is not ModuleState.TRANSITIVE:
             return False
 
         if module.name in self.ignored_modules:
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+from deptry.imports.location import Location
+from deptry.violations.dep001_missing.finder import DEP001MissingDependenciesFinder
+from deptry.violations.dep001_missing.violation import DEP001MissingDependencyViolation
+from deptry.violations.dep002_unused.finder import DEP002UnusedDependenciesFinder
+from deptry.violations.dep002_unused.violation import DEP002UnusedDependencyViolation
+from deptry.violations.dep003_transitive.finder import DEP003TransitiveDependenciesFinder
+from deptry.violations.dep003_transitive.violation import DEP003TransitiveDependencyViolation
+from deptry.violations.dep004_misplaced_dev.finder import DEP004MisplacedDevDependenciesFinder
+from deptry.violations.dep004_misplaced_dev.violation import DEP004MisplacedDevDependencyViolation
+from deptry.violations.dep005_standard_library.finder import DEP005StandardLibraryDependenciesFinder
+from deptry.violations.dep005_standard_library.violation import DEP005StandardLibraryDependencyViolation
+from deptry.violations.module_state import ModuleState, get_module_state
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from deptry.dependency import DependenciesIndex, Dependency
+    from deptry.module import ModuleLocations
+    from deptry.violations.base import Violation, ViolationsFinder
+
+
+_MODULE_VIOLATIONS: dict[ModuleState, type[Violation]] = {
+    ModuleState.MISSING: DEP001MissingDependencyViolation,
+    ModuleState.TRANSITIVE: DEP003TransitiveDependencyViolation,
+    ModuleState.MISPLACED_DEV: DEP004MisplacedDevDependencyViolation,
+}
+
+
+@dataclass
+class ViolationsEngine:
+    """
+    Find the violations of all built-in rules in a single pass over the imported modules, followed by a single pass over
+    the dependencies, instead of one pass per rule. Each module is classified once into a `ModuleState`, as a module can
+    lead to at most one of `DEP001`, `DEP003` and `DEP004`.
+
+    The rules are not defined again here: modules are classified with `get_module_state`, and used dependencies are
+    found with `DEP002UnusedDependenciesFinder.add_used_dependencies`, which the finders in `FINDERS` also rely on, so
+    violations are the same as the ones found by the finders, in the same order for each rule.
+
+    Attributes:
+        imported_modules_with_locations: A list of ModuleLocations objects representing the
+            modules imported by the project and their locations.
+        dependencies: A list of Dependency objects representing the project's dependencies.
+        standard_library_modules: A set of modules that are part of the standard library.
+        dependencies_index: An index of the project's dependencies.
+        rules: The error codes of the rules to check.
+        ignored_modules: The names of the modules (or dependencies) to ignore, by error code.
+    """
+
+    FINDERS: ClassVar[tuple[type[ViolationsFinder], ...]] = (
+        DEP001MissingDependenciesFinder,
+        DEP002UnusedDependenciesFinder,
+        DEP003TransitiveDependenciesFinder,
+        DEP004MisplacedDevDependenciesFinder,
+        DEP005StandardLibraryDependenciesFinder,
+    )
+
+    imported_modules_with_locations: list[ModuleLocations]
+    dependencies: list[Dependency]
+    standard_library_modules: frozenset[str]
+    dependencies_index: DependenciesIndex
+    rules: frozenset[str]
+    ignored_modules: Mapping[str, frozenset[str]]
+
+    def find(self) -> list[Violation]:
+        logging.debug("\nScanning for dependency issues...")
+        violations: list[Violation] = []
+        check_unused = DEP002UnusedDependencyViolation.error_code in self.rules
+        used_dependencies: set[str] = set()
+
+        for module_with_locations in self.imported_modules_with_locations:
+            module = module_with_locations.module
+
+            if check_unused:
+                DEP002UnusedDependenciesFinder.add_used_dependencies(module, self.dependencies_index, used_dependencies)
+
+            if module.standard_library:
+                continue
+
+            violation = _MODULE_VIOLATIONS.get(get_module_state(module))
+            if violation is not None and self._is_reported(violation, module.name):
+                violations.extend(violation(module, location) for location in module_with_locations.locations)
+
+        for dependency in self.dependencies:
+            if (
+                check_unused
+                and dependency.name not in used_dependencies
+                and self._is_reported(DEP002UnusedDependencyViolation, dependency.name)
+            ):
+                violations.append(DEP002UnusedDependencyViolation(dependency, Location(dependency.definition_file)))
+
+            if dependency.name in self.standard_library_modules and self._is_reported(
+                DEP005StandardLibraryDependencyViolation, dependency.name
+            ):
+                violations.append(
+                    DEP005StandardLibraryDependencyViolation(dependency, Location(dependency.definition_file))
+                )
+
+        return violations
+
+    def _is_reported(self, violation: type[Violation], name: str) -> bool:
+        if violation.error_code not in self.rules:
+            return False
+
+        if name in self.ignored_modules.get(violation.error_code, ()):
+            logging.debug("Found %s issue for '%s', but ignoring.", violation.error_code, name)
+            return False
+
+        logging.debug("Marked '%s' as a %s issue.", name, violation.error_code)
+        return True
@@ -2,31 +2,23 @@ from __future__ import annotations
 
 import logging
 import operator
+import os
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
-from deptry.violations import (
-    DEP001MissingDependenciesFinder,
-    DEP002UnusedDependenciesFinder,
-    DEP003TransitiveDependenciesFinder,
-    DEP004MisplacedDevDependenciesFinder,
-    DEP005StandardLibraryDependenciesFinder,
-)
+from deptry.dependency import DependenciesIndex
+from deptry.violations.engine import ViolationsEngine
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
+    from pathlib import Path
 
     from deptry.dependency import Dependency
     from deptry.module import ModuleLocations
     from deptry.violations import Violation, ViolationsFinder
 
 
-_VIOLATIONS_FINDERS: tuple[type[ViolationsFinder], ...] = (
-    DEP001MissingDependenciesFinder,
-    DEP002UnusedDependenciesFinder,
-    DEP003TransitiveDependenciesFinder,
-    DEP004MisplacedDevDependenciesFinder,
-    DEP005StandardLibraryDependenciesFinder,
-)
+_POSITION_SORT_KEY = operator.attrgetter("location.line", "location.column", "error_code")
 
 
 def find_violations(
@@ -35,10 +27,32 @@ def find_violations(
     ignore: tuple[str, ...],
     per_rule_ignores: Mapping[str, tuple[str, ...]],
     standard_library_modules: frozenset[str],
+    dependencies_index: DependenciesIndex | None = None,
+    extra_finders: tuple[type[ViolationsFinder], ...] = (),
 ) -> list[Violation]:
-    violations = []
+    """
+    Find the violations of all rules that are not ignored. Built-in rules are checked together by `ViolationsEngine`,
+    and each finder of `extra_finders` (e.g. a custom rule) is run on its own, with the same ignores.
+    """
+    if dependencies_index is None:
+        dependencies_index = DependenciesIndex.from_dependencies(dependencies)
 
-    for violation_finder in _VIOLATIONS_FINDERS:
+    rules = frozenset(
+        violation_finder.violation.error_code
+        for violation_finder in ViolationsEngine.FINDERS
+        if violation_finder.violation.error_code not in ignore
+    )
+
+    violations = ViolationsEngine(
+        imported_modules_with_locations=imported_modules_with_locations,
+        dependencies=dependencies,
+        standard_library_modules=standard_library_modules,
+        dependencies_index=dependencies_index,
+        rules=rules,
+        ignored_modules={code: frozenset(modules) for code, modules in per_rule_ignores.items()},
+    ).find()
+
+    for violation_finder in extra_finders:
         if violation_finder.violation.error_code not in ignore:
             violations.extend(
                 violation_finder(
@@ -46,8 +60,10 @@ def find_violations(
                     dependencies=dependencies,
                     ignored_modules=per_rule_ignores.get(violation_finder.violation.error_code, ()),
                     standard_library_modules=standard_library_modules,
+                    dependencies_index=dependencies_index,
                 ).find()
             )
+
     return _get_sorted_violations(_filter_inline_ignored_violations(violations))
 
 
@@ -70,6 +86,24 @@ def _filter_inline_ignored_violations(violations: Sequence[Violation]) -> list[V
 
 
 def _get_sorted_violations(violations: list[Violation]) -> list[Violation]:
-    return sorted(
-        violations, key=operator.attrgetter("location.file", "location.line", "location.column", "error_code")
-    )
+    """
+    Sort violations by file, line, column and error code. Violations are first grouped by file, so that only distinct
+    files are sorted, using keys built once per file, and violations of each file are then sorted by position and error
+    code, which are cheap to compare.
+    """
+    violations_by_file: defaultdict[Path, list[Violation]] = defaultdict(list)
+    for violation in violations:
+        violations_by_file[violation.location.file].append(violation)
+
+    sorted_violations = []
+    for file in sorted(violations_by_file, key=_get_file_sort_key):
+        sorted_violations.extend(sorted(violations_by_file[file], key=_POSITION_SORT_KEY))
+    return sorted_violations
+
+
+def _get_file_sort_key(file: Path) -> str:
+    """
+    Get a string that sorts like `file` does as a `Path`, i.e. by comparing the normalized case of its components one
+    by one. Separators are replaced by the null character, which sorts before any character that can be in a component.
+    """
+    return os.path.normcase(str(file)).replace(os.sep, "\0")
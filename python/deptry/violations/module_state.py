@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+from enum import Enum, auto
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from deptry.module import Module
+
+
+class ModuleState(Enum):
+    """
+    State of an imported module, which determines the violation it leads to, if any. A module can lead to at most one
+    of `DEP001`, `DEP003` and `DEP004`.
+    """
+
+    OK = auto()
+    MISSING = auto()
+    TRANSITIVE = auto()
+    MISPLACED_DEV = auto()
+
+
+def get_module_state(module: Module) -> ModuleState:
+    """
+    Classify an imported module that is not part of the standard library. This is the single definition of the rules
+    on imported modules, shared by `ViolationsEngine` and the finders of `DEP001`, `DEP003` and `DEP004`.
+    """
+    if module.is_provided_by_dependency:
+        return ModuleState.OK
+
+    # Unlike missing and transitive dependencies, misplaced development dependencies can be local modules.
+    if module.is_provided_by_dev_dependency:
+        return ModuleState.MISPLACED_DEV if get_dev_package_name(module) else ModuleState.OK
+
+    if module.local_module:
+        return ModuleState.OK
+
+    return ModuleState.MISSING if module.package is None else ModuleState.TRANSITIVE
+
+
+def get_dev_package_name(module: Module) -> str | None:
+    """
+    Get the name of the development dependency providing a module. `module.package` is not enough, since it can happen
+    that a development dependency is not installed, but it's still found to be used in the codebase, due to simple name
+    matching. In that case, it's added under `module.dev_top_levels`.
+    """
+    if module.package:
+        return module.package
+    if module.dev_top_levels:
+        if len(module.dev_top_levels) > 1:
+            logging.debug(
+                "Module %s is found in the top-level module names of multiple development dependencies. Skipping.",
+                module.name,
+            )
+        elif len(module.dev_top_levels) == 0:
+            logging.debug(
+                "Module %s has no metadata and it is not found in any top-level module names. Skipping.",
+                module.name,
+            )
+        else:
+            return module.dev_top_levels[0]
+    return None
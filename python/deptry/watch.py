@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.rust import FileWatcher
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+DEBOUNCE_DELAY = 0.2
+
+
+def watch_files(
+    find_files: Callable[[], tuple[list[Path], list[Path]]],
+    filter_files: Callable[[list[Path]], list[Path]],
+    other_files: Iterable[Path] = (),
+    debounce_delay: float = DEBOUNCE_DELAY,
+) -> Iterator[tuple[list[Path], list[Path]]]:
+    """
+    Watch files returned by `find_files` and `other_files` for changes, using file system notifications. Each time files
+    are created, modified or deleted, yield the list of changed files, alongside the files currently returned by
+    `find_files`. Changes are debounced, so that they are only yielded once files did not change for `debounce_delay`
+    seconds, to avoid yielding each file separately when many files are modified at once (e.g. when switching branches).
+
+    `find_files` walks the file tree, and returns the files to watch alongside the directories it walked, which are the
+    directories that are watched. `filter_files` keeps the changed files that `find_files` would return, so that files
+    created in a watched directory are found without walking the file tree again. The file tree is only walked again
+    when directories are created, deleted or renamed, or when changes may have been missed.
+    """
+    other_files_by_path = {file.absolute(): file for file in other_files}
+    other_directories = {file.parent for file in other_files_by_path}
+    watcher = FileWatcher()
+
+    def walk() -> tuple[dict[Path, Path], set[Path]]:
+        files, directories = find_files()
+        watched_directories = {directory.absolute() for directory in directories} | other_directories
+        watcher.watch(list(watched_directories))
+        return {file.absolute(): file for file in files}, watched_directories
+
+    files_by_path, watched_directories = walk()
+
+    while True:
+        paths, need_rescan = watcher.wait(debounce_delay)
+        changed_paths = [Path(path) for path in paths]
+
+        if need_rescan or any(path in watched_directories or path.is_dir() for path in changed_paths):
+            previous_files_by_path = files_by_path
+            files_by_path, watched_directories = walk()
+            # Files that were found by only one of the walks were created or deleted, even if no event was received.
+            changed_paths.extend(previous_files_by_path.keys() ^ files_by_path.keys())
+            changed_files_by_path = {**previous_files_by_path, **files_by_path}
+        else:
+            deleted_paths = [path for path in changed_paths if path in files_by_path and not path.exists()]
+            changed_files_by_path = {path: files_by_path.pop(path) for path in deleted_paths}
+            for file in filter_files(changed_paths):
+                changed_files_by_path[file.absolute()] = files_by_path.setdefault(file.absolute(), file)
+
+        changed_files = sorted({
+            changed_file
+            for path in changed_paths
+            if (changed_file := changed_files_by_path.get(path, other_files_by_path.get(path))) is not None
+        })
+        if changed_files:
+            yield changed_files, list(files_by_path.values())
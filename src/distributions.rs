@@ -0,0 +1,116 @@
+use pyo3::prelude::*;
+use rayon::prelude::*;
+use std::collections::HashSet;
+use std::fs;
+use std::path::Path;
+
+const METADATA_DIRECTORY_SUFFIXES: [&str; 2] = [".dist-info", ".egg-info"];
+
+/// Finds the metadata directories of the distributions installed in each of the given directories, in parallel.
+/// Returns, for each directory, a list of distribution names (as found in the names of the metadata directories) and
+/// paths to their metadata directory, sorted by path. Paths that are not directories have no distributions.
+#[pyfunction]
+pub fn find_distributions(paths: Vec<String>) -> Vec<Vec<(String, String)>> {
+    paths
+        .par_iter()
+        .map(|path| find_distributions_in(Path::new(path)))
+        .collect()
+}
+
+/// Gets the top-level module names of distributions from their metadata directories, in parallel. Names are read from
+/// `top_level.txt` if it exists, or from `RECORD` otherwise. If none of these files exist, returns `None` for the
+/// distribution.
+#[pyfunction]
+pub fn get_top_level_module_names(metadata_directories: Vec<String>) -> Vec<Option<Vec<String>>> {
+    metadata_directories
+        .par_iter()
+        .map(|directory| read_top_level_module_names(Path::new(directory)))
+        .collect()
+}
+
+fn find_distributions_in(path: &Path) -> Vec<(String, String)> {
+    let Ok(entries) = fs::read_dir(path) else {
+        return Vec::new();
+    };
+
+    let mut distributions: Vec<(String, String)> = entries
+        .flatten()
+        .filter_map(|entry| {
+            let file_name = entry.file_name();
+            let file_name = file_name.to_str()?;
+            let stem = METADATA_DIRECTORY_SUFFIXES
+                .iter()
+                .find_map(|suffix| file_name.strip_suffix(suffix))?;
+
+            // Directories are named `<name>-<version>.dist-info` or `<name>-<version>[-<python>].egg-info`, and `-`
+            // is not allowed in the name part, as it is replaced by `_` when building distributions.
+            let name = stem.split('-').next().unwrap_or(stem);
+
+            Some((name.to_owned(), entry.path().to_string_lossy().into_owned()))
+        })
+        .collect();
+
+    distributions.sort_unstable_by(|(_, a), (_, b)| a.cmp(b));
+    distributions
+}
+
+/// `top_level.txt` is a metadata file added by setuptools that looks as follows:
+///
+/// ```text
+/// 610faff656c4cfcbb4a3__mypyc
+/// _black_version
+/// black
+/// blackd
+/// blib2to3
+/// ```
+fn read_top_level_module_names(directory: &Path) -> Option<Vec<String>> {
+    if let Ok(content) = fs::read_to_string(directory.join("top_level.txt")) {
+        return Some(
+            content
+                .lines()
+                .filter(|line| !line.is_empty())
+                .map(str::to_owned)
+                .collect(),
+        );
+    }
+
+    fs::read_to_string(directory.join("RECORD"))
+        .ok()
+        .map(|content| get_top_level_module_names_from_record(&content))
+}
+
+/// Gets the top-level module names from the content of a RECORD file, whose content usually looks as follows:
+///
+/// ```text
+/// ../../../bin/black,sha256=<HASH>,247
+/// __pycache__/_black_version.cpython-311.pyc,,
+/// _black_version.py,sha256=<HASH>,19
+/// black/trans.cpython-39-darwin.so,sha256=<HASH>
+/// black/trans.py,sha256=<HASH>
+/// blackd/__init__.py,sha256=<HASH>
+/// blackd/__main__.py,sha256=<HASH>
+/// ```
+///
+/// In this case, top-level module names are `_black_version`, `black`, and `blackd`: the names of the directories at
+/// the root of the distribution, and of the Python files at the root, ignoring names starting with `__`. This matches
+/// lines against `^(?!__)([a-zA-Z0-9-_]+)(?:/|\.py,)`, without a regular expression, since the look-ahead is not
+/// supported by the `regex` crate, and since a single pass over each line is enough.
+fn get_top_level_module_names_from_record(content: &str) -> Vec<String> {
+    let mut seen = HashSet::new();
+
+    content
+        .lines()
+        .filter(|line| !line.starts_with("__"))
+        .filter_map(|line| {
+            let name_length = line
+                .find(|c: char| !(c.is_ascii_alphanumeric() || c == '-' || c == '_'))
+                .unwrap_or(line.len());
+            let (name, rest) = line.split_at(name_length);
+
+            (!name.is_empty() && (rest.starts_with('/') || rest.starts_with(".py,")))
+                .then_some(name)
+        })
+        .filter(|name| seen.insert(*name))
+        .map(str::to_owned)
+        .collect()
+}
@@ -0,0 +1,133 @@
+use path_slash::PathExt;
+use regex::RegexSet;
+use std::collections::HashMap;
+use std::path::Path;
+
+/// Characters that have a special meaning in regular expressions, outside of character classes.
+const META_CHARACTERS: &str = r"\.+*?()|[]{}^$";
+
+/// Characters that can be escaped in a regular expression to be matched literally, on top of the meta characters.
+const ESCAPABLE_CHARACTERS: &str = "-#&~";
+
+/// Patterns of paths excluded from the search of Python files. As with a single regular expression, a path is excluded
+/// if one of the patterns matches the start of the path, relative to the current directory and using `/` as separator.
+///
+/// Patterns that only match literal text (e.g. `venv` or `\.git`), optionally followed by `$`, which are by far the most
+/// common ones, are stored in a trie of path components, so that they are matched in a single pass over the path, and
+/// without any allocation. Other patterns are compiled together in a `RegexSet`.
+pub struct ExcludedPaths {
+    literals: Node,
+    regex_set: Option<RegexSet>,
+}
+
+/// A node of the trie of literal patterns, reached by following the components of a path from the root node.
+#[derive(Default)]
+struct Node {
+    children: HashMap<String, Node>,
+    /// Prefixes of the next component that exclude a path, e.g. `ven` for the `src/ven` pattern in the `src` node.
+    component_prefixes: Vec<String>,
+    /// Whether the path that leads to this node is excluded, for patterns that end with `$`.
+    is_excluded: bool,
+}
+
+impl ExcludedPaths {
+    pub fn new(patterns: &[String]) -> Self {
+        let mut literals = Node::default();
+        let mut regex_patterns = Vec::new();
+
+        for pattern in patterns {
+            match parse_literal(pattern) {
+                Some((literal, is_exact)) => literals.insert(&literal, is_exact),
+                None => regex_patterns.push(format!("^(?:{pattern})")),
+            }
+        }
+
+        let regex_set =
+            (!regex_patterns.is_empty()).then(|| RegexSet::new(regex_patterns).unwrap());
+
+        Self {
+            literals,
+            regex_set,
+        }
+    }
+
+    pub fn is_excluded(&self, path: &Path) -> bool {
+        let path_str = path.to_slash_lossy();
+        let path_str = path_str.strip_prefix("./").unwrap_or(&path_str);
+
+        self.literals.matches(path_str)
+            || self
+                .regex_set
+                .as_ref()
+                .is_some_and(|regex_set| regex_set.is_match(path_str))
+    }
+}
+
+impl Node {
+    fn insert(&mut self, literal: &str, is_exact: bool) {
+        let mut node = self;
+        let mut components = literal.split('/').peekable();
+
+        while let Some(component) = components.next() {
+            if components.peek().is_none() && !is_exact {
+                // The last component of a pattern matches the start of a component, e.g. `venv` excludes `venv2`.
+                node.component_prefixes.push(component.to_owned());
+                return;
+            }
+            node = node.children.entry(component.to_owned()).or_default();
+        }
+
+        node.is_excluded = true;
+    }
+
+    fn matches(&self, path_str: &str) -> bool {
+        let mut node = self;
+
+        for component in path_str.split('/') {
+            if node
+                .component_prefixes
+                .iter()
+                .any(|prefix| component.starts_with(prefix.as_str()))
+            {
+                return true;
+            }
+
+            match node.children.get(component) {
+                Some(child) => node = child,
+                None => return false,
+            }
+        }
+
+        node.is_excluded
+    }
+}
+
+/// Returns the text matched by `pattern` if the pattern only matches literal text, and whether the pattern ends with `$`,
+/// i.e. only matches the exact text. Returns `None` for patterns that need a regular expression engine to be matched.
+fn parse_literal(pattern: &str) -> Option<(String, bool)> {
+    let (pattern, is_exact) = match pattern.strip_suffix('$') {
+        Some(stripped) if !stripped.ends_with('\\') => (stripped, true),
+        _ => (pattern, false),
+    };
+
+    let mut literal = String::with_capacity(pattern.len());
+    let mut chars = pattern.chars();
+
+    while let Some(c) = chars.next() {
+        match c {
+            '\\' => match chars.next() {
+                Some(escaped)
+                    if META_CHARACTERS.contains(escaped)
+                        || ESCAPABLE_CHARACTERS.contains(escaped) =>
+                {
+                    literal.push(escaped);
+                }
+                _ => return None,
+            },
+            c if META_CHARACTERS.contains(c) => return None,
+            c => literal.push(c),
+        }
+    }
+
+    Some((literal, is_exact))
+}
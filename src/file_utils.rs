@@ -4,44 +4,48 @@ use pyo3::exceptions::{PyFileNotFoundError, PyIOError};
 use pyo3::prelude::*;
 use regex::Regex;
 use std::fs;
-use std::fs::File;
-use std::io::{BufReader, ErrorKind, Read};
-use std::path::Path;
+use std::io::ErrorKind;
+use std::sync::LazyLock;
 
-/// Reads a Python file's content as a `String`. It first attempts to read the file as UTF-8.
-/// If reading fails due to an encoding issue, it tries to determine the file's encoding
-/// from a Python encoding declaration or by guessing and then reads the file using the detected encoding
+/// Reads a Python file's content as a `String`. The file is read once, and its content is validated as UTF-8 in place,
+/// without being copied. If it is not valid UTF-8, the encoding of the file is determined from a Python encoding
+/// declaration, or by guessing, and the same content is decoded using the detected encoding.
 pub fn read_file(file_path: &str) -> PyResult<String> {
-    let path = Path::new(file_path);
+    let buffer = fs::read(file_path).map_err(|e| match e.kind() {
+        ErrorKind::NotFound => {
+            PyFileNotFoundError::new_err(format!("File not found: '{file_path}'"))
+        }
+        _ => PyIOError::new_err(format!("An error occurred: '{e}'")),
+    })?;
 
-    match fs::read_to_string(path) {
+    match String::from_utf8(buffer) {
         Ok(content) => Ok(content),
-        Err(e) => match e.kind() {
-            ErrorKind::NotFound => Err(PyFileNotFoundError::new_err(format!(
-                "File not found: '{file_path}'",
-            ))),
-            ErrorKind::InvalidData => {
-                let file = File::open(path).unwrap();
-                let mut buffer = Vec::new();
-                BufReader::new(file).read_to_end(&mut buffer)?;
-
-                let encoding = detect_python_file_encoding_from_regex(&buffer)
-                    .unwrap_or_else(|| guess_encoding(&buffer));
-                read_with_encoding(&buffer, encoding)
-            }
-            _ => Err(PyIOError::new_err(format!("An error occurred: '{e}'"))),
-        },
+        Err(e) => {
+            let buffer = e.into_bytes();
+            let encoding = detect_python_file_encoding_from_regex(&buffer)
+                .unwrap_or_else(|| guess_encoding(&buffer));
+            read_with_encoding(&buffer, encoding)
+        }
     }
 }
 
 /// Detects the encoding declared in the first or second line of a Python file according to PEP 263.
 /// Returns the detected encoding if found; otherwise, returns None.
 fn detect_python_file_encoding_from_regex(buffer: &[u8]) -> Option<&'static Encoding> {
-    let content = String::from_utf8_lossy(buffer);
-    let re = Regex::new(r"^[ \t\f]*#.*?coding[:=][ \t]*([-_.a-zA-Z0-9]+)").unwrap();
+    static ENCODING_DECLARATION: LazyLock<Regex> =
+        LazyLock::new(|| Regex::new(r"^[ \t\f]*#.*?coding[:=][ \t]*([-_.a-zA-Z0-9]+)").unwrap());
+
+    // Only the first two lines can declare the encoding, so the rest of the file is not converted.
+    let end = buffer
+        .iter()
+        .enumerate()
+        .filter(|(_, byte)| **byte == b'\n')
+        .nth(1)
+        .map_or(buffer.len(), |(index, _)| index);
+    let content = String::from_utf8_lossy(&buffer[..end]);
 
     for line in content.lines().take(2) {
-        if let Some(caps) = re.captures(line)
+        if let Some(caps) = ENCODING_DECLARATION.captures(line)
             && let Some(m) = caps.get(1)
         {
             return Encoding::for_label(m.as_str().as_bytes());
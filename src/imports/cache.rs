@@ -0,0 +1,338 @@
+use crate::file_utils;
+use crate::interner::ModuleId;
+use crate::location;
+
+use super::ExtractionMode;
+use super::shared::FileToImportsMap;
+use file_utils::read_file;
+use location::{Location, RuleCodes};
+use pyo3::exceptions::PyIOError;
+use pyo3::prelude::*;
+use serde_json::{Map, Value, json};
+use std::collections::{HashMap, HashSet};
+use std::fs::{self, File};
+use std::io::{BufReader, BufWriter, Write};
+use std::path::{Path, PathBuf};
+use std::sync::Arc;
+use std::time::UNIX_EPOCH;
+
+/// Identifies the parser used to extract imports, and the layout of the cached entries, so that entries written by a
+/// previous implementation are not reused. The version of ruff is taken from `Cargo.toml` by `build.rs`, and the suffix
+/// must be incremented whenever the way imports are extracted, hashed or stored changes.
+const CACHE_KEY: &str = concat!("ruff-", env!("RUFF_VERSION"), "-4");
+const CACHE_FILE_NAME: &str = "imports.json";
+
+/// Persistent cache of the imports extracted from each file, keyed by file path.
+///
+/// A cached entry is reused as long as the modification time and the size of the file are unchanged. If only the
+/// modification time changed, the hash of the file content is compared to the cached one, so that a file that was
+/// touched but not modified does not need to be parsed again.
+///
+/// Each entry records whether it was extracted with the import scanner, as the scanner does not detect syntax errors.
+/// Entries of parsed files are reused with both extraction modes, but entries extracted with the scanner are only
+/// reused when the scanner is enabled, so that disabling it reports the syntax errors it missed.
+///
+/// The whole cache is discarded if it was written by another version of deptry, or with another parser.
+///
+/// The files of the cache are used as an index of the files of the project by incremental runs. As the cache can also
+/// hold the files of a partial run, `index_scope` identifies the settings of the last walk of the whole file tree that
+/// the files of the cache come from, if any. It is stored alongside the entries, and set by deptry after such a walk.
+#[pyclass]
+pub struct ImportCache {
+    directory: Option<PathBuf>,
+    version: String,
+    #[pyo3(get, set)]
+    index_scope: Option<String>,
+    entries: HashMap<String, CacheEntry>,
+    accessed: HashSet<String>,
+}
+
+#[derive(Clone, Debug)]
+pub struct CacheEntry {
+    modified: u64,
+    size: u64,
+    hash: u64,
+    scanned: bool,
+    imports: FileToImportsMap,
+}
+
+#[pymethods]
+impl ImportCache {
+    #[new]
+    #[pyo3(signature = (directory, version))]
+    fn new(directory: Option<PathBuf>, version: String) -> Self {
+        let (index_scope, entries) = directory
+            .as_deref()
+            .map(|directory| load_entries(directory, &version))
+            .unwrap_or_default();
+
+        Self {
+            directory,
+            version,
+            index_scope,
+            entries,
+            accessed: HashSet::new(),
+        }
+    }
+
+    /// Writes the entries of all the files that were looked up since the cache was loaded to the cache directory.
+    /// Entries of files that were not looked up (e.g. because they were deleted) are dropped.
+    fn save(&self) -> PyResult<()> {
+        let Some(directory) = &self.directory else {
+            return Ok(());
+        };
+
+        fs::create_dir_all(directory)?;
+
+        let gitignore = directory.join(".gitignore");
+        if !gitignore.exists() {
+            fs::write(gitignore, "# Automatically created by deptry.\n*\n")?;
+        }
+
+        let files: Map<String, Value> = self
+            .entries
+            .iter()
+            .filter(|(file, _)| self.accessed.contains(*file))
+            .map(|(file, entry)| (file.clone(), entry.to_json()))
+            .collect();
+        let content = json!({
+            "version": self.version,
+            "key": CACHE_KEY,
+            "index_scope": self.index_scope,
+            "files": files,
+        });
+
+        // Write to a temporary file first, so that concurrent runs never read a partially written cache.
+        let temporary_path =
+            directory.join(format!("{CACHE_FILE_NAME}.{}.tmp", std::process::id()));
+        let mut writer = BufWriter::new(File::create(&temporary_path)?);
+        serde_json::to_writer(&mut writer, &content)
+            .map_err(|e| PyIOError::new_err(e.to_string()))?;
+        writer.flush()?;
+        drop(writer);
+
+        fs::rename(temporary_path, directory.join(CACHE_FILE_NAME))?;
+        Ok(())
+    }
+
+    /// Returns the paths of all the files that have cached imports, sorted.
+    fn files(&self) -> Vec<String> {
+        let mut files: Vec<String> = self.entries.keys().cloned().collect();
+        files.sort_unstable();
+        files
+    }
+
+    fn __len__(&self) -> usize {
+        self.entries.len()
+    }
+}
+
+impl ImportCache {
+    /// Returns the imports of a file, either from the cache if the file did not change since it was cached, or by
+    /// extracting them from the file content with `mode`. Alongside the result, returns the entry that should be stored
+    /// in the cache for this file, if it needs to be updated.
+    pub fn get_or_extract(
+        &self,
+        path: &str,
+        mode: ExtractionMode,
+    ) -> (PyResult<FileToImportsMap>, Option<CacheEntry>) {
+        let Some((modified, size)) = get_file_stamp(path) else {
+            // Let the extraction report a meaningful error (e.g. if the file does not exist).
+            return (
+                read_file(path).and_then(|content| mode.extract(path, &content)),
+                None,
+            );
+        };
+
+        let cached_entry = self
+            .entries
+            .get(path)
+            .filter(|entry| !entry.scanned || mode == ExtractionMode::Scan);
+
+        if let Some(entry) = cached_entry
+            && entry.modified == modified
+            && entry.size == size
+        {
+            return (Ok(entry.imports.clone()), None);
+        }
+
+        let content = match read_file(path) {
+            Ok(content) => content,
+            Err(e) => return (Err(e), None),
+        };
+        let hash = hash_content(&content);
+
+        if let Some(entry) = cached_entry
+            && entry.size == size
+            && entry.hash == hash
+        {
+            return (
+                Ok(entry.imports.clone()),
+                Some(CacheEntry {
+                    modified,
+                    ..entry.clone()
+                }),
+            );
+        }
+
+        match mode.extract(path, &content) {
+            Ok(imports) => (
+                Ok(imports.clone()),
+                Some(CacheEntry {
+                    modified,
+                    size,
+                    hash,
+                    // Files that the scanner does not handle are parsed, but they are still recorded as scanned, which
+                    // only means that they are parsed again if the scanner is disabled.
+                    scanned: mode == ExtractionMode::Scan,
+                    imports,
+                }),
+            ),
+            Err(e) => (Err(e), None),
+        }
+    }
+
+    /// Marks the files as accessed, so that they are kept when saving the cache, and stores the updated entries.
+    pub fn update(
+        &mut self,
+        file_paths: &[String],
+        entries: impl IntoIterator<Item = (String, CacheEntry)>,
+    ) {
+        self.accessed.extend(file_paths.iter().cloned());
+        self.entries.extend(entries);
+    }
+}
+
+impl CacheEntry {
+    fn to_json(&self) -> Value {
+        let imports: Map<String, Value> = self
+            .imports
+            .iter()
+            .map(|(module, locations)| {
+                let locations = locations
+                    .iter()
+                    .map(|location| {
+                        let ignored_rule_codes: Vec<&str> =
+                            location.ignored_rule_codes.iter().collect();
+                        json!([location.line, location.column, ignored_rule_codes])
+                    })
+                    .collect();
+                (module.name().to_string(), Value::Array(locations))
+            })
+            .collect();
+
+        json!({
+            "modified": self.modified,
+            "size": self.size,
+            "hash": self.hash,
+            "scanned": self.scanned,
+            "imports": imports,
+        })
+    }
+
+    fn from_json(file: &str, value: &Value) -> Option<Self> {
+        let file: Arc<str> = Arc::from(file);
+        let imports = value["imports"]
+            .as_object()?
+            .iter()
+            .map(|(module, locations)| {
+                let locations = locations
+                    .as_array()?
+                    .iter()
+                    .map(|location| location_from_json(&file, location))
+                    .collect::<Option<Vec<_>>>()?;
+                Some((ModuleId::intern(module), locations))
+            })
+            .collect::<Option<FileToImportsMap>>()?;
+
+        Some(Self {
+            modified: value["modified"].as_u64()?,
+            size: value["size"].as_u64()?,
+            hash: value["hash"].as_u64()?,
+            scanned: value["scanned"].as_bool()?,
+            imports,
+        })
+    }
+}
+
+fn location_from_json(file: &Arc<str>, value: &Value) -> Option<Location> {
+    let [line, column, ignored_rule_codes] = value.as_array()?.as_slice() else {
+        return None;
+    };
+
+    Some(Location {
+        file: Arc::clone(file),
+        line: line.as_u64().and_then(|line| usize::try_from(line).ok()),
+        column: column
+            .as_u64()
+            .and_then(|column| usize::try_from(column).ok()),
+        ignored_rule_codes: ignored_rule_codes
+            .as_array()?
+            .iter()
+            .map(Value::as_str)
+            .collect::<Option<RuleCodes>>()?,
+    })
+}
+
+/// Loads the index scope and the cached entries from the cache directory. Returns no entries if the cache does not
+/// exist, cannot be read, or was written by another version of deptry or with another parser.
+fn load_entries(directory: &Path, version: &str) -> (Option<String>, HashMap<String, CacheEntry>) {
+    let path = directory.join(CACHE_FILE_NAME);
+
+    let Ok(file) = File::open(&path) else {
+        return (None, HashMap::new());
+    };
+
+    let content: Value = match serde_json::from_reader(BufReader::new(file)) {
+        Ok(content) => content,
+        Err(e) => {
+            log::debug!(
+                "Ignoring import cache {} that cannot be read: {e}",
+                path.display()
+            );
+            return (None, HashMap::new());
+        }
+    };
+
+    if content["version"] != version || content["key"] != CACHE_KEY {
+        log::debug!(
+            "Ignoring import cache {} written by another version of deptry.",
+            path.display()
+        );
+        return (None, HashMap::new());
+    }
+
+    let index_scope = content["index_scope"].as_str().map(str::to_owned);
+    let entries = content["files"]
+        .as_object()
+        .map(|files| {
+            files
+                .iter()
+                .filter_map(|(file, entry)| {
+                    Some((file.clone(), CacheEntry::from_json(file, entry)?))
+                })
+                .collect()
+        })
+        .unwrap_or_default();
+
+    (index_scope, entries)
+}
+
+/// Returns the modification time (in nanoseconds since the Unix epoch) and the size of a file.
+fn get_file_stamp(path: &str) -> Option<(u64, u64)> {
+    let metadata = fs::metadata(path).ok()?;
+    let modified = metadata.modified().ok()?.duration_since(UNIX_EPOCH).ok()?;
+
+    Some((u64::try_from(modified.as_nanos()).ok()?, metadata.len()))
+}
+
+/// Hashes file content with 64-bit FNV-1a. Unlike `std::hash::DefaultHasher`, whose algorithm may change between Rust
+/// releases, its result is stable, so hashes stored in the cache remain valid across builds.
+fn hash_content(content: &str) -> u64 {
+    const FNV_OFFSET_BASIS: u64 = 0xcbf2_9ce4_8422_2325;
+    const FNV_PRIME: u64 = 0x0000_0100_0000_01b3;
+
+    content.bytes().fold(FNV_OFFSET_BASIS, |hash, byte| {
+        (hash ^ u64::from(byte)).wrapping_mul(FNV_PRIME)
+    })
+}
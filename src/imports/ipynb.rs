@@ -1,42 +1,16 @@
-use crate::file_utils;
-use crate::location;
-
 use super::shared;
-use file_utils::read_file;
-use location::Location;
+use super::shared::FileToImportsMap;
 use pyo3::exceptions::PySyntaxError;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
-use rayon::prelude::*;
-use std::collections::HashMap;
-
-/// Processes multiple Python files in parallel to extract import statements and their locations.
-/// Accepts a list of file paths and returns a dictionary mapping module names to their import locations.
-#[pyfunction]
-pub fn get_imports_from_ipynb_files(py: Python<'_>, file_paths: Vec<String>) -> Bound<'_, PyDict> {
-    let results: Vec<_> = file_paths
-        .par_iter()
-        .map(|path_str| {
-            let result = get_imports_from_ipynb_file(path_str);
-            shared::ThreadResult {
-                file: path_str.to_string(),
-                result,
-            }
-        })
-        .collect();
-
-    let (all_imports, errors) = shared::merge_results_from_threads(results);
-    shared::log_python_errors_as_warnings(&errors);
-
-    all_imports.into_pyobject(py).unwrap()
-}
 
-/// Core helper function that extracts import statements and their locations from a single .ipynb file.
+/// Core helper function that extracts import statements and their locations from the content of a single .ipynb file.
 /// Ensures robust error handling and provides clearer, more detailed comments.
-fn get_imports_from_ipynb_file(path_str: &str) -> PyResult<HashMap<String, Vec<Location>>> {
-    let file_content = read_file(path_str)?;
+pub fn get_imports_from_ipynb_file_content(
+    path_str: &str,
+    file_content: &str,
+) -> PyResult<FileToImportsMap> {
     let notebook: serde_json::Value =
-        serde_json::from_str(&file_content).map_err(|e| PySyntaxError::new_err(e.to_string()))?;
+        serde_json::from_str(file_content).map_err(|e| PySyntaxError::new_err(e.to_string()))?;
     let cells = notebook["cells"]
         .as_array()
         .ok_or_else(|| PySyntaxError::new_err("Expected 'cells' to be an array"))?;
@@ -1,3 +1,134 @@
+use crate::python_file_finder;
+use pyo3::prelude::*;
+use rayon::iter::ParallelBridge;
+use std::path::PathBuf;
+use std::sync::mpsc;
+use std::thread;
+
+use cache::ImportCache;
+use parsed_files::ParsedFiles;
+use shared::FileToImportsMap;
+use table::ImportTable;
+
+pub mod cache;
 pub mod ipynb;
+pub mod parsed_files;
 pub mod py;
+pub mod scanner;
 pub mod shared;
+pub mod table;
+
+/// Processes multiple Python files and notebooks in parallel to extract import statements and their locations.
+/// Accepts a list of file paths and returns a table of the imported modules and their locations.
+/// If a cache is provided, imports of files that did not change since they were cached are read from the cache.
+/// If `parsed_files` is provided, files already parsed by a previous call sharing it are not parsed again.
+/// If `experimental_import_scanner` is set, imports of Python files are searched without parsing them when possible.
+#[pyfunction]
+#[pyo3(signature = (file_paths, cache=None, parsed_files=None, experimental_import_scanner=false))]
+pub fn get_imports_from_files(
+    file_paths: Vec<String>,
+    mut cache: Option<PyRefMut<'_, ImportCache>>,
+    mut parsed_files: Option<PyRefMut<'_, ParsedFiles>>,
+    experimental_import_scanner: bool,
+) -> ImportTable {
+    let results = shared::extract_imports_from_files(
+        &file_paths,
+        cache.as_deref_mut(),
+        parsed_files.as_deref_mut(),
+        ExtractionMode::new(experimental_import_scanner),
+    );
+
+    let (table, errors) = ImportTable::from_results(results);
+    shared::log_python_errors_as_warnings(&errors);
+    shared::log_dropped_rule_codes();
+
+    table
+}
+
+/// Finds Python files and notebooks in the given directories, and extracts their imports, in a single pass: files are
+/// walked in parallel, and sent through a channel to the workers extracting imports as soon as they are found, so that
+/// walking the file tree and parsing files overlap. Returns the table of the imported modules and their locations,
+/// alongside the number of files that were found.
+///
+/// Files are found as with `find_python_files`, and the cache, `parsed_files` and `experimental_import_scanner` work as
+/// with `get_imports_from_files`.
+#[pyfunction]
+#[pyo3(signature = (directories, exclude, extend_exclude, using_default_exclude, ignore_notebooks=false, walk_threads=0, cache=None, parsed_files=None, experimental_import_scanner=false))]
+#[allow(clippy::too_many_arguments)]
+pub fn get_imports_from_directories(
+    directories: Vec<PathBuf>,
+    exclude: Vec<String>,
+    extend_exclude: Vec<String>,
+    using_default_exclude: bool,
+    ignore_notebooks: bool,
+    walk_threads: usize,
+    mut cache: Option<PyRefMut<'_, ImportCache>>,
+    mut parsed_files: Option<PyRefMut<'_, ParsedFiles>>,
+    experimental_import_scanner: bool,
+) -> (ImportTable, usize) {
+    let mut unique_directories = directories;
+    unique_directories.dedup();
+
+    // When directories overlap, or point to the same files through symbolic links, the same file is found several times.
+    let deduplicate = unique_directories.len() > 1;
+    let excluded_patterns = [exclude, extend_exclude].concat();
+    let (sender, receiver) = mpsc::channel();
+
+    let results = thread::scope(|scope| {
+        scope.spawn(move || {
+            python_file_finder::send_python_files(
+                &unique_directories,
+                &excluded_patterns,
+                using_default_exclude,
+                ignore_notebooks,
+                walk_threads,
+                &sender,
+            );
+            // The sender is dropped here, which ends the iteration over the received files once the walk is done.
+        });
+
+        shared::extract_imports_from_stream(
+            receiver.into_iter().par_bridge(),
+            cache.as_deref_mut(),
+            parsed_files.as_deref_mut(),
+            deduplicate,
+            ExtractionMode::new(experimental_import_scanner),
+        )
+    });
+    let files_count = results.len();
+
+    let (table, errors) = ImportTable::from_results(results);
+    shared::log_python_errors_as_warnings(&errors);
+    shared::log_dropped_rule_codes();
+
+    (table, files_count)
+}
+
+/// How imports are extracted from Python files: by parsing them, or with the import scanner when possible.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum ExtractionMode {
+    Parse,
+    Scan,
+}
+
+impl ExtractionMode {
+    fn new(experimental_import_scanner: bool) -> Self {
+        if experimental_import_scanner {
+            Self::Scan
+        } else {
+            Self::Parse
+        }
+    }
+
+    /// Extracts imports from the content of a file, either a notebook or a Python file, depending on its extension.
+    /// With `Scan`, imports of Python files are first searched with the import scanner. Notebooks are always parsed.
+    pub fn extract(self, path_str: &str, file_content: &str) -> PyResult<FileToImportsMap> {
+        if path_str.ends_with(".ipynb") {
+            ipynb::get_imports_from_ipynb_file_content(path_str, file_content)
+        } else if self == Self::Scan {
+            py::scan_imports_from_py_file_content(path_str, file_content)
+        } else {
+            py::get_imports_from_py_file_content(path_str, file_content)
+        }
+    }
+}
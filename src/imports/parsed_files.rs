@@ -0,0 +1,36 @@
+use super::shared::FileToImportsMap;
+use pyo3::prelude::*;
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+
+/// Imports of the files parsed during a run, keyed by canonical path, so that a file that is part of several projects
+/// checked in the same run (e.g. a shared directory reached through symbolic links) is only parsed once.
+///
+/// Unlike `ImportCache`, entries are never persisted nor invalidated, as files are not expected to change during a run.
+#[pyclass]
+#[derive(Default)]
+pub struct ParsedFiles {
+    entries: HashMap<PathBuf, FileToImportsMap>,
+}
+
+#[pymethods]
+impl ParsedFiles {
+    #[new]
+    fn new() -> Self {
+        Self::default()
+    }
+
+    fn __len__(&self) -> usize {
+        self.entries.len()
+    }
+}
+
+impl ParsedFiles {
+    pub fn get(&self, canonical_path: &Path) -> Option<&FileToImportsMap> {
+        self.entries.get(canonical_path)
+    }
+
+    pub fn extend(&mut self, entries: impl IntoIterator<Item = (PathBuf, FileToImportsMap)>) {
+        self.entries.extend(entries);
+    }
+}
@@ -0,0 +1,304 @@
+use ruff_text_size::{TextRange, TextSize};
+use std::collections::HashMap;
+
+/// Names that make the imports of a file depend on more than its import statements, i.e. dynamic imports through
+/// `importlib.import_module`, and imports guarded by `TYPE_CHECKING` that are ignored. Files that use them are left to
+/// the parser.
+const UNSUPPORTED_NAMES: [&str; 3] = ["importlib", "import_module", "TYPE_CHECKING"];
+
+/// Prefixes of string literals, in lowercase. Prefixes of f-strings and t-strings are not part of them, as replacement
+/// fields can contain arbitrary expressions, including strings using the same quotes, so files using them are left to
+/// the parser.
+const STRING_PREFIXES: [&str; 5] = ["r", "u", "b", "br", "rb"];
+
+/// Scans the source code of a Python file for import statements without building its syntax tree, which is much faster
+/// on files with large literals, and returns the same imports as `ImportVisitor`, with the same ranges.
+///
+/// Since `import` is a keyword, any `import` token is part of an import statement, so the source code only needs to be
+/// split in tokens, skipping strings and comments. Returns `None` if the file contains constructs that the scanner does
+/// not handle, in which case the file has to be parsed. The scanner does not detect syntax errors.
+pub fn scan_imports(source: &str) -> Option<HashMap<String, Vec<TextRange>>> {
+    let mut scanner = Scanner {
+        source,
+        position: 0,
+        depth: 0,
+    };
+    let mut imports: HashMap<String, Vec<TextRange>> = HashMap::new();
+
+    while let Some(token) = scanner.next_token()? {
+        match token {
+            Token::Name(range) if scanner.text(range) == "import" => {
+                for (module, range) in scanner.scan_import_names()? {
+                    imports.entry(module).or_default().push(range);
+                }
+            }
+            Token::Name(range) if scanner.text(range) == "from" => {
+                if let Some(module) = scanner.scan_import_from_module()? {
+                    imports.entry(module).or_default().push(range);
+                }
+            }
+            Token::Name(range) if UNSUPPORTED_NAMES.contains(&scanner.text(range)) => return None,
+            _ => {}
+        }
+    }
+
+    // Let the parser report unbalanced brackets.
+    (scanner.depth == 0).then_some(imports)
+}
+
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum Token {
+    Name(TextRange),
+    Dot,
+    Comma,
+    Open,
+    Close,
+    /// End of a logical line, i.e. a line break outside of brackets that does not follow a backslash.
+    Newline,
+    Other,
+}
+
+#[derive(Clone, Copy)]
+struct Scanner<'a> {
+    source: &'a str,
+    position: usize,
+    /// Number of brackets opened and not closed yet at `position`.
+    depth: usize,
+}
+
+impl<'a> Scanner<'a> {
+    fn text(&self, range: TextRange) -> &'a str {
+        &self.source[range]
+    }
+
+    /// Scans the names of an `import` statement, after the `import` keyword, e.g. `foo.bar as baz, qux`, and returns the
+    /// top-level module of each name, with the range of the name.
+    fn scan_import_names(&mut self) -> Option<Vec<(String, TextRange)>> {
+        let mut modules = Vec::new();
+
+        loop {
+            let Some(Token::Name(range)) = self.next_token()? else {
+                return None;
+            };
+            let module = self.scan_dotted_name(range)?;
+            modules.push((module, range));
+
+            if self
+                .next_token_if(|scanner, token| scanner.is_name(token, "as"))?
+                .is_some()
+            {
+                let Some(Token::Name(alias)) = self.next_token()? else {
+                    return None;
+                };
+                self.check_name(alias)?;
+            }
+
+            if self
+                .next_token_if(|_, token| token == Token::Comma)?
+                .is_none()
+            {
+                return Some(modules);
+            }
+        }
+    }
+
+    /// Scans the module of a `from` statement, after the `from` keyword, up to the `import` keyword. Returns the top-level
+    /// module for absolute imports, and `None` for relative ones. If the `from` keyword is not part of an import (e.g. in
+    /// `yield from`), nothing is consumed.
+    fn scan_import_from_module(&mut self) -> Option<Option<String>> {
+        let checkpoint = *self;
+        let mut level = 0;
+
+        while self
+            .next_token_if(|_, token| token == Token::Dot)?
+            .is_some()
+        {
+            level += 1;
+        }
+
+        let module = match self.next_token_if(|scanner, token| !scanner.is_name(token, "import"))? {
+            Some(Token::Name(range)) => Some(self.scan_dotted_name(range)?),
+            Some(_) => None,
+            None => None,
+        };
+
+        if (level > 0 || module.is_some())
+            && self
+                .next_token_if(|scanner, token| scanner.is_name(token, "import"))?
+                .is_some()
+        {
+            return Some(if level == 0 { module } else { None });
+        }
+
+        *self = checkpoint;
+        Some(None)
+    }
+
+    /// Scans the rest of a dotted name whose first name is at `range`, and returns the first name.
+    fn scan_dotted_name(&mut self, range: TextRange) -> Option<String> {
+        self.check_name(range)?;
+
+        while self
+            .next_token_if(|_, token| token == Token::Dot)?
+            .is_some()
+        {
+            let Some(Token::Name(range)) = self.next_token()? else {
+                return None;
+            };
+            self.check_name(range)?;
+        }
+
+        Some(self.text(range).to_owned())
+    }
+
+    fn check_name(&self, range: TextRange) -> Option<()> {
+        (!UNSUPPORTED_NAMES.contains(&self.text(range))).then_some(())
+    }
+
+    fn is_name(&self, token: Token, name: &str) -> bool {
+        matches!(token, Token::Name(range) if self.text(range) == name)
+    }
+
+    /// Consumes the next token if it satisfies `predicate`.
+    fn next_token_if(&mut self, predicate: impl Fn(&Self, Token) -> bool) -> Option<Option<Token>> {
+        let checkpoint = *self;
+
+        match self.next_token()? {
+            Some(token) if predicate(self, token) => Some(Some(token)),
+            _ => {
+                *self = checkpoint;
+                Some(None)
+            }
+        }
+    }
+
+    /// Returns the next token, skipping whitespace, line continuations, comments, strings and numbers. Returns `Some(None)`
+    /// at the end of the source code, and `None` if the source code contains an unsupported or invalid construct.
+    fn next_token(&mut self) -> Option<Option<Token>> {
+        let bytes: &'a [u8] = self.source.as_bytes();
+
+        while let Some(&byte) = bytes.get(self.position) {
+            let start = self.position;
+            self.position += 1;
+
+            match byte {
+                b' ' | b'\t' | b'\x0c' => {}
+                b'\\' => {
+                    // Line continuation.
+                    if bytes.get(self.position) == Some(&b'\r') {
+                        self.position += 1;
+                    }
+                    if bytes.get(self.position) == Some(&b'\n') {
+                        self.position += 1;
+                    }
+                }
+                b'\r' | b'\n' if self.depth == 0 => return Some(Some(Token::Newline)),
+                b'\r' | b'\n' => {}
+                b'#' => self.skip_until(|byte| byte == b'\n' || byte == b'\r'),
+                b'\'' | b'"' => self.skip_string(byte)?,
+                b'.' if bytes.get(self.position).is_some_and(u8::is_ascii_digit) => {
+                    self.skip_while(is_number_byte);
+                }
+                b'.' => return Some(Some(Token::Dot)),
+                b',' => return Some(Some(Token::Comma)),
+                b'(' | b'[' | b'{' => {
+                    self.depth += 1;
+                    return Some(Some(Token::Open));
+                }
+                b')' | b']' | b'}' => {
+                    self.depth = self.depth.checked_sub(1)?;
+                    return Some(Some(Token::Close));
+                }
+                b'0'..=b'9' => self.skip_while(is_number_byte),
+                byte if is_name_byte(byte) => {
+                    self.skip_while(is_name_byte);
+
+                    if let Some(&quote) = bytes.get(self.position)
+                        && (quote == b'\'' || quote == b'"')
+                    {
+                        // The name is the prefix of a string literal.
+                        let prefix = self.source[start..self.position].to_ascii_lowercase();
+                        if !STRING_PREFIXES.contains(&prefix.as_str()) {
+                            return None;
+                        }
+                        self.position += 1;
+                        self.skip_string(quote)?;
+                        continue;
+                    }
+
+                    let range = TextRange::new(
+                        TextSize::try_from(start).ok()?,
+                        TextSize::try_from(self.position).ok()?,
+                    );
+                    return Some(Some(Token::Name(range)));
+                }
+                _ => return Some(Some(Token::Other)),
+            }
+        }
+
+        Some(None)
+    }
+
+    /// Skips a string literal whose opening `quote` was just consumed. Returns `None` if the string is not terminated.
+    fn skip_string(&mut self, quote: u8) -> Option<()> {
+        let bytes: &'a [u8] = self.source.as_bytes();
+        let is_triple_quoted = bytes.get(self.position) == Some(&quote)
+            && bytes.get(self.position + 1) == Some(&quote);
+
+        if is_triple_quoted {
+            self.position += 2;
+        } else if bytes.get(self.position) == Some(&quote) {
+            // Empty string.
+            self.position += 1;
+            return Some(());
+        }
+
+        while let Some(&byte) = bytes.get(self.position) {
+            self.position += 1;
+
+            match byte {
+                // Backslashes escape the next character, including in raw strings, where they are kept.
+                b'\\' => self.position += 1,
+                b'\n' | b'\r' if !is_triple_quoted => return None,
+                byte if byte == quote => {
+                    if !is_triple_quoted {
+                        return Some(());
+                    }
+                    if bytes.get(self.position) == Some(&quote)
+                        && bytes.get(self.position + 1) == Some(&quote)
+                    {
+                        self.position += 2;
+                        return Some(());
+                    }
+                }
+                _ => {}
+            }
+        }
+
+        None
+    }
+
+    fn skip_while(&mut self, predicate: impl Fn(u8) -> bool) {
+        let bytes: &'a [u8] = self.source.as_bytes();
+        while bytes
+            .get(self.position)
+            .is_some_and(|&byte| predicate(byte))
+        {
+            self.position += 1;
+        }
+    }
+
+    fn skip_until(&mut self, predicate: impl Fn(u8) -> bool) {
+        self.skip_while(|byte| !predicate(byte));
+    }
+}
+
+/// Bytes of names, including the bytes of non-ASCII characters, which can only be part of names outside of strings and
+/// comments.
+fn is_name_byte(byte: u8) -> bool {
+    byte.is_ascii_alphanumeric() || byte == b'_' || !byte.is_ascii()
+}
+
+fn is_number_byte(byte: u8) -> bool {
+    byte.is_ascii_alphanumeric() || byte == b'_' || byte == b'.'
+}
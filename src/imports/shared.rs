@@ -1,19 +1,30 @@
+use crate::file_utils;
+use crate::interner::ModuleId;
 use crate::location;
 use crate::visitor;
 
-use location::Location;
+use super::ExtractionMode;
+use super::cache::{CacheEntry, ImportCache};
+use super::parsed_files::ParsedFiles;
+use file_utils::read_file;
+use location::{Location, RuleCodes};
 use pyo3::exceptions::PySyntaxError;
 use pyo3::prelude::*;
+use rayon::prelude::*;
 use regex::Regex;
 use ruff_python_ast::visitor::Visitor;
 use ruff_python_ast::{Mod, ModModule};
 use ruff_python_parser::{Mode, ParseOptions, Parsed, parse};
-use ruff_source_file::LineIndex;
+use ruff_source_file::{LineIndex, OneIndexed};
 use ruff_text_size::TextRange;
-use std::collections::HashMap;
+use std::collections::{BTreeSet, HashMap, HashSet};
+use std::fs;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, LazyLock, Mutex};
 use visitor::ImportVisitor;
 
-pub type FileToImportsMap = HashMap<String, Vec<Location>>;
+/// Locations of the imports of a file, by imported module.
+pub type FileToImportsMap = HashMap<ModuleId, Vec<Location>>;
 pub type ErrorList = Vec<(String, PyErr)>;
 
 pub struct ThreadResult {
@@ -21,6 +32,272 @@ pub struct ThreadResult {
     pub result: PyResult<FileToImportsMap>,
 }
 
+/// Extracts imports from the given files in parallel, extracting the imports from the content of each file with
+/// `mode`. If a cache is provided, files that did not change since they were cached are not parsed again, and the cache
+/// is updated with the files that were parsed.
+///
+/// If `parsed_files` is provided, files that were already parsed in a previous call are not parsed again, and files
+/// parsed in this call are added to it. Files are then identified by their canonical path, so that a file given through
+/// several paths is only parsed once, and its imports are returned for each of its paths. Otherwise, files are only
+/// identified by their path, as paths found by `find_python_files` are already deduplicated, which saves resolving the
+/// canonical path of each file.
+pub fn extract_imports_from_files(
+    file_paths: &[String],
+    cache: Option<&mut ImportCache>,
+    mut parsed_files: Option<&mut ParsedFiles>,
+    mode: ExtractionMode,
+) -> Vec<ThreadResult> {
+    let canonical_paths: Vec<PathBuf> = if parsed_files.is_some() {
+        file_paths
+            .par_iter()
+            .map(|path_str| fs::canonicalize(path_str).unwrap_or_else(|_| PathBuf::from(path_str)))
+            .collect()
+    } else {
+        file_paths.iter().map(PathBuf::from).collect()
+    };
+
+    // Index of the first path of each file, and number of paths of each file.
+    let mut occurrences: HashMap<&Path, (usize, usize)> = HashMap::with_capacity(file_paths.len());
+    for (index, canonical_path) in canonical_paths.iter().enumerate() {
+        occurrences.entry(canonical_path).or_insert((index, 0)).1 += 1;
+    }
+
+    let mut indexes_to_extract: Vec<usize> = occurrences
+        .iter()
+        .filter(|(canonical_path, _)| {
+            parsed_files
+                .as_deref()
+                .is_none_or(|parsed_files| parsed_files.get(canonical_path).is_none())
+        })
+        .map(|(_, (first_index, _))| *first_index)
+        .collect();
+    indexes_to_extract.sort_unstable();
+
+    let extracted: Vec<(usize, PyResult<FileToImportsMap>, Option<CacheEntry>)> =
+        indexes_to_extract
+            .par_iter()
+            .map(|&index| {
+                let (result, entry) = extract_imports(&file_paths[index], cache.as_deref(), mode);
+                (index, result, entry)
+            })
+            .collect();
+
+    let mut extracted_imports = HashMap::with_capacity(extracted.len());
+    let mut errors = HashMap::new();
+    let mut entries = Vec::new();
+    for (index, result, entry) in extracted {
+        if let Some(entry) = entry {
+            entries.push((file_paths[index].clone(), entry));
+        }
+        match result {
+            Ok(imports) => {
+                extracted_imports.insert(index, imports);
+            }
+            Err(e) => {
+                errors.insert(index, e);
+            }
+        }
+    }
+
+    if let Some(cache) = cache {
+        cache.update(file_paths, entries);
+    }
+
+    let mut results = Vec::with_capacity(file_paths.len());
+    for (index, (path_str, canonical_path)) in file_paths.iter().zip(&canonical_paths).enumerate() {
+        let (first_index, remaining) = occurrences
+            .get_mut(canonical_path.as_path())
+            .expect("all files are counted");
+        *remaining -= 1;
+
+        let result = if let Some(e) = errors.remove(&index) {
+            Err(e)
+        } else if *remaining == 0 && parsed_files.is_none() {
+            // Last path of the file, so its imports can be moved instead of cloned.
+            match extracted_imports.remove(first_index) {
+                Some(imports) => Ok(imports),
+                None => continue,
+            }
+        } else if let Some(imports) = extracted_imports.get(first_index).or_else(|| {
+            parsed_files
+                .as_deref()
+                .and_then(|parsed_files| parsed_files.get(canonical_path))
+        }) {
+            Ok(imports.clone())
+        } else {
+            // Another path of a file that could not be processed, which is only reported once.
+            continue;
+        };
+
+        results.push(ThreadResult {
+            file: path_str.to_string(),
+            result,
+        });
+    }
+
+    if let Some(parsed_files) = parsed_files.as_deref_mut() {
+        parsed_files.extend(
+            extracted_imports
+                .into_iter()
+                .map(|(index, imports)| (canonical_paths[index].clone(), imports)),
+        );
+    }
+
+    results
+}
+
+/// Extracts imports from the files received through `file_paths` in parallel, while they are still being sent, so that
+/// finding files and extracting their imports overlap. Results are sorted by path, so that they do not depend on the
+/// order in which files were sent. Caching works as in `extract_imports_from_files`.
+///
+/// If `deduplicate` is set, files are identified by their canonical path, and a file received through several paths is
+/// only parsed once, and only returned for the first of its paths in sorted order. `parsed_files` works as in
+/// `extract_imports_from_files`, and implies `deduplicate`.
+pub fn extract_imports_from_stream(
+    file_paths: impl ParallelIterator<Item = String>,
+    cache: Option<&mut ImportCache>,
+    mut parsed_files: Option<&mut ParsedFiles>,
+    deduplicate: bool,
+    mode: ExtractionMode,
+) -> Vec<ThreadResult> {
+    let deduplicate = deduplicate || parsed_files.is_some();
+    let claimed_files: Mutex<HashSet<PathBuf>> = Mutex::new(HashSet::new());
+
+    let mut extracted: Vec<StreamedFile> = {
+        let cache = cache.as_deref();
+        let parsed_files = parsed_files.as_deref();
+
+        file_paths
+            .map(|path_str| {
+                if !deduplicate {
+                    let (result, entry) = extract_imports(&path_str, cache, mode);
+                    return StreamedFile::extracted(path_str, None, result, entry);
+                }
+
+                let canonical_path =
+                    fs::canonicalize(&path_str).unwrap_or_else(|_| PathBuf::from(&path_str));
+
+                if !claimed_files.lock().unwrap().insert(canonical_path.clone()) {
+                    // Another path of a file that is extracted through the first of its paths received.
+                    return StreamedFile {
+                        path: path_str,
+                        canonical_path: Some(canonical_path),
+                        result: None,
+                        entry: None,
+                    };
+                }
+
+                if let Some(imports) = parsed_files.and_then(|parsed| parsed.get(&canonical_path)) {
+                    let result = Ok(imports.clone());
+                    return StreamedFile::extracted(path_str, Some(canonical_path), result, None);
+                }
+
+                let (result, entry) = extract_imports(&path_str, cache, mode);
+                StreamedFile::extracted(path_str, Some(canonical_path), result, entry)
+            })
+            .collect()
+    };
+    extracted.sort_unstable_by(|a, b| a.path.cmp(&b.path));
+
+    // Imports of files received through several paths are returned for the first path in sorted order, which is not
+    // necessarily the one the file was extracted through.
+    if deduplicate {
+        let mut first_paths: HashMap<&Path, usize> = HashMap::new();
+        let mut moves = Vec::new();
+        for (index, file) in extracted.iter().enumerate() {
+            if let Some(canonical_path) = file.canonical_path.as_deref() {
+                match first_paths.get(canonical_path) {
+                    Some(&first_index) if file.result.is_some() => moves.push((index, first_index)),
+                    Some(_) => {}
+                    None => {
+                        first_paths.insert(canonical_path, index);
+                    }
+                }
+            }
+        }
+
+        for (from, to) in moves {
+            extracted[to].result = extracted[from].result.take();
+        }
+    }
+
+    let file_paths: Vec<String> = extracted.iter().map(|file| file.path.clone()).collect();
+    let entries: Vec<(String, CacheEntry)> = extracted
+        .iter_mut()
+        .filter_map(|file| Some((file.path.clone(), file.entry.take()?)))
+        .collect();
+    if let Some(cache) = cache {
+        cache.update(&file_paths, entries);
+    }
+
+    let mut results = Vec::with_capacity(extracted.len());
+    let mut newly_parsed_files = Vec::new();
+    for file in extracted {
+        let Some(result) = file.result else {
+            continue;
+        };
+
+        if let (Ok(imports), Some(canonical_path), Some(parsed_files)) =
+            (&result, file.canonical_path, parsed_files.as_deref())
+            && parsed_files.get(&canonical_path).is_none()
+        {
+            newly_parsed_files.push((canonical_path, imports.clone()));
+        }
+
+        results.push(ThreadResult {
+            file: file.path,
+            result,
+        });
+    }
+
+    if let Some(parsed_files) = parsed_files.as_deref_mut() {
+        parsed_files.extend(newly_parsed_files);
+    }
+
+    results
+}
+
+/// A file received by `extract_imports_from_stream`. `result` is `None` for the paths of a file that is extracted
+/// through another path, and `canonical_path` is only set when deduplicating files.
+struct StreamedFile {
+    path: String,
+    canonical_path: Option<PathBuf>,
+    result: Option<PyResult<FileToImportsMap>>,
+    entry: Option<CacheEntry>,
+}
+
+impl StreamedFile {
+    fn extracted(
+        path: String,
+        canonical_path: Option<PathBuf>,
+        result: PyResult<FileToImportsMap>,
+        entry: Option<CacheEntry>,
+    ) -> Self {
+        Self {
+            path,
+            canonical_path,
+            result: Some(result),
+            entry,
+        }
+    }
+}
+
+/// Extracts imports from a single file, reading them from the cache if the file did not change since it was cached.
+/// Returns the cache entry to store for the file alongside the imports, if a cache is provided.
+fn extract_imports(
+    path_str: &str,
+    cache: Option<&ImportCache>,
+    mode: ExtractionMode,
+) -> (PyResult<FileToImportsMap>, Option<CacheEntry>) {
+    match cache {
+        Some(cache) => cache.get_or_extract(path_str, mode),
+        None => (
+            read_file(path_str).and_then(|content| mode.extract(path_str, &content)),
+            None,
+        ),
+    }
+}
+
 /// Parses the content of a Python file into a parsed source code.
 pub fn parse_file_content(file_content: &str) -> PyResult<Parsed<Mod>> {
     let parsed = parse(file_content, ParseOptions::from(Mode::Module))
@@ -44,86 +321,92 @@ pub fn extract_imports_from_parsed_file_content(
     visitor.get_imports()
 }
 
-/// Extracts ignored rule codes from an inline `# deptry: ignore` comment on a source line.
+/// Inline `# deptry: ignore` comments, optionally followed by the rule codes to ignore between brackets. Whitespace
+/// does not match line breaks, as comments end with the line. Compiled once, as it is matched against every line that
+/// contains an import.
+static INLINE_IGNORE_REGEX: LazyLock<Regex> = LazyLock::new(|| {
+    Regex::new(r"#[^\S\r\n]*deptry:[^\S\r\n]*ignore(?:\[([A-Z0-9,[^\S\r\n]]+)\])?").unwrap()
+});
+
+/// Rule codes found in inline ignore comments that could not be stored, because all the bits of `RuleCodes` are already
+/// assigned, so that they are reported once, from the thread that called into Rust, with `log_dropped_rule_codes`,
+/// instead of being silently dropped.
+static DROPPED_RULE_CODES: Mutex<BTreeSet<String>> = Mutex::new(BTreeSet::new());
+
+/// Extracts the rule codes ignored with an inline `# deptry: ignore` comment on a source line.
 ///
 /// Supports:
-/// - `# deptry: ignore` — returns `["ALL"]` to indicate all rules are ignored.
-/// - `# deptry: ignore[DEP001]` — returns `["DEP001"]`.
-/// - `# deptry: ignore[DEP001,DEP003]` — returns `["DEP001", "DEP003"]`.
+/// - `# deptry: ignore`, which ignores all rules.
+/// - `# deptry: ignore[DEP001]`, which ignores `DEP001`.
+/// - `# deptry: ignore[DEP001,DEP003]`, which ignores `DEP001` and `DEP003`.
 ///
-/// Returns an empty `Vec` if no ignore comment is found.
-pub fn extract_ignored_rule_codes(line: &str) -> Vec<String> {
-    let re = Regex::new(r"#\s*deptry:\s*ignore(?:\[([A-Z0-9,\s]+)\])?").unwrap();
-
-    if let Some(caps) = re.captures(line) {
-        match caps.get(1) {
+/// Returns an empty set if no ignore comment is found. Codes other than the built-in ones (e.g. codes of custom rules)
+/// are kept as well. Codes that cannot be stored are recorded, to be reported by `log_dropped_rule_codes`.
+pub fn extract_ignored_rule_codes(line: &str) -> RuleCodes {
+    match INLINE_IGNORE_REGEX.captures(line) {
+        Some(caps) => match caps.get(1) {
             Some(codes) => codes
                 .as_str()
                 .split(',')
-                .map(|s| s.trim().to_owned())
-                .filter(|s| !s.is_empty())
+                .map(str::trim)
+                .filter(|code| !code.is_empty())
+                .inspect(|code| {
+                    if RuleCodes::from_code(code).is_none() {
+                        DROPPED_RULE_CODES
+                            .lock()
+                            .unwrap()
+                            .insert((*code).to_owned());
+                    }
+                })
                 .collect(),
-            None => vec!["ALL".to_owned()],
-        }
-    } else {
-        vec![]
+            None => RuleCodes::ALL,
+        },
+        None => RuleCodes::default(),
     }
 }
 
 /// Converts textual ranges of import statements into structured location objects.
 /// Facilitates the mapping of imports to detailed, file-specific location data (file, line, column).
+///
+/// Only the lines that contain imports are searched for inline ignore comments, each of them once, however many imports
+/// it contains. The path of the file is shared by all its locations.
 pub fn convert_imports_with_textranges_to_location_objects(
     imports: HashMap<String, Vec<TextRange>>,
     file_path: &str,
     source_code: &str,
 ) -> FileToImportsMap {
+    if imports.is_empty() {
+        return FileToImportsMap::new();
+    }
+
+    let file: Arc<str> = Arc::from(file_path);
     let line_index = LineIndex::from_source_text(source_code);
-    let source_lines: Vec<&str> = source_code.lines().collect();
-    let mut imports_with_locations = HashMap::<String, Vec<Location>>::new();
+    let mut ignored_rule_codes_by_line: HashMap<OneIndexed, RuleCodes> = HashMap::new();
+    let mut imports_with_locations = FileToImportsMap::with_capacity(imports.len());
 
     for (module, ranges) in imports {
-        let locations: Vec<Location> = ranges
-            .iter()
-            .map(|range| {
-                let line_column = line_index.line_column(range.start(), source_code);
-                let line_number = line_column.line.get();
-                let ignored_rule_codes = source_lines
-                    .get(line_number - 1)
-                    .map(|line| extract_ignored_rule_codes(line))
-                    .unwrap_or_default();
-                Location {
-                    file: file_path.to_owned(),
-                    line: Some(line_number),
-                    column: Some(line_column.column.get()),
-                    ignored_rule_codes,
-                }
-            })
-            .collect();
-        imports_with_locations.insert(module, locations);
-    }
-    imports_with_locations
-}
+        let mut locations = Vec::with_capacity(ranges.len());
 
-// Shared logic for merging results from different threads.
-pub fn merge_results_from_threads(results: Vec<ThreadResult>) -> (FileToImportsMap, ErrorList) {
-    let mut all_imports = HashMap::new();
-    let mut errors = Vec::new();
-
-    for thread_result in results {
-        match thread_result.result {
-            Ok(file_result) => {
-                for (module, locations) in file_result {
-                    all_imports
-                        .entry(module)
-                        .or_insert_with(Vec::new)
-                        .extend(locations);
-                }
-            }
-            Err(e) => errors.push((thread_result.file, e)),
+        for range in ranges {
+            let line_column = line_index.line_column(range.start(), source_code);
+            let ignored_rule_codes = *ignored_rule_codes_by_line
+                .entry(line_column.line)
+                .or_insert_with(|| {
+                    let line_range = line_index.line_range(line_column.line, source_code);
+                    extract_ignored_rule_codes(&source_code[line_range])
+                });
+
+            locations.push(Location {
+                file: Arc::clone(&file),
+                line: Some(line_column.line.get()),
+                column: Some(line_column.column.get()),
+                ignored_rule_codes,
+            });
         }
-    }
 
-    (all_imports, errors)
+        imports_with_locations.insert(ModuleId::intern(&module), locations);
+    }
+    imports_with_locations
 }
 
 // Shared logic for logging errors.
@@ -134,3 +417,17 @@ pub fn log_python_errors_as_warnings(errors: &[(String, PyErr)]) {
         );
     }
 }
+
+/// Logs the rule codes of inline ignore comments that could not be stored since the last call. This must be called
+/// from the thread that called into Rust, as logging goes through Python.
+pub fn log_dropped_rule_codes() {
+    let dropped_rule_codes = std::mem::take(&mut *DROPPED_RULE_CODES.lock().unwrap());
+
+    for code in dropped_rule_codes {
+        log::warn!(
+            "Warning: Rule code '{code}' in a `# deptry: ignore` comment is not honoured, as at most {} distinct rule \
+             codes are supported.",
+            u64::BITS - 1
+        );
+    }
+}
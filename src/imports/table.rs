@@ -0,0 +1,176 @@
+use crate::interner::ModuleId;
+use crate::location::{self, RuleCodes};
+
+use super::shared::{ErrorList, ThreadResult};
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use std::collections::HashMap;
+use std::sync::Arc;
+
+/// Imports extracted from a set of files, stored in a columnar layout to avoid creating a Python object per import.
+///
+/// Each row of the table is an import of a module at a location. Modules and files are interned: rows reference them
+/// by their index in `modules` and `files`. Rows are grouped by module, in the order of `modules` (which is sorted),
+/// so that the rows of the module at index `i` are the ones between `module_offsets[i]` and `module_offsets[i + 1]`.
+/// Within a module, rows are ordered by file, then by position in the file.
+///
+/// Lines and columns are 1-based, so that 0 can represent a missing value. Rule codes ignored with inline comments are
+/// stored as a bitmask over `rule_codes`, which are the codes of `RULE_CODES`, followed by the other codes found in
+/// inline comments so far (e.g. codes of custom rules).
+#[pyclass(frozen)]
+pub struct ImportTable {
+    modules: Vec<String>,
+    files: Vec<String>,
+    rule_codes: Vec<String>,
+    module_offsets: Vec<u32>,
+    file_ids: Vec<u32>,
+    lines: Vec<u32>,
+    columns: Vec<u32>,
+    ignored_rule_codes: Vec<u64>,
+}
+
+#[pymethods]
+impl ImportTable {
+    #[getter]
+    fn modules(&self) -> Vec<String> {
+        self.modules.clone()
+    }
+
+    #[getter]
+    fn files(&self) -> Vec<String> {
+        self.files.clone()
+    }
+
+    #[getter]
+    fn rule_codes(&self) -> Vec<String> {
+        self.rule_codes.clone()
+    }
+
+    /// Returns the offsets of the rows of each module, as native-endian unsigned 32-bit integers.
+    fn module_offsets<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        u32_to_bytes(py, &self.module_offsets)
+    }
+
+    /// Returns the file index of each row, as native-endian unsigned 32-bit integers.
+    fn file_ids<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        u32_to_bytes(py, &self.file_ids)
+    }
+
+    /// Returns the line of each row, as native-endian unsigned 32-bit integers.
+    fn lines<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        u32_to_bytes(py, &self.lines)
+    }
+
+    /// Returns the column of each row, as native-endian unsigned 32-bit integers.
+    fn columns<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        u32_to_bytes(py, &self.columns)
+    }
+
+    /// Returns the bitmask of ignored rule codes of each row, as native-endian unsigned 64-bit integers.
+    fn ignored_rule_codes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let bytes: Vec<u8> = self
+            .ignored_rule_codes
+            .iter()
+            .flat_map(|mask| mask.to_ne_bytes())
+            .collect();
+        PyBytes::new(py, &bytes)
+    }
+
+    fn __len__(&self) -> usize {
+        self.file_ids.len()
+    }
+}
+
+impl ImportTable {
+    /// Builds the table from the results of the extraction of each file, keeping files in the order they are given.
+    /// Returns the errors of the files that could not be processed alongside the table.
+    pub fn from_results(results: Vec<ThreadResult>) -> (Self, ErrorList) {
+        let mut files = Vec::with_capacity(results.len());
+        let mut errors = Vec::new();
+        let mut rows_by_module: HashMap<ModuleId, Vec<Row>> = HashMap::new();
+
+        for thread_result in results {
+            let imports = match thread_result.result {
+                Ok(imports) => imports,
+                Err(e) => {
+                    errors.push((thread_result.file, e));
+                    continue;
+                }
+            };
+
+            let file_id = u32::try_from(files.len()).expect("too many files to index");
+            files.push(thread_result.file);
+
+            for (module, locations) in imports {
+                rows_by_module
+                    .entry(module)
+                    .or_default()
+                    .extend(locations.into_iter().map(|location| Row {
+                        file_id,
+                        line: to_u32(location.line),
+                        column: to_u32(location.column),
+                        ignored_rule_codes: location.ignored_rule_codes,
+                    }));
+            }
+        }
+
+        let mut modules: Vec<(Arc<str>, ModuleId)> =
+            rows_by_module.keys().map(|&id| (id.name(), id)).collect();
+        modules.sort_unstable_by(|(a, _), (b, _)| a.cmp(b));
+
+        let rows_count = rows_by_module.values().map(Vec::len).sum();
+        let mut table = Self {
+            modules: Vec::new(),
+            files,
+            rule_codes: location::rule_codes()
+                .into_iter()
+                .map(str::to_owned)
+                .collect(),
+            module_offsets: Vec::with_capacity(modules.len() + 1),
+            file_ids: Vec::with_capacity(rows_count),
+            lines: Vec::with_capacity(rows_count),
+            columns: Vec::with_capacity(rows_count),
+            ignored_rule_codes: Vec::with_capacity(rows_count),
+        };
+
+        table.module_offsets.push(0);
+        for (_, module) in &modules {
+            for row in &rows_by_module[module] {
+                table.file_ids.push(row.file_id);
+                table.lines.push(row.line);
+                table.columns.push(row.column);
+                table.ignored_rule_codes.push(row.ignored_rule_codes.bits());
+            }
+            table
+                .module_offsets
+                .push(u32::try_from(table.file_ids.len()).expect("too many imports to index"));
+        }
+
+        table.modules = modules
+            .into_iter()
+            .map(|(name, _)| name.to_string())
+            .collect();
+        (table, errors)
+    }
+}
+
+struct Row {
+    file_id: u32,
+    line: u32,
+    column: u32,
+    ignored_rule_codes: RuleCodes,
+}
+
+fn to_u32(value: Option<usize>) -> u32 {
+    value
+        .and_then(|value| u32::try_from(value).ok())
+        .unwrap_or(0)
+}
+
+fn u32_to_bytes<'py>(py: Python<'py>, values: &[u32]) -> Bound<'py, PyBytes> {
+    let bytes: Vec<u8> = values
+        .iter()
+        .flat_map(|value| value.to_ne_bytes())
+        .collect();
+    PyBytes::new(py, &bytes)
+}
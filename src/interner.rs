@@ -0,0 +1,43 @@
+use std::collections::HashMap;
+use std::sync::{Arc, LazyLock, RwLock};
+
+/// Names of the modules imported in the files processed by the process, shared by all threads, so that each distinct
+/// name is only allocated once, however many files import it, and imports can be grouped by module by comparing
+/// integers instead of hashing strings. Names are never removed, as the number of distinct modules is small.
+static MODULE_NAMES: LazyLock<RwLock<Interner>> = LazyLock::new(RwLock::default);
+
+#[derive(Default)]
+struct Interner {
+    ids: HashMap<Arc<str>, ModuleId>,
+    names: Vec<Arc<str>>,
+}
+
+/// Identifier of an interned module name.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+pub struct ModuleId(u32);
+
+impl ModuleId {
+    /// Returns the identifier of `name`, interning it if it was not interned yet.
+    pub fn intern(name: &str) -> Self {
+        if let Some(&id) = MODULE_NAMES.read().unwrap().ids.get(name) {
+            return id;
+        }
+
+        let mut interner = MODULE_NAMES.write().unwrap();
+        // Another thread may have interned the name while the lock was released.
+        if let Some(&id) = interner.ids.get(name) {
+            return id;
+        }
+
+        let id =
+            Self(u32::try_from(interner.names.len()).expect("too many module names to intern"));
+        let name: Arc<str> = Arc::from(name);
+        interner.names.push(Arc::clone(&name));
+        interner.ids.insert(name, id);
+        id
+    }
+
+    pub fn name(self) -> Arc<str> {
+        Arc::clone(&MODULE_NAMES.read().unwrap().names[self.0 as usize])
+    }
+}
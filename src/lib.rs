@@ -1,23 +1,38 @@
 use pyo3::prelude::*;
 
+mod distributions;
+mod excluded_paths;
 mod file_utils;
 mod imports;
+mod interner;
 mod location;
 mod python_file_finder;
 mod visitor;
-
-use location::Location;
+mod watcher;
 
 #[pymodule]
 fn rust(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     pyo3_log::init(); // Initialize logging to forward to Python's logger
 
-    m.add_function(wrap_pyfunction!(imports::py::get_imports_from_py_files, m)?)?;
+    m.add_function(wrap_pyfunction!(imports::get_imports_from_files, m)?)?;
+    m.add_function(wrap_pyfunction!(imports::get_imports_from_directories, m)?)?;
+    m.add_function(wrap_pyfunction!(python_file_finder::find_python_files, m)?)?;
     m.add_function(wrap_pyfunction!(
-        imports::ipynb::get_imports_from_ipynb_files,
+        python_file_finder::find_python_files_and_directories,
         m
     )?)?;
-    m.add_function(wrap_pyfunction!(python_file_finder::find_python_files, m)?)?;
-    m.add_class::<Location>()?;
+    m.add_function(wrap_pyfunction!(
+        python_file_finder::filter_walked_files,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(distributions::find_distributions, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        distributions::get_top_level_module_names,
+        m
+    )?)?;
+    m.add_class::<imports::cache::ImportCache>()?;
+    m.add_class::<imports::parsed_files::ParsedFiles>()?;
+    m.add_class::<imports::table::ImportTable>()?;
+    m.add_class::<watcher::FileWatcher>()?;
     Ok(())
 }
@@ -1,40 +1,93 @@
-use pyo3::prelude::*;
+use std::sync::{Arc, RwLock};
 
-#[pyclass(skip_from_py_object)]
+/// Rule codes that can be ignored with inline `# deptry: ignore` comments, in sorted order. `ALL` ignores all rules.
+pub const RULE_CODES: [&str; 6] = ["ALL", "DEP001", "DEP002", "DEP003", "DEP004", "DEP005"];
+
+/// Location of an import in a file. The path of the file is shared by all the locations in the file.
 #[derive(Clone, Debug)]
 pub struct Location {
-    #[pyo3(get, set)]
-    pub file: String,
-    #[pyo3(get, set)]
+    pub file: Arc<str>,
     pub line: Option<usize>,
-    #[pyo3(get, set)]
     pub column: Option<usize>,
-    #[pyo3(get, set)]
-    pub ignored_rule_codes: Vec<String>,
+    pub ignored_rule_codes: RuleCodes,
+}
+
+/// Rule codes found in inline ignore comments other than the ones of `RULE_CODES` (e.g. codes of custom rules), in the
+/// order they were first found, so that each of them gets the bit following the ones of the codes before it.
+static OTHER_RULE_CODES: RwLock<Vec<&'static str>> = RwLock::new(Vec::new());
+
+/// Maximum number of rule codes, including the ones of `RULE_CODES`, that can be stored in a `RuleCodes` bitmask.
+const MAX_RULE_CODES: usize = u64::BITS as usize;
+
+/// Returns all the rule codes that can be stored in a `RuleCodes` bitmask so far: the codes of `RULE_CODES`, followed
+/// by the other codes found in inline ignore comments. The code at index `i` is bit `i` of the bitmask.
+pub fn rule_codes() -> Vec<&'static str> {
+    let other_rule_codes = OTHER_RULE_CODES.read().unwrap();
+    RULE_CODES
+        .iter()
+        .chain(other_rule_codes.iter())
+        .copied()
+        .collect()
 }
 
-#[pymethods]
-impl Location {
-    #[new]
-    #[pyo3(signature = (file, line=None, column=None, ignored_rule_codes=vec![]))]
-    fn new(
-        file: String,
-        line: Option<usize>,
-        column: Option<usize>,
-        ignored_rule_codes: Vec<String>,
-    ) -> Self {
-        Self {
-            file,
-            line,
-            column,
-            ignored_rule_codes,
+/// Set of rule codes, stored as a bitmask in which the code at index `i` of `rule_codes()` is bit `i`. Codes that are
+/// not in `RULE_CODES` are assigned the next free bit the first time they are found. Once all the bits are assigned,
+/// other codes cannot be stored, so `from_code` returns `None` for them.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct RuleCodes(u64);
+
+impl RuleCodes {
+    pub const ALL: Self = Self(1);
+
+    pub fn from_code(code: &str) -> Option<Self> {
+        if let Some(index) = RULE_CODES.iter().position(|rule_code| *rule_code == code) {
+            return Some(Self(1 << index));
+        }
+
+        if let Some(index) = find_other_rule_code(&OTHER_RULE_CODES.read().unwrap(), code) {
+            return Some(Self(1 << index));
         }
+
+        let mut other_rule_codes = OTHER_RULE_CODES.write().unwrap();
+        // Another thread may have added the code between the two locks.
+        let index = find_other_rule_code(&other_rule_codes, code).or_else(|| {
+            let index = RULE_CODES.len() + other_rule_codes.len();
+            (index < MAX_RULE_CODES).then(|| {
+                // Codes are only added once, and there are at most `MAX_RULE_CODES` of them, so leaking them is
+                // bounded.
+                other_rule_codes.push(Box::leak(code.to_owned().into_boxed_str()));
+                index
+            })
+        })?;
+        Some(Self(1 << index))
+    }
+
+    pub fn bits(self) -> u64 {
+        self.0
+    }
+
+    /// Returns the codes of the set, in the order of `rule_codes()`.
+    pub fn iter(self) -> impl Iterator<Item = &'static str> {
+        rule_codes()
+            .into_iter()
+            .enumerate()
+            .filter(move |(index, _)| self.0 & (1 << index) != 0)
+            .map(|(_, code)| code)
     }
+}
+
+fn find_other_rule_code(other_rule_codes: &[&str], code: &str) -> Option<usize> {
+    other_rule_codes
+        .iter()
+        .position(|rule_code| *rule_code == code)
+        .map(|index| RULE_CODES.len() + index)
+}
 
-    fn __repr__(&self) -> String {
-        format!(
-            "Location(file='{}', line={:?}, column={:?}, ignored_rule_codes={:?})",
-            self.file, self.line, self.column, self.ignored_rule_codes
-        )
+impl<'a> FromIterator<&'a str> for RuleCodes {
+    /// Collects codes into a set, leaving out the codes that cannot be stored, as reported by `from_code`.
+    fn from_iter<I: IntoIterator<Item = &'a str>>(codes: I) -> Self {
+        Self(codes.into_iter().fold(0, |mask, code| {
+            mask | Self::from_code(code).map_or(0, |rule_codes| rule_codes.0)
+        }))
     }
 }
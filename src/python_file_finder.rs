@@ -1,12 +1,20 @@
+use crate::excluded_paths::ExcludedPaths;
 use ignore::types::{Types, TypesBuilder};
-use ignore::{DirEntry, Walk, WalkBuilder};
-use path_slash::PathExt;
+use ignore::{WalkBuilder, WalkState};
 use pyo3::{Bound, IntoPyObject, PyAny, Python, pyfunction};
-use regex::Regex;
-use std::path::PathBuf;
+use rayon::prelude::*;
+use std::collections::{HashMap, HashSet};
+use std::fs;
+use std::path::{Path, PathBuf};
+use std::sync::mpsc::{self, Sender};
 
+/// Finds Python files (and notebooks, unless `ignore_notebooks` is set) in the given directories, and returns their
+/// paths sorted, so that the order does not depend on the order in which the file tree was walked.
+///
+/// Directories are walked with `walk_threads` threads. If it is 1, they are walked sequentially, on the current thread.
+/// If it is 0, the number of threads is chosen automatically, based on the number of available CPUs.
 #[pyfunction]
-#[pyo3(signature = (directories, exclude, extend_exclude, using_default_exclude, ignore_notebooks=false))]
+#[pyo3(signature = (directories, exclude, extend_exclude, using_default_exclude, ignore_notebooks=false, walk_threads=0))]
 pub fn find_python_files(
     py: Python<'_>,
     directories: Vec<PathBuf>,
@@ -14,29 +22,248 @@ pub fn find_python_files(
     extend_exclude: Vec<String>,
     using_default_exclude: bool,
     ignore_notebooks: bool,
+    walk_threads: usize,
 ) -> Bound<'_, PyAny> {
     let mut unique_directories = directories;
     unique_directories.dedup();
 
-    let python_files: Vec<_> = build_walker(
-        unique_directories.as_ref(),
-        [exclude, extend_exclude].concat().as_ref(),
+    let excluded_patterns = [exclude, extend_exclude].concat();
+
+    let mut python_files: Vec<String> = if walk_threads == 1 {
+        build_walker(
+            &unique_directories,
+            &excluded_patterns,
+            using_default_exclude,
+            ignore_notebooks,
+        )
+        .build()
+        .flatten()
+        .filter(|entry| entry.path().is_file())
+        .map(|entry| to_path_string(entry.path()))
+        .collect()
+    } else {
+        let (sender, receiver) = mpsc::channel();
+        send_python_files(
+            &unique_directories,
+            &excluded_patterns,
+            using_default_exclude,
+            ignore_notebooks,
+            walk_threads,
+            &sender,
+        );
+        drop(sender);
+
+        receiver.into_iter().collect()
+    };
+    python_files.sort_unstable();
+
+    // When directories overlap (e.g. `.` and `src`), or point to the same files through symbolic links, the same file
+    // is found several times, so only the first path of each file is kept.
+    let python_files = if unique_directories.len() > 1 {
+        deduplicate_files(python_files)
+    } else {
+        python_files
+    };
+
+    python_files.into_pyobject(py).unwrap()
+}
+
+/// Same as `find_python_files`, except that the directories that were walked are returned too, sorted, alongside the
+/// Python files, so that they can be watched for changes. Excluded and ignored directories are not walked, so they are
+/// left out.
+#[pyfunction]
+#[pyo3(signature = (directories, exclude, extend_exclude, using_default_exclude, ignore_notebooks=false, walk_threads=0))]
+pub fn find_python_files_and_directories(
+    directories: Vec<PathBuf>,
+    exclude: Vec<String>,
+    extend_exclude: Vec<String>,
+    using_default_exclude: bool,
+    ignore_notebooks: bool,
+    walk_threads: usize,
+) -> (Vec<String>, Vec<String>) {
+    let mut unique_directories = directories;
+    unique_directories.dedup();
+
+    let excluded_patterns = [exclude, extend_exclude].concat();
+    let (sender, receiver) = mpsc::channel();
+
+    build_walker(
+        &unique_directories,
+        &excluded_patterns,
         using_default_exclude,
         ignore_notebooks,
     )
+    .threads(walk_threads)
+    .build_parallel()
+    .run(|| {
+        let sender = sender.clone();
+        Box::new(move |entry| {
+            if let Ok(entry) = entry {
+                let is_directory = entry
+                    .file_type()
+                    .is_some_and(|file_type| file_type.is_dir());
+                if is_directory || entry.path().is_file() {
+                    // The receiver is only dropped once the walk is done.
+                    sender
+                        .send((to_path_string(entry.path()), is_directory))
+                        .unwrap();
+                }
+            }
+            WalkState::Continue
+        })
+    });
+    drop(sender);
+
+    let (mut walked_directories, mut python_files): (Vec<_>, Vec<_>) = receiver
+        .into_iter()
+        .partition(|(_, is_directory)| *is_directory);
+    python_files.sort_unstable();
+    walked_directories.sort_unstable();
+    walked_directories.dedup();
+
+    let python_files: Vec<String> = python_files.into_iter().map(|(path, _)| path).collect();
+    let python_files = if unique_directories.len() > 1 {
+        deduplicate_files(python_files)
+    } else {
+        python_files
+    };
+
+    (
+        python_files,
+        walked_directories
+            .into_iter()
+            .map(|(path, _)| path)
+            .collect(),
+    )
+}
+
+/// Keeps the files that `find_python_files` would find when walking the directories they are located in, given as pairs
+/// of a walked directory and a path relative to it, and returns their paths the same way `find_python_files` does.
+///
+/// Instead of walking the whole file tree, only the directories on the way from the walked directory to each file are
+/// listed, with the same walker, so that excluded paths, ignore files (e.g. `.gitignore`) and file types are applied
+/// the same way as for a full walk.
+#[pyfunction]
+#[pyo3(signature = (files, exclude, extend_exclude, using_default_exclude, ignore_notebooks=false))]
+pub fn filter_walked_files(
+    files: Vec<(PathBuf, PathBuf)>,
+    exclude: Vec<String>,
+    extend_exclude: Vec<String>,
+    using_default_exclude: bool,
+    ignore_notebooks: bool,
+) -> Vec<String> {
+    let excluded_patterns = [exclude, extend_exclude].concat();
+    // Entries found in each listed directory, and whether they are directories that the walker would descend into.
+    let mut listings: HashMap<PathBuf, HashMap<PathBuf, bool>> = HashMap::new();
+
+    files
+        .into_iter()
+        .filter_map(|(directory, relative_path)| {
+            let mut parent = directory;
+            let mut components = relative_path.components().peekable();
+
+            while let Some(component) = components.next() {
+                let path = parent.join(component);
+                let entries = listings.entry(parent).or_insert_with_key(|directory| {
+                    list_directory(
+                        directory,
+                        &excluded_patterns,
+                        using_default_exclude,
+                        ignore_notebooks,
+                    )
+                });
+
+                let is_directory = *entries.get(&path)?;
+                if components.peek().is_some() != is_directory {
+                    return None;
+                }
+                parent = path;
+            }
+
+            Some(to_path_string(&parent))
+        })
+        .collect()
+}
+
+/// Lists the entries of `directory` that the walker visits, mapped to whether they are directories.
+fn list_directory(
+    directory: &Path,
+    excluded_patterns: &[String],
+    use_git_ignore: bool,
+    ignore_notebooks: bool,
+) -> HashMap<PathBuf, bool> {
+    build_walker(
+        &[directory.to_path_buf()],
+        excluded_patterns,
+        use_git_ignore,
+        ignore_notebooks,
+    )
+    .max_depth(Some(1))
+    .build()
     .flatten()
-    .filter(|entry| entry.path().is_file())
-    .map(|entry| {
-        entry
-            .path()
-            .to_string_lossy()
-            .strip_prefix("./")
-            .unwrap_or(&entry.path().to_string_lossy())
-            .to_owned()
+    .filter(|entry| entry.depth() == 1)
+    .filter_map(|entry| {
+        let is_directory = entry
+            .file_type()
+            .is_some_and(|file_type| file_type.is_dir());
+        (is_directory || entry.path().is_file()).then(|| (entry.into_path(), is_directory))
     })
-    .collect();
+    .collect()
+}
 
-    python_files.into_pyobject(py).unwrap()
+/// Walks the given directories in parallel, and sends the path of each Python file (and notebook, unless
+/// `ignore_notebooks` is set) to `sender` as soon as it is found, so that files can be processed while the walk is still
+/// in progress. Files are sent in no particular order. Directories are walked with `walk_threads` threads, 0 meaning
+/// that the number of threads is chosen automatically.
+pub fn send_python_files(
+    directories: &[PathBuf],
+    excluded_patterns: &[String],
+    use_git_ignore: bool,
+    ignore_notebooks: bool,
+    walk_threads: usize,
+    sender: &Sender<String>,
+) {
+    build_walker(
+        directories,
+        excluded_patterns,
+        use_git_ignore,
+        ignore_notebooks,
+    )
+    .threads(walk_threads)
+    .build_parallel()
+    .run(|| {
+        let sender = sender.clone();
+        Box::new(move |entry| {
+            if let Ok(entry) = entry
+                && entry.path().is_file()
+                && sender.send(to_path_string(entry.path())).is_err()
+            {
+                // The receiving end hung up, so there is no point in walking further.
+                return WalkState::Quit;
+            }
+            WalkState::Continue
+        })
+    });
+}
+
+fn to_path_string(path: &Path) -> String {
+    let path_str = path.to_string_lossy();
+    path_str.strip_prefix("./").unwrap_or(&path_str).to_owned()
+}
+
+/// Removes files that point to the same file as a previous one, comparing their canonical paths.
+fn deduplicate_files(files: Vec<String>) -> Vec<String> {
+    let canonical_paths: Vec<PathBuf> = files
+        .par_iter()
+        .map(|file| fs::canonicalize(file).unwrap_or_else(|_| PathBuf::from(file)))
+        .collect();
+
+    let mut seen = HashSet::with_capacity(files.len());
+    files
+        .into_iter()
+        .zip(canonical_paths)
+        .filter_map(|(file, canonical_path)| seen.insert(canonical_path).then_some(file))
+        .collect()
 }
 
 fn build_walker(
@@ -44,7 +271,7 @@ fn build_walker(
     excluded_patterns: &[String],
     use_git_ignore: bool,
     ignore_notebooks: bool,
-) -> Walk {
+) -> WalkBuilder {
     let (first_directory, additional_directories) = directories.split_first().unwrap();
 
     let mut walk_builder = WalkBuilder::new(first_directory);
@@ -52,18 +279,16 @@ fn build_walker(
         walk_builder.add(path);
     }
 
-    let re: Option<Regex> = if excluded_patterns.is_empty() {
-        None
-    } else {
-        Some(Regex::new(format!(r"^({})", excluded_patterns.join("|")).as_str()).unwrap())
-    };
+    let excluded_paths = ExcludedPaths::new(excluded_patterns);
 
     walk_builder
         .types(build_types(ignore_notebooks).unwrap())
         .standard_filters(use_git_ignore)
         .hidden(false)
-        .filter_entry(move |entry| entry_satisfies_predicate(entry, re.as_ref()))
-        .build()
+        // Excluded directories are pruned, so that the entries they contain are never visited.
+        .filter_entry(move |entry| !excluded_paths.is_excluded(entry.path()));
+
+    walk_builder
 }
 
 fn build_types(ignore_notebooks: bool) -> Result<Types, ignore::Error> {
@@ -78,14 +303,3 @@ fn build_types(ignore_notebooks: bool) -> Result<Types, ignore::Error> {
 
     types_builder.build()
 }
-
-fn entry_satisfies_predicate(entry: &DirEntry, regex: Option<&Regex>) -> bool {
-    if regex.is_none() {
-        return true;
-    }
-
-    let path_str = entry.path().to_slash_lossy();
-    !regex
-        .unwrap()
-        .is_match(path_str.strip_prefix("./").unwrap_or(&path_str).as_ref())
-}
@@ -35,6 +35,17 @@ impl ImportVisitor {
         self.imports
     }
 
+    /// Adds an import of `module` at `range`. The name of the module is only allocated the first time it is imported in
+    /// the file.
+    fn add_import(&mut self, module: &str, range: TextRange) {
+        match self.imports.get_mut(module) {
+            Some(ranges) => ranges.push(range),
+            None => {
+                self.imports.insert(module.to_owned(), vec![range]);
+            }
+        }
+    }
+
     /// Handles regular import statements (e.g., `import foo` or `import foo as bar`).
     ///
     /// Processes each name in the import statement (dealiasing if needed), and adds the
@@ -45,11 +56,7 @@ impl ImportVisitor {
     /// indicate how we should look out for dynamic imports in the code that follows.
     fn handle_import(&mut self, import_stmt: &StmtImport) {
         for alias in &import_stmt.names {
-            let top_level_module = get_top_level_module_name(alias.name.as_str());
-            self.imports
-                .entry(top_level_module)
-                .or_default()
-                .push(alias.range);
+            self.add_import(get_top_level_module_name(alias.name.as_str()), alias.range);
 
             if alias.name.as_str() == "importlib" {
                 let name = alias
@@ -85,10 +92,10 @@ impl ImportVisitor {
             && import_from_stmt.level == 0
         {
             let module_name = module.as_str();
-            self.imports
-                .entry(get_top_level_module_name(module_name))
-                .or_default()
-                .push(import_from_stmt.range);
+            self.add_import(
+                get_top_level_module_name(module_name),
+                import_from_stmt.range,
+            );
 
             if module_name == "importlib" {
                 for alias in &import_from_stmt.names {
@@ -132,11 +139,8 @@ impl ImportVisitor {
             if is_import_module
                 && let Some(Expr::StringLiteral(string_literal)) = call_expr.arguments.args.first()
             {
-                let top_level_module = get_top_level_module_name(&string_literal.value.to_string());
-                self.imports
-                    .entry(top_level_module)
-                    .or_default()
-                    .push(expr_stmt.range);
+                let module_name = string_literal.value.to_string();
+                self.add_import(get_top_level_module_name(&module_name), expr_stmt.range);
             }
         }
     }
@@ -158,12 +162,8 @@ impl<'a> Visitor<'a> for ImportVisitor {
 
 /// Extracts the top-level module name from a potentially nested module path.
 /// e.g. when a `module_name` is `foo.bar`, this returns `foo`.
-fn get_top_level_module_name(module_name: &str) -> String {
-    module_name
-        .split('.')
-        .next()
-        .unwrap_or(module_name)
-        .to_owned()
+fn get_top_level_module_name(module_name: &str) -> &str {
+    module_name.split('.').next().unwrap_or(module_name)
 }
 
 /// Checks if we are in a block guarded by `typing.TYPE_CHECKING` or an alias thereof.
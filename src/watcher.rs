@@ -0,0 +1,133 @@
+use notify::{Event, EventKind, RecommendedWatcher, RecursiveMode, Watcher};
+use pyo3::exceptions::PyIOError;
+use pyo3::prelude::*;
+use std::collections::{BTreeSet, HashSet};
+use std::path::PathBuf;
+use std::sync::Mutex;
+use std::sync::mpsc::{self, Receiver, RecvTimeoutError};
+use std::time::Duration;
+
+/// Interval at which pending signals (e.g. `Ctrl+C`) are handled while waiting for changes, as Python only handles them
+/// once control returns to it.
+const SIGNAL_CHECK_INTERVAL: Duration = Duration::from_millis(100);
+
+/// Watches directories for changes, using the file system notifications of the operating system (e.g. inotify on
+/// Linux), so that changes are reported as soon as they happen, without polling the files.
+///
+/// Directories are watched non-recursively, so that only the directories given to `watch` (e.g. the ones visited when
+/// walking the file tree, which leaves out excluded and ignored directories) are watched.
+#[pyclass(frozen)]
+pub struct FileWatcher {
+    watcher: Mutex<RecommendedWatcher>,
+    receiver: Mutex<Receiver<notify::Result<Event>>>,
+    directories: Mutex<HashSet<PathBuf>>,
+}
+
+#[pymethods]
+impl FileWatcher {
+    #[new]
+    fn new() -> PyResult<Self> {
+        let (sender, receiver) = mpsc::channel();
+        let watcher = notify::recommended_watcher(sender).map_err(to_py_err)?;
+
+        Ok(Self {
+            watcher: Mutex::new(watcher),
+            receiver: Mutex::new(receiver),
+            directories: Mutex::new(HashSet::new()),
+        })
+    }
+
+    /// Sets the directories to watch: directories that were not watched yet start being watched, and directories that
+    /// are no longer given stop being watched. Directories that do not exist anymore are skipped.
+    fn watch(&self, directories: Vec<PathBuf>) -> PyResult<()> {
+        let mut watcher = self.watcher.lock().unwrap();
+        let mut watched_directories = self.directories.lock().unwrap();
+        let directories: HashSet<PathBuf> = directories.into_iter().collect();
+
+        for directory in watched_directories.difference(&directories) {
+            // The directory may have been deleted, in which case it is no longer watched anyway.
+            let _ = watcher.unwatch(directory);
+        }
+
+        for directory in directories.difference(&watched_directories) {
+            match watcher.watch(directory, RecursiveMode::NonRecursive) {
+                Err(notify::Error {
+                    kind: notify::ErrorKind::PathNotFound,
+                    ..
+                }) => {}
+                result => result.map_err(to_py_err)?,
+            }
+        }
+
+        *watched_directories = directories;
+        Ok(())
+    }
+
+    /// Blocks until entries of the watched directories are created, modified or deleted, then waits until no change
+    /// happened for `debounce_delay` seconds, so that many changes made at once (e.g. when switching branches) are
+    /// reported together. Returns the sorted paths of the entries that changed, alongside whether the watched
+    /// directories need to be walked again, because changes may have been missed (e.g. when too many happened at once).
+    fn wait(&self, py: Python<'_>, debounce_delay: f64) -> PyResult<(Vec<String>, bool)> {
+        let mut receiver = self.receiver.lock().unwrap();
+        let mut changes = Changes::default();
+
+        while changes.is_empty() {
+            let receiver = &mut *receiver;
+            match py.detach(move || receiver.recv_timeout(SIGNAL_CHECK_INTERVAL)) {
+                Ok(result) => changes.add(result),
+                Err(RecvTimeoutError::Timeout) => py.check_signals()?,
+                Err(RecvTimeoutError::Disconnected) => {
+                    return Err(PyIOError::new_err("The file watcher stopped unexpectedly."));
+                }
+            }
+        }
+
+        let debounce_delay = Duration::from_secs_f64(debounce_delay);
+        loop {
+            let receiver = &mut *receiver;
+            match py.detach(move || receiver.recv_timeout(debounce_delay)) {
+                Ok(result) => changes.add(result),
+                Err(_) => break,
+            }
+            py.check_signals()?;
+        }
+
+        Ok((
+            changes
+                .paths
+                .into_iter()
+                .map(|path| path.to_string_lossy().into_owned())
+                .collect(),
+            changes.need_rescan,
+        ))
+    }
+}
+
+#[derive(Default)]
+struct Changes {
+    paths: BTreeSet<PathBuf>,
+    need_rescan: bool,
+}
+
+impl Changes {
+    fn is_empty(&self) -> bool {
+        self.paths.is_empty() && !self.need_rescan
+    }
+
+    fn add(&mut self, result: notify::Result<Event>) {
+        match result {
+            Ok(event) => {
+                self.need_rescan |= event.need_rescan();
+                if !matches!(event.kind, EventKind::Access(_)) {
+                    self.paths.extend(event.paths);
+                }
+            }
+            // Events may have been lost, so the state of the watched directories is unknown.
+            Err(_) => self.need_rescan = true,
+        }
+    }
+}
+
+fn to_py_err(error: notify::Error) -> PyErr {
+    PyIOError::new_err(format!("Could not watch files for changes: {error}"))
+}
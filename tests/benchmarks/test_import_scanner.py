@@ -0,0 +1,55 @@
+"""
+Benchmarks of the extraction of imports with the experimental import scanner, compared to parsing files, on generated
+files containing large literals. Run them with `make benchmark`.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from deptry.imports.extract import get_import_table_from_list_of_files
+from tests.benchmarks.utils import ROUNDS, best_time
+from tests.utils import run_within_dir
+
+FILES = 20
+IMPORTS_PER_FILE = 10
+ENTRIES_PER_FILE = 100_000
+
+pytestmark = pytest.mark.benchmark
+
+
+def _create_files(root: Path) -> list[Path]:
+    """Generated files of `IMPORTS_PER_FILE` imports, followed by a dictionary literal of `ENTRIES_PER_FILE` entries."""
+    imports = "".join(f"import module_{index}\n" for index in range(IMPORTS_PER_FILE))
+    entries = "".join(f"    'key_{index}': ({index}, 1.5e-3, 'value_{index}'),\n" for index in range(ENTRIES_PER_FILE))
+
+    root.mkdir()
+    paths = [root / f"generated_{index}.py" for index in range(FILES)]
+    for path in paths:
+        path.write_text(f"{imports}\nDATA = {{\n{entries}}}\n")
+    return paths
+
+
+def test_import_scanner(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with run_within_dir(tmp_path):
+        paths = _create_files(Path("generated"))
+
+        parsed_import_table = get_import_table_from_list_of_files(paths)
+        scanned_import_table = get_import_table_from_list_of_files(paths, experimental_import_scanner=True)
+        assert scanned_import_table.modules == parsed_import_table.modules
+
+        parse_timing = best_time(lambda: get_import_table_from_list_of_files(paths))
+        scan_timing = best_time(lambda: get_import_table_from_list_of_files(paths, experimental_import_scanner=True))
+
+    with capsys.disabled():
+        sys.stdout.write(
+            f"\n{FILES} generated files of {ENTRIES_PER_FILE} literal entries, best of {ROUNDS} rounds: parsed in"
+            f" {parse_timing * 1000:.1f} ms, scanned in {scan_timing * 1000:.1f} ms"
+            f" ({parse_timing / scan_timing:.1f}x faster)\n"
+        )
+
+    # The scanner only splits files in tokens instead of building their syntax tree, so it should be much faster.
+    assert scan_timing * 5 < parse_timing
@@ -0,0 +1,57 @@
+"""
+Benchmarks of the extraction of imports from files with inline `# deptry: ignore` comments, to measure the overhead of
+the comments on each file. Run them with `make benchmark`.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from deptry.imports.extract import get_import_table_from_list_of_files
+from tests.benchmarks.utils import ROUNDS, best_time
+from tests.utils import run_within_dir
+
+FILES = 2000
+IMPORTS_PER_FILE = 50
+LINES_PER_FILE = 500
+
+pytestmark = pytest.mark.benchmark
+
+
+def _create_files(root: Path, comment: str) -> list[Path]:
+    """Files of `LINES_PER_FILE` lines, starting with `IMPORTS_PER_FILE` imports followed by `comment`."""
+    imports = "".join(f"import module_{index}{comment}\n" for index in range(IMPORTS_PER_FILE))
+    body = "x = 1  # A comment that is not an ignore comment.\n" * (LINES_PER_FILE - IMPORTS_PER_FILE)
+
+    root.mkdir()
+    paths = [root / f"module_{index}.py" for index in range(FILES)]
+    for path in paths:
+        path.write_text(imports + body)
+    return paths
+
+
+@pytest.mark.parametrize(
+    "comment",
+    ["", "  # deptry: ignore", "  # deptry: ignore[DEP001,DEP003]"],
+    ids=["no comments", "ignore all", "ignore codes"],
+)
+def test_inline_ignores(comment: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with run_within_dir(tmp_path):
+        baseline_paths = _create_files(Path("baseline"), "")
+        paths = _create_files(Path("comments"), comment)
+
+        baseline_timing = best_time(lambda: get_import_table_from_list_of_files(baseline_paths))
+        timing = best_time(lambda: get_import_table_from_list_of_files(paths))
+
+    with capsys.disabled():
+        overhead = (timing - baseline_timing) / FILES * 1_000_000
+        sys.stdout.write(
+            f"\n{FILES} files of {IMPORTS_PER_FILE} imports with {comment.strip() or 'no'} comments, best of {ROUNDS}"
+            f" rounds: {timing * 1000:.1f} ms ({overhead:+.1f} µs per file compared to files without comments)\n"
+        )
+
+    # Comments are only looked for on lines with imports, so they should barely slow down extraction.
+    assert timing < baseline_timing * 1.5
@@ -0,0 +1,75 @@
+"""
+Benchmarks of the search of Python files on synthetic file trees, comparing a sequential walk of the directories to a
+parallel one. Run them with `make benchmark`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from deptry.python_file_finder import get_all_python_files_in
+from tests.benchmarks.utils import ROUNDS, best_time
+from tests.utils import run_within_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+pytestmark = pytest.mark.benchmark
+
+
+def _create_wide_tree(root: Path) -> None:
+    """500 sibling directories of 50 Python files and 50 other files each."""
+    for directory_index in range(500):
+        directory = root / f"package_{directory_index}"
+        directory.mkdir(parents=True)
+        for file_index in range(50):
+            (directory / f"module_{file_index}.py").touch()
+            (directory / f"data_{file_index}.json").touch()
+
+
+def _create_deep_tree(root: Path) -> None:
+    """100 chains of 50 nested directories, with 5 Python files and 5 other files per directory."""
+    for chain_index in range(100):
+        directory = root / f"chain_{chain_index}"
+        for depth in range(50):
+            directory /= f"level_{depth}"
+            directory.mkdir(parents=True)
+            for file_index in range(5):
+                (directory / f"module_{file_index}.py").touch()
+                (directory / f"data_{file_index}.txt").touch()
+
+
+@pytest.mark.parametrize("create_tree", [_create_wide_tree, _create_deep_tree], ids=["wide", "deep"])
+def test_walk_threads(create_tree: Callable[[Path], None], tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    create_tree(tmp_path)
+
+    with run_within_dir(tmp_path):
+        results = {}
+        timings = {}
+        for walk_threads in (1, 2, 4, 0):
+
+            def find(walk_threads: int = walk_threads) -> None:
+                results[walk_threads] = get_all_python_files_in(
+                    (Path(),), exclude=(), extend_exclude=(), using_default_exclude=True, walk_threads=walk_threads
+                )
+
+            timings[walk_threads] = best_time(find)
+
+    # Files are found in the same order, whatever the number of threads.
+    assert results[0] == results[1] == results[2] == results[4]
+
+    with capsys.disabled():
+        sys.stdout.write(f"\n{len(results[1])} Python files found, best of {ROUNDS} rounds:\n")
+        for walk_threads, timing in timings.items():
+            sys.stdout.write(
+                f"  walk_threads={walk_threads}: {timing * 1000:.1f} ms ({timings[1] / timing:.2f}x walk_threads=1)\n"
+            )
+
+    # Walking directories in parallel only pays off with several CPUs to run the threads on.
+    if (os.cpu_count() or 1) > 1:
+        assert timings[0] < timings[1]
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ROUNDS = 5
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """Run `function` `ROUNDS` times, and return the duration of the fastest run, in seconds."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import json
+import signal
 import sys
+import threading
+import time
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
+import fastjsonschema  # type: ignore[import-untyped]
 import pytest
 from click.testing import CliRunner
 from inline_snapshot import snapshot
@@ -16,6 +21,8 @@ from tests.utils import get_issues_report
 if TYPE_CHECKING:
     from tests.utils import PoetryVenvFactory
 
+SARIF_SCHEMA_PATH = Path("tests/fixtures/sarif-schema-2.1.0.json").resolve()
+
 
 @pytest.mark.xdist_group(name=Project.EXAMPLE)
 def test_cli_returns_error(poetry_venv_factory: PoetryVenvFactory) -> None:
@@ -237,6 +244,103 @@ For more information, see the documentation: https://deptry.com/
         ])
 
 
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_with_json_lines_output(poetry_venv_factory: PoetryVenvFactory) -> None:
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        issue_report = f"{uuid.uuid4()}.jsonl"
+        result = virtual_env.run_deptry(f". -o {issue_report} --json-output-format jsonl")
+
+        assert result.returncode == 1
+        assert [json.loads(line) for line in Path(issue_report).read_text().splitlines()] == snapshot([
+            {
+                "error": {"code": "DEP002", "message": "'isort' defined as a dependency but not used in the codebase"},
+                "module": "isort",
+                "location": {"file": "pyproject.toml", "line": None, "column": None},
+            },
+            {
+                "error": {
+                    "code": "DEP002",
+                    "message": "'requests' defined as a dependency but not used in the codebase",
+                },
+                "module": "requests",
+                "location": {"file": "pyproject.toml", "line": None, "column": None},
+            },
+            {
+                "error": {"code": "DEP004", "message": "'black' imported but declared as a dev dependency"},
+                "module": "black",
+                "location": {"file": "src/main.py", "line": 4, "column": 8},
+            },
+            {
+                "error": {"code": "DEP001", "message": "'white' imported but missing from the dependency definitions"},
+                "module": "white",
+                "location": {"file": "src/main.py", "line": 6, "column": 8},
+            },
+        ])
+
+
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_with_compact_json_output(poetry_venv_factory: PoetryVenvFactory) -> None:
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        issue_report = f"{uuid.uuid4()}.json"
+        result = virtual_env.run_deptry(f". -o {issue_report} --json-output-format json-compact")
+
+        assert result.returncode == 1
+        report = Path(issue_report).read_text()
+        assert "\n" not in report
+        assert [violation["module"] for violation in json.loads(report)] == ["isort", "requests", "black", "white"]
+
+
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_with_sarif_output(poetry_venv_factory: PoetryVenvFactory) -> None:
+    validate = fastjsonschema.compile(json.loads(SARIF_SCHEMA_PATH.read_text()))
+
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        issue_report = f"{uuid.uuid4()}.sarif"
+        result = virtual_env.run_deptry(f". --sarif-output {issue_report}")
+
+        assert result.returncode == 1
+        report = json.loads(Path(issue_report).read_text())
+        validate(report)
+
+        run = report["runs"][0]
+        assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["DEP001", "DEP002", "DEP004"]
+        assert run["artifacts"] == [{"location": {"uri": "pyproject.toml"}}, {"location": {"uri": "src/main.py"}}]
+        assert [
+            (
+                sarif_result["ruleId"],
+                sarif_result["message"]["text"],
+                sarif_result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"],
+                sarif_result["locations"][0]["physicalLocation"]["region"],
+            )
+            for sarif_result in run["results"]
+        ] == snapshot([
+            (
+                "DEP002",
+                "'isort' defined as a dependency but not used in the codebase",
+                "pyproject.toml",
+                {"startLine": 1},
+            ),
+            (
+                "DEP002",
+                "'requests' defined as a dependency but not used in the codebase",
+                "pyproject.toml",
+                {"startLine": 1},
+            ),
+            (
+                "DEP004",
+                "'black' imported but declared as a dev dependency",
+                "src/main.py",
+                {"startLine": 4, "startColumn": 8},
+            ),
+            (
+                "DEP001",
+                "'white' imported but missing from the dependency definitions",
+                "src/main.py",
+                {"startLine": 6, "startColumn": 8},
+            ),
+        ])
+
+
 @pytest.mark.xdist_group(name=Project.EXAMPLE)
 def test_cli_with_github_output(poetry_venv_factory: PoetryVenvFactory) -> None:
     with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
@@ -283,6 +387,98 @@ For more information, see the documentation: https://deptry.com/
 """)
 
 
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_with_baseline(poetry_venv_factory: PoetryVenvFactory) -> None:
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        baseline = f"{uuid.uuid4()}.txt"
+        result = virtual_env.run_deptry(f". --baseline {baseline} --update-baseline")
+
+        assert result.returncode == 0
+        assert Path(baseline).read_text() == snapshot("""\
+DEP001 white src/main.py
+DEP002 isort pyproject.toml
+DEP002 requests pyproject.toml
+DEP004 black src/main.py
+""")
+
+        result = virtual_env.run_deptry(f". --baseline {baseline}")
+
+        assert result.returncode == 0
+        assert result.stderr == snapshot("""\
+Scanning 2 files...
+
+Success! No dependency issues found.
+""")
+
+        main_py = Path("src/main.py")
+        main_py_content = main_py.read_text()
+        main_py.write_text(f"{main_py_content}import green\n")
+        try:
+            result = virtual_env.run_deptry(f". --baseline {baseline}")
+        finally:
+            # The project is shared with the other tests of the group, so it is restored as it was.
+            main_py.write_text(main_py_content)
+
+        assert result.returncode == 1
+        assert result.stderr == snapshot("""\
+Scanning 2 files...
+
+src/main.py:8:8: DEP001 'green' imported but missing from the dependency definitions
+Found 1 dependency issue.
+
+For more information, see the documentation: https://deptry.com/
+""")
+
+
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+@pytest.mark.skipif(sys.platform == "win32", reason="Processes cannot be interrupted with SIGINT on Windows.")
+def test_cli_with_watch(poetry_venv_factory: PoetryVenvFactory) -> None:
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        process = virtual_env.start_deptry(". --watch")
+        # Make sure that the test does not hang if deptry never reports the change.
+        timer = threading.Timer(60, process.kill)
+        timer.start()
+
+        main_py = Path("src/main.py")
+        main_py_content = main_py.read_text()
+        try:
+            assert process.stderr is not None
+            lines = _read_lines_until(process.stderr, "Watching for changes... Press Ctrl+C to stop.")
+            assert "Found 4 dependency issues." in lines
+
+            # Let the watcher start watching the files before changing them.
+            time.sleep(2)
+            main_py.write_text(f"{main_py_content}import green\n")
+
+            lines = _read_lines_until(process.stderr, "Found 5 dependency issues.")
+            assert lines[-4:-1] == [
+                "",
+                "+ src/main.py:8:8: DEP001 'green' imported but missing from the dependency definitions",
+                "1 new, 0 resolved.",
+            ]
+        finally:
+            # The project is shared with the other tests of the group, so it is restored as it was.
+            main_py.write_text(main_py_content)
+            process.send_signal(signal.SIGINT)
+            _, stderr = process.communicate()
+            timer.cancel()
+
+        assert process.returncode == 1
+        assert "Stopped watching for changes." in stderr
+
+
+def _read_lines_until(stream: IO[str], expected_line: str) -> list[str]:
+    """Read lines from `stream` until `expected_line` is read, and return all the lines read, without line breaks."""
+    lines: list[str] = []
+
+    for line in stream:
+        lines.append(line.rstrip("\n"))
+        if lines[-1] == expected_line:
+            return lines
+
+    pytest.fail(f"Expected line {expected_line!r} not found in output:\n" + "\n".join(lines))
+
+
 def test_cli_config_does_not_supress_output(poetry_venv_factory: PoetryVenvFactory) -> None:
     """Regression test that ensures that passing `--config` option does not suppress output."""
     with poetry_venv_factory(Project.WITHOUT_DEPTRY_OPTION) as virtual_env:
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from inline_snapshot import snapshot
+
+from tests.functional.utils import Project
+
+if TYPE_CHECKING:
+    from tests.utils import PoetryVenvFactory
+
+
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_batch(poetry_venv_factory: PoetryVenvFactory) -> None:
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        result = virtual_env.run_deptry_batch(".")
+
+        assert result.returncode == 1
+        assert result.stderr == snapshot("""\
+
+.
+Scanning 2 files...
+
+pyproject.toml: DEP002 'isort' defined as a dependency but not used in the codebase
+pyproject.toml: DEP002 'requests' defined as a dependency but not used in the codebase
+src/main.py:4:8: DEP004 'black' imported but declared as a dev dependency
+src/main.py:6:8: DEP001 'white' imported but missing from the dependency definitions
+Found 4 dependency issues.
+
+For more information, see the documentation: https://deptry.com/
+
+Found dependency issues in 1 of 1 projects.
+""")
+
+
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_batch_with_manifest_and_options(poetry_venv_factory: PoetryVenvFactory) -> None:
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        manifest = Path("projects.txt")
+        manifest.write_text("# Projects to check.\n.\n")
+        try:
+            result = virtual_env.run_deptry_batch(
+                "projects.txt --per-rule-ignores DEP001=white,DEP002=isort|pkginfo|requests,DEP004=black"
+            )
+        finally:
+            # The project is shared with the other tests of the group, so it is restored as it was.
+            manifest.unlink()
+
+        assert result.returncode == 0
+        assert result.stderr == snapshot("""\
+
+.
+Scanning 2 files...
+
+Success! No dependency issues found.
+
+No dependency issues found in 1 projects.
+""")
+
+
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_batch_with_nested_project(poetry_venv_factory: PoetryVenvFactory) -> None:
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        nested_project = Path("packages/nested")
+        nested_project.mkdir(parents=True)
+        (nested_project / "requirements.txt").write_text("white\n")
+        (nested_project / "main.py").write_text("import white\n")
+        try:
+            result = virtual_env.run_deptry_batch(".")
+        finally:
+            # The project is shared with the other tests of the group, so it is restored as it was.
+            shutil.rmtree("packages")
+
+        lines = result.stderr.splitlines()
+
+        assert result.returncode == 1
+        # Files of the nested project are only checked as part of the nested project, where 'white' is a dependency.
+        assert "src/main.py:6:8: DEP001 'white' imported but missing from the dependency definitions" in lines
+        assert lines[lines.index(str(nested_project)) :] == [
+            str(nested_project),
+            "Scanning 1 file...",
+            "",
+            "Success! No dependency issues found.",
+            "",
+            "Found dependency issues in 1 of 2 projects.",
+        ]
+
+
+@pytest.mark.xdist_group(name=Project.EXAMPLE)
+def test_cli_with_directory_named_batch(poetry_venv_factory: PoetryVenvFactory) -> None:
+    """Regression test that ensures that a directory named 'batch' can be scanned, as batch mode has its own command."""
+    with poetry_venv_factory(Project.EXAMPLE) as virtual_env:
+        batch_directory = Path("batch")
+        batch_directory.mkdir()
+        (batch_directory / "main.py").write_text("import white\n")
+        try:
+            result = virtual_env.run_deptry("batch")
+        finally:
+            # The project is shared with the other tests of the group, so it is restored as it was.
+            shutil.rmtree(batch_directory)
+
+        assert result.returncode == 1
+        assert result.stderr.startswith("Scanning 1 file...\n")
+        assert "batch/main.py:1:8: DEP001 'white' imported but missing from the dependency definitions" in result.stderr
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.imports.cache import load_import_cache, save_import_cache
+from deptry.imports.extract import get_import_table_from_list_of_files, get_imported_modules_from_list_of_files
+from deptry.imports.location import Location
+from deptry.rust import ImportCache
+from tests.utils import run_within_dir
+
+if TYPE_CHECKING:
+    from _pytest.logging import LogCaptureFixture
+
+
+def _run_with_cache(files: list[Path], cache_dir: Path) -> dict[str, list[Location]]:
+    cache = load_import_cache(cache_dir)
+    result = get_imported_modules_from_list_of_files(files, cache)
+    save_import_cache(cache, cache_dir)
+    return result
+
+
+def test_import_cache_is_written(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+
+        assert _run_with_cache([Path("file.py")], Path(".deptry_cache")) == {"foo": [Location(Path("file.py"), 1, 8)]}
+
+        assert (Path(".deptry_cache") / ".gitignore").read_text().endswith("*\n")
+        assert len(load_import_cache(Path(".deptry_cache"))) == 1
+
+
+def test_import_cache_is_used_for_unchanged_files(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+        _run_with_cache([Path("file.py")], Path(".deptry_cache"))
+
+        # Alter the cached imports, to check that they are used instead of parsing the file again.
+        cache_file = Path(".deptry_cache/imports.json")
+        cache_content = json.loads(cache_file.read_text())
+        cache_content["files"]["file.py"]["imports"] = {"bar": [[3, 1, []]]}
+        cache_file.write_text(json.dumps(cache_content))
+
+        assert _run_with_cache([Path("file.py")], Path(".deptry_cache")) == {"bar": [Location(Path("file.py"), 3, 1)]}
+
+
+def test_import_cache_is_invalidated_for_modified_files(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+        _run_with_cache([Path("file.py")], Path(".deptry_cache"))
+
+        Path("file.py").write_text("import foo\nimport bar")
+
+        assert _run_with_cache([Path("file.py")], Path(".deptry_cache")) == {
+            "bar": [Location(Path("file.py"), 2, 8)],
+            "foo": [Location(Path("file.py"), 1, 8)],
+        }
+
+
+def test_import_cache_entries_of_scanned_files_are_not_used_without_the_scanner(
+    tmp_path: Path, caplog: LogCaptureFixture
+) -> None:
+    with run_within_dir(tmp_path):
+        # The scanner does not detect the syntax error of this file, but the parser does.
+        Path("file.py").write_text("import foo\nx = = 1\n")
+        cache = load_import_cache(Path(".deptry_cache"))
+        assert get_import_table_from_list_of_files(
+            [Path("file.py")], cache, experimental_import_scanner=True
+        ).modules == ["foo"]
+        save_import_cache(cache, Path(".deptry_cache"))
+
+        with caplog.at_level(logging.WARNING):
+            assert _run_with_cache([Path("file.py")], Path(".deptry_cache")) == {}
+
+        assert "Skipping processing of file.py" in caplog.text
+
+
+def test_import_cache_entries_of_parsed_files_are_used_with_the_scanner(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+        _run_with_cache([Path("file.py")], Path(".deptry_cache"))
+
+        # Alter the cached imports, to check that they are used instead of scanning the file.
+        cache_file = Path(".deptry_cache/imports.json")
+        cache_content = json.loads(cache_file.read_text())
+        cache_content["files"]["file.py"]["imports"] = {"bar": [[3, 1, []]]}
+        cache_file.write_text(json.dumps(cache_content))
+
+        cache = load_import_cache(Path(".deptry_cache"))
+        import_table = get_import_table_from_list_of_files([Path("file.py")], cache, experimental_import_scanner=True)
+        assert import_table.modules == ["bar"]
+        assert list(import_table.get_locations(0)) == [Location(Path("file.py"), 3, 1)]
+
+
+def test_import_cache_drops_files_not_scanned_anymore(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+        Path("other.py").write_text("import bar")
+        _run_with_cache([Path("file.py"), Path("other.py")], Path(".deptry_cache"))
+
+        _run_with_cache([Path("file.py")], Path(".deptry_cache"))
+
+        assert len(load_import_cache(Path(".deptry_cache"))) == 1
+
+
+def test_import_cache_is_invalidated_for_another_version(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+        _run_with_cache([Path("file.py")], Path(".deptry_cache"))
+
+        assert len(ImportCache(Path(".deptry_cache"), "0.0.0")) == 0
+
+
+def test_import_cache_without_directory(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+
+        cache = load_import_cache(None)
+        get_imported_modules_from_list_of_files([Path("file.py")], cache)
+        save_import_cache(cache, None)
+
+        assert list(Path().iterdir()) == [Path("file.py")]
+
+
+def test_save_import_cache_error(tmp_path: Path, caplog: LogCaptureFixture) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+        Path(".deptry_cache").write_text("")
+
+        with caplog.at_level(logging.WARNING):
+            _run_with_cache([Path("file.py")], Path(".deptry_cache"))
+
+        assert "Could not write import cache to .deptry_cache" in caplog.text
@@ -9,8 +9,14 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from deptry.imports.extract import get_imported_modules_from_list_of_files
+from deptry.imports.extract import (
+    get_import_table_from_directories,
+    get_import_table_from_list_of_files,
+    get_imported_modules_from_list_of_files,
+)
 from deptry.imports.location import Location
+from deptry.rust import ParsedFiles
+from deptry.violations.engine import ViolationsEngine
 from tests.utils import run_within_dir
 
 if TYPE_CHECKING:
@@ -244,6 +250,9 @@ def test_import_parser_with_inline_ignores() -> None:
         ("import foo  # deptry: ignore[DEP001]  # noqa: F401", 8, ("DEP001",)),
         ("import foo  # noqa: F401  # deptry: ignore[DEP001]", 8, ("DEP001",)),
         ("from foo import bar  # deptry: ignore[DEP001]", 1, ("DEP001",)),
+        ("import foo  # deptry: ignore[DEP003,DEP001]", 8, ("DEP001", "DEP003")),
+        ("import foo  # deptry: ignore[DEP999]", 8, ()),
+        ("import foo  #\n# deptry: ignore", 8, ()),
     ],
 )
 def test_import_parser_inline_ignore_variants(
@@ -259,3 +268,148 @@ def test_import_parser_inline_ignore_variants(
         assert result == {
             "foo": [Location(file_path, 1, expected_column, ignored_rule_codes=expected_ignored_rule_codes)]
         }
+
+
+def test_import_parser_keeps_custom_rule_codes(tmp_path: Path, caplog: LogCaptureFixture) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo  # deptry: ignore[DEP001,CUS001]\nimport bar  # deptry: ignore[CUS001]")
+
+        with caplog.at_level(logging.WARNING):
+            result = get_imported_modules_from_list_of_files([Path("file.py")])
+
+        # Codes of rules that are not built-in (e.g. custom rules) are kept, so that their violations can be ignored.
+        assert result == {
+            "bar": [Location(Path("file.py"), 2, 8, ignored_rule_codes=("CUS001",))],
+            "foo": [Location(Path("file.py"), 1, 8, ignored_rule_codes=("DEP001", "CUS001"))],
+        }
+        assert caplog.messages == []
+
+
+def test_import_table_rule_codes_match_violations() -> None:
+    rule_codes = get_import_table_from_list_of_files([]).rule_codes
+
+    # Built-in rule codes come first, followed by the other codes found in inline comments so far.
+    assert set(rule_codes[: len(ViolationsEngine.FINDERS) + 1]) == {
+        "ALL",
+        *(finder.violation.error_code for finder in ViolationsEngine.FINDERS),
+    }
+
+
+def test_import_parser_parses_files_with_several_paths_once(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text("import foo")
+        Path("link.py").symlink_to("file.py")
+
+        parsed_files = ParsedFiles()
+
+        import_table = get_import_table_from_list_of_files(
+            [Path("file.py"), Path("link.py")], parsed_files=parsed_files
+        )
+
+        assert import_table.modules == ["foo"]
+        assert list(import_table.get_locations(0)) == [Location(Path("file.py"), 1, 8), Location(Path("link.py"), 1, 8)]
+        assert len(parsed_files) == 1
+
+
+def test_import_parser_shares_parsed_files_between_calls(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("common").mkdir()
+        Path("common/file.py").write_text("import foo")
+        parsed_files = ParsedFiles()
+
+        assert get_import_table_from_list_of_files([Path("common/file.py")], parsed_files=parsed_files).modules == [
+            "foo"
+        ]
+        assert len(parsed_files) == 1
+
+        # Files already parsed are not parsed again, even when given through another path.
+        Path("common/file.py").write_text("import bar")
+        with run_within_dir(tmp_path / "common"):
+            assert get_import_table_from_list_of_files([Path("file.py")], parsed_files=parsed_files).modules == ["foo"]
+
+        assert get_import_table_from_list_of_files([Path("common/file.py")]).modules == ["bar"]
+
+
+def test_import_parser_from_directories(tmp_path: Path, caplog: LogCaptureFixture) -> None:
+    with run_within_dir(tmp_path):
+        Path("src/foo").mkdir(parents=True)
+        Path("src/foo/b.py").write_text("import bar")
+        Path("src/foo/a.py").write_text("import bar\nimport baz")
+        Path("src/excluded.py").write_text("import excluded")
+
+        with caplog.at_level(logging.INFO):
+            import_table = get_import_table_from_directories(
+                (Path(), Path("src")), ("src/excluded",), (), using_default_exclude=False
+            )
+
+        assert caplog.messages == ["Scanning 2 files..."]
+        # Files are sorted, and only found once even though directories overlap.
+        assert import_table.files == ["src/foo/a.py", "src/foo/b.py"]
+        assert import_table.modules == ["bar", "baz"]
+        assert list(import_table.get_locations(0)) == [
+            Location(Path("src/foo/a.py"), 1, 8),
+            Location(Path("src/foo/b.py"), 1, 8),
+        ]
+
+
+def test_import_parser_from_directories_parses_files_with_several_paths_once(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("a").mkdir()
+        Path("b").mkdir()
+        Path("a/file.py").write_text("import foo")
+        Path("b/file.py").symlink_to("../a/file.py")
+
+        import_table = get_import_table_from_directories((Path("a"), Path("b")), (), (), using_default_exclude=False)
+
+        assert import_table.files == ["a/file.py"]
+        assert import_table.modules == ["foo"]
+
+
+@pytest.mark.parametrize(
+    "file_content",
+    [
+        pytest.param(
+            "import foo.bar as baz, qux\nfrom foobar.baz import (\n    a,\n    b,\n)\nfrom . import local\nfrom .local import x\n",
+            id="imports",
+        ),
+        pytest.param(
+            "try:\n    import foo\nexcept ImportError:  # import bar\n    foo = None\n\ndef f():\n    yield from g()\n    import baz\n",
+            id="nested imports",
+        ),
+        pytest.param(
+            'DATA = {\'import foo\': [1.5e-3, 0x1F], """from bar import baz""": rb\'\\\'import qux\'}\nimport foobar\n',
+            id="strings",
+        ),
+        pytest.param("raise ValueError from None\nimport foo; import bar\nx = \\\n    1\n", id="raise from"),
+        pytest.param("import importlib\nimportlib.import_module('foo')\n", id="dynamic import"),
+        pytest.param("from typing import TYPE_CHECKING\nif TYPE_CHECKING:\n    import foo\n", id="type checking"),
+        pytest.param("x = f'{1}'\nimport foo\n", id="f-string"),
+    ],
+)
+def test_import_parser_with_experimental_import_scanner(file_content: str, tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        Path("file.py").write_text(file_content)
+
+        import_table = get_import_table_from_list_of_files([Path("file.py")])
+        scanned_import_table = get_import_table_from_list_of_files([Path("file.py")], experimental_import_scanner=True)
+
+        assert scanned_import_table.modules == import_table.modules
+        for index in range(len(import_table.modules)):
+            assert scanned_import_table.get_locations(index) == import_table.get_locations(index)
+
+
+def test_import_parser_with_experimental_import_scanner_does_not_parse_files(
+    tmp_path: Path, caplog: LogCaptureFixture
+) -> None:
+    with run_within_dir(tmp_path):
+        # The scanner handles this file, so the syntax error, that only the parser detects, is not reported.
+        Path("file.py").write_text("import foo\nx = = 1\n")
+
+        with caplog.at_level(logging.WARNING):
+            assert get_import_table_from_list_of_files([Path("file.py")], experimental_import_scanner=True).modules == [
+                "foo"
+            ]
+            assert caplog.messages == []
+
+            assert get_import_table_from_list_of_files([Path("file.py")]).modules == []
+            assert len(caplog.messages) == 1
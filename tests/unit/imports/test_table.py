@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from unittest import mock
+
+from deptry.imports.location import Location
+from deptry.imports.table import ImportTable
+
+
+def _build_import_table() -> ImportTable:
+    return ImportTable(
+        modules=["bar", "foo"],
+        files=["src/a.py", "src/b.py"],
+        rule_codes=["ALL", "DEP001", "DEP003"],
+        module_offsets=array("I", [0, 1, 4]),
+        file_ids=array("I", [1, 0, 0, 1]),
+        lines=array("I", [2, 1, 3, 0]),
+        columns=array("I", [1, 8, 8, 0]),
+        ignored_rule_codes=array("Q", [0, 0b110, 0b001, 0]),
+    )
+
+
+def test_get_module_rows() -> None:
+    import_table = _build_import_table()
+
+    assert len(import_table) == 4
+    assert import_table.get_module_rows(0) == range(1)
+    assert import_table.get_module_rows(1) == range(1, 4)
+
+
+def test_get_locations() -> None:
+    import_table = _build_import_table()
+
+    assert import_table.get_locations(0) == [Location(Path("src/b.py"), 2, 1)]
+    assert import_table.get_locations(1) == [
+        Location(Path("src/a.py"), 1, 8, ignored_rule_codes=("DEP001", "DEP003")),
+        Location(Path("src/a.py"), 3, 8, ignored_rule_codes=("ALL",)),
+        Location(Path("src/b.py")),
+    ]
+
+
+def test_get_locations_share_paths() -> None:
+    import_table = _build_import_table()
+
+    assert import_table.get_location(0).file is import_table.get_location(3).file
+
+
+def test_locations_view() -> None:
+    import_table = _build_import_table()
+
+    with mock.patch.object(import_table, "get_location", wraps=import_table.get_location) as get_location:
+        locations = import_table.get_locations(1)
+
+        assert len(locations) == 3
+        get_location.assert_not_called()
+
+        assert locations[-1] == Location(Path("src/b.py"))
+        assert locations[:2] == [
+            Location(Path("src/a.py"), 1, 8, ignored_rule_codes=("DEP001", "DEP003")),
+            Location(Path("src/a.py"), 3, 8, ignored_rule_codes=("ALL",)),
+        ]
+        assert get_location.call_count == 3
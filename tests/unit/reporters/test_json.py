@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
 
 from deptry.dependency import Dependency
 from deptry.imports.location import Location
@@ -15,6 +18,9 @@ from deptry.violations import (
 )
 from tests.utils import run_within_dir
 
+if TYPE_CHECKING:
+    from deptry.violations import Violation
+
 
 def test_simple(tmp_path: Path) -> None:
     with run_within_dir(tmp_path):
@@ -76,3 +82,58 @@ def test_simple(tmp_path: Path) -> None:
                 },
             },
         ]
+
+
+def _get_violations() -> list[Violation]:
+    return [
+        DEP001MissingDependencyViolation(Module("foo", package="foo-package"), Location(Path("foo.py"), 1, 2)),
+        DEP002UnusedDependencyViolation(Dependency("bär", Path("pyproject.toml")), Location(Path("pyproject.toml"))),
+    ]
+
+
+@pytest.mark.parametrize("violations", [[], _get_violations()], ids=["no violations", "violations"])
+def test_json_format_matches_json_dump(violations: list[Violation], tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        reporter = JSONReporter(violations, enforce_posix_paths=False, json_output="output.json")
+        reporter.report()
+
+        expected = json.dumps(
+            [reporter._serialize_violation(violation) for violation in violations], ensure_ascii=False, indent=4
+        )
+        assert Path("output.json").read_text(encoding="utf-8") == expected
+
+
+def test_json_compact_format(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        JSONReporter(
+            _get_violations(), enforce_posix_paths=True, json_output="output.json", json_output_format="json-compact"
+        ).report()
+
+        assert Path("output.json").read_text(encoding="utf-8") == (
+            '[{"error":{"code":"DEP001","message":"\'foo\' imported but missing from the dependency definitions"},'
+            '"module":"foo","location":{"file":"foo.py","line":1,"column":2}},'
+            '{"error":{"code":"DEP002","message":"\'bär\' defined as a dependency but not used in the codebase"},'
+            '"module":"bär","location":{"file":"pyproject.toml","line":null,"column":null}}]'
+        )
+
+
+def test_jsonl_format(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        JSONReporter(
+            _get_violations(), enforce_posix_paths=True, json_output="output.jsonl", json_output_format="jsonl"
+        ).report()
+
+        lines = Path("output.jsonl").read_text(encoding="utf-8").splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {
+            "error": {"code": "DEP001", "message": "'foo' imported but missing from the dependency definitions"},
+            "module": "foo",
+            "location": {"file": "foo.py", "line": 1, "column": 2},
+        },
+        {
+            "error": {"code": "DEP002", "message": "'bär' defined as a dependency but not used in the codebase"},
+            "module": "bär",
+            "location": {"file": "pyproject.toml", "line": None, "column": None},
+        },
+    ]
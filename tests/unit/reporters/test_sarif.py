@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import fastjsonschema  # type: ignore[import-untyped]
+
+from deptry.dependency import Dependency
+from deptry.imports.location import Location
+from deptry.module import Module
+from deptry.reporters import SarifReporter
+from deptry.violations import (
+    DEP001MissingDependencyViolation,
+    DEP002UnusedDependencyViolation,
+    DEP004MisplacedDevDependencyViolation,
+)
+from tests.utils import run_within_dir
+
+SARIF_SCHEMA_PATH = Path("tests/fixtures/sarif-schema-2.1.0.json").resolve()
+
+
+def test_simple(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        SarifReporter(
+            [
+                DEP001MissingDependencyViolation(Module("foo", package="foo-package"), Location(Path("foo.py"), 1, 2)),
+                DEP004MisplacedDevDependencyViolation(
+                    Module("bar", package="bar-package"), Location(Path("src/bar.py"), 3, 4)
+                ),
+                DEP001MissingDependencyViolation(Module("baz"), Location(Path("foo.py"), 5, 6)),
+                DEP002UnusedDependencyViolation(
+                    Dependency("qux", Path("pyproject.toml")), Location(Path("pyproject.toml"))
+                ),
+            ],
+            enforce_posix_paths=False,
+            sarif_output="output.sarif",
+        ).report()
+
+        with Path("output.sarif").open() as f:
+            data = json.load(f)
+
+        assert data["version"] == "2.1.0"
+        assert len(data["runs"]) == 1
+
+        run = data["runs"][0]
+        assert run["tool"]["driver"]["name"] == "deptry"
+        assert [(rule["id"], rule["messageStrings"]["default"]["text"]) for rule in run["tool"]["driver"]["rules"]] == [
+            ("DEP001", "'{0}' imported but missing from the dependency definitions"),
+            ("DEP002", "'{0}' defined as a dependency but not used in the codebase"),
+            ("DEP004", "'{0}' imported but declared as a dev dependency"),
+        ]
+        assert run["artifacts"] == [
+            {"location": {"uri": "foo.py"}},
+            {"location": {"uri": "src/bar.py"}},
+            {"location": {"uri": "pyproject.toml"}},
+        ]
+        assert run["results"] == [
+            {
+                "ruleId": "DEP001",
+                "ruleIndex": 0,
+                "message": {
+                    "text": "'foo' imported but missing from the dependency definitions",
+                    "id": "default",
+                    "arguments": ["foo"],
+                },
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": "foo.py", "index": 0},
+                            "region": {"startLine": 1, "startColumn": 2},
+                        }
+                    }
+                ],
+            },
+            {
+                "ruleId": "DEP004",
+                "ruleIndex": 2,
+                "message": {
+                    "text": "'bar' imported but declared as a dev dependency",
+                    "id": "default",
+                    "arguments": ["bar"],
+                },
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": "src/bar.py", "index": 1},
+                            "region": {"startLine": 3, "startColumn": 4},
+                        }
+                    }
+                ],
+            },
+            {
+                "ruleId": "DEP001",
+                "ruleIndex": 0,
+                "message": {
+                    "text": "'baz' imported but missing from the dependency definitions",
+                    "id": "default",
+                    "arguments": ["baz"],
+                },
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": "foo.py", "index": 0},
+                            "region": {"startLine": 5, "startColumn": 6},
+                        }
+                    }
+                ],
+            },
+            {
+                "ruleId": "DEP002",
+                "ruleIndex": 1,
+                "message": {
+                    "text": "'qux' defined as a dependency but not used in the codebase",
+                    "id": "default",
+                    "arguments": ["qux"],
+                },
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": "pyproject.toml", "index": 2},
+                            "region": {"startLine": 1},
+                        }
+                    }
+                ],
+            },
+        ]
+
+
+def test_no_violations(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        SarifReporter([], enforce_posix_paths=False, sarif_output="output.sarif").report()
+
+        with Path("output.sarif").open() as f:
+            data = json.load(f)
+
+        run = data["runs"][0]
+        assert run["tool"]["driver"]["rules"] == []
+        assert run["results"] == []
+        assert run["artifacts"] == []
+
+
+def test_matches_sarif_schema(tmp_path: Path) -> None:
+    validate = fastjsonschema.compile(json.loads(SARIF_SCHEMA_PATH.read_text()))
+
+    with run_within_dir(tmp_path):
+        SarifReporter(
+            [
+                DEP001MissingDependencyViolation(Module("foo"), Location(Path("src/foo.py"), 1, 2)),
+                DEP002UnusedDependencyViolation(
+                    Dependency("bar", Path("pyproject.toml")), Location(Path("pyproject.toml"))
+                ),
+            ],
+            enforce_posix_paths=False,
+            sarif_output="output.sarif",
+        ).report()
+
+        with Path("output.sarif").open() as f:
+            validate(json.load(f))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.imports.location import Location
+from deptry.module import Module
+from deptry.reporters import WatchReporter
+from deptry.violations import DEP001MissingDependencyViolation, DEP004MisplacedDevDependencyViolation
+from tests.utils import stylize
+
+if TYPE_CHECKING:
+    from _pytest.logging import LogCaptureFixture
+
+
+def test_logging_new_and_resolved_violations(caplog: LogCaptureFixture) -> None:
+    unchanged_violation = DEP001MissingDependencyViolation(Module("foo"), Location(Path("foo.py"), 1, 2))
+    resolved_violation = DEP001MissingDependencyViolation(Module("bar"), Location(Path("foo.py"), 2, 2))
+    new_violation = DEP004MisplacedDevDependencyViolation(Module("baz", package="baz"), Location(Path("bar.py"), 3, 4))
+
+    with caplog.at_level(logging.INFO):
+        WatchReporter(
+            [unchanged_violation, new_violation],
+            enforce_posix_paths=False,
+            use_ansi=False,
+            previous_violations=[unchanged_violation, resolved_violation],
+        ).report()
+
+    assert caplog.messages == [
+        "",
+        f"+ {Path('bar.py')}:3:4: DEP004 'baz' imported but declared as a dev dependency",
+        f"- {Path('foo.py')}:2:2: DEP001 'bar' imported but missing from the dependency definitions",
+        "1 new, 1 resolved.",
+        "Found 2 dependency issues.",
+        "\nFor more information, see the documentation: https://deptry.com/",
+    ]
+
+
+def test_logging_no_change(caplog: LogCaptureFixture) -> None:
+    violation = DEP001MissingDependencyViolation(Module("foo"), Location(Path("foo.py"), 1, 2))
+
+    with caplog.at_level(logging.INFO):
+        WatchReporter([violation], enforce_posix_paths=False, previous_violations=[violation]).report()
+
+    assert caplog.messages == [
+        "",
+        "No change in dependency issues.",
+        stylize("{BOLD}{RED}Found 1 dependency issue.{RESET}"),
+        "\nFor more information, see the documentation: https://deptry.com/",
+    ]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from deptry.baseline import filter_baseline_violations, get_fingerprint, load_baseline, save_baseline
+from deptry.dependency import Dependency
+from deptry.exceptions import BaselineNotFoundError
+from deptry.imports.location import Location
+from deptry.module import Module
+from deptry.violations import (
+    DEP001MissingDependencyViolation,
+    DEP002UnusedDependencyViolation,
+    DEP003TransitiveDependencyViolation,
+)
+
+
+def test_get_fingerprint() -> None:
+    assert (
+        get_fingerprint(DEP001MissingDependencyViolation(Module("foo"), Location(Path("src/app.py"), 3, 8)))
+        == "DEP001 foo src/app.py"
+    )
+    assert (
+        get_fingerprint(
+            DEP002UnusedDependencyViolation(Dependency("bar", Path("pyproject.toml")), Location(Path("pyproject.toml")))
+        )
+        == "DEP002 bar pyproject.toml"
+    )
+
+
+def test_save_and_load_baseline(tmp_path: Path) -> None:
+    baseline_path = tmp_path / "deptry-baseline.txt"
+    violations = [
+        DEP003TransitiveDependencyViolation(Module("foo"), Location(Path("src/b.py"), 1, 8)),
+        DEP001MissingDependencyViolation(Module("foo"), Location(Path("src/b.py"), 2, 8)),
+        DEP001MissingDependencyViolation(Module("foo"), Location(Path("src/b.py"), 5, 8)),
+        DEP001MissingDependencyViolation(Module("bar"), Location(Path("src/a.py"), 1, 8)),
+    ]
+
+    save_baseline(baseline_path, violations)
+
+    assert baseline_path.read_text() == "DEP001 bar src/a.py\nDEP001 foo src/b.py\nDEP003 foo src/b.py\n"
+    assert load_baseline(baseline_path) == {"DEP001 bar src/a.py", "DEP001 foo src/b.py", "DEP003 foo src/b.py"}
+
+
+def test_load_baseline_not_found(tmp_path: Path) -> None:
+    with pytest.raises(BaselineNotFoundError, match=r"Baseline file '.*missing\.txt' not found\."):
+        load_baseline(tmp_path / "missing.txt")
+
+
+def test_filter_baseline_violations() -> None:
+    moved = DEP001MissingDependencyViolation(Module("foo"), Location(Path("src/a.py"), 10, 8))
+    new_module = DEP001MissingDependencyViolation(Module("bar"), Location(Path("src/a.py"), 11, 8))
+    new_file = DEP001MissingDependencyViolation(Module("foo"), Location(Path("src/b.py"), 1, 8))
+    new_code = DEP003TransitiveDependencyViolation(Module("foo"), Location(Path("src/a.py"), 1, 8))
+
+    assert filter_baseline_violations([moved, new_module, new_file, new_code], frozenset({"DEP001 foo src/a.py"})) == [
+        new_module,
+        new_file,
+        new_code,
+    ]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from deptry.batch import Batch, Project, find_projects
+from tests.utils import create_core, create_files, run_within_dir
+
+
+def test_find_projects_in_directory(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([
+            Path("pyproject.toml"),
+            Path("packages/foo/pyproject.toml"),
+            Path("packages/bar/requirements.txt"),
+            Path("packages/baz/src/baz.py"),
+            Path("packages/foo/tests/fixtures/project/pyproject.toml"),
+            Path(".venv/lib/site-packages/qux/pyproject.toml"),
+        ])
+
+        assert find_projects(Path()) == [Path(), Path("packages/bar"), Path("packages/foo")]
+
+
+def test_find_projects_from_manifest(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([Path("packages/foo/pyproject.toml"), Path("packages/bar/pyproject.toml")])
+        Path("packages/projects.txt").write_text("# Projects to check\nfoo\n\n./bar/\n")
+
+        assert find_projects(Path("packages/projects.txt")) == [Path("packages/foo"), Path("packages/bar")]
+
+
+def test_find_python_files() -> None:
+    projects = [
+        Project(Path(), create_core(exclude=("venv", "tests"))),
+        Project(Path("packages/foo"), create_core(extend_exclude=("docs",))),
+        Project(Path("packages/bar"), create_core()),
+        Project(Path("packages/baz"), create_core(using_default_exclude=False)),
+        Project(Path("packages/incremental"), create_core(since="HEAD")),
+    ]
+
+    def find_python_files(directories: tuple[Path, ...], *_args: object) -> list[Path]:
+        return {
+            (Path(),): [Path("main.py"), Path("src/app.py")],
+            (Path("packages/foo"), Path("packages/bar")): [Path("packages/foo/foo.py"), Path("packages/bar/a/bar.py")],
+            (Path("packages/baz"),): [Path("packages/baz/baz.py")],
+        }[directories]
+
+    with mock.patch("deptry.batch.get_all_python_files_in", side_effect=find_python_files) as mock_find:
+        python_files = Batch(projects)._find_python_files()
+
+    assert python_files == {
+        Path(): [Path("main.py"), Path("src/app.py")],
+        Path("packages/foo"): [Path("foo.py")],
+        Path("packages/bar"): [Path("a/bar.py")],
+        Path("packages/baz"): [Path("baz.py")],
+    }
+
+    root_call, packages_call, baz_call = mock_find.call_args_list
+    assert set(root_call.args[1]) == {
+        "(?:venv|tests)",
+        "packages/foo$",
+        "packages/bar$",
+        "packages/baz$",
+        "packages/incremental$",
+    }
+    assert root_call.args[3] is True
+    assert packages_call.args[1] == ("packages/foo/(?:venv|docs)", "packages/bar/(?:venv)")
+    assert baz_call.args[1] == ("packages/baz/(?:venv)",)
+    assert baz_call.args[3] is False
+
+
+@pytest.mark.parametrize(
+    ("directory", "expected"),
+    [
+        (Path("my project"), "my project/(?:venv)"),
+        (Path("project.v2"), r"project\.v2/(?:venv)"),
+    ],
+)
+def test_excluded_patterns_escape_directory(directory: Path, expected: str) -> None:
+    project = Project(directory, create_core())
+
+    assert list(Batch._get_excluded_patterns(project, {directory})) == [expected]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from deptry.changed_files import filter_python_files, get_files_changed_since
+from deptry.exceptions import GitChangedFilesError
+from tests.utils import create_files, run_within_dir
+
+
+def _git(*args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=deptry", "-c", "user.email=deptry@example.com", *args],  # noqa: S607
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_get_files_changed_since(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([Path("unchanged.py"), Path("modified.py"), Path("deleted.py"), Path("renamed.py")])
+        _git("init")
+        _git("add", ".")
+        _git("commit", "-m", "Initial commit")
+
+        Path("modified.py").write_text("import foo")
+        Path("deleted.py").unlink()
+        _git("mv", "renamed.py", "new_name.py")
+        Path("untracked.py").touch()
+
+        assert sorted(get_files_changed_since("HEAD")) == [
+            Path("deleted.py"),
+            Path("modified.py"),
+            Path("new_name.py"),
+            Path("renamed.py"),
+            Path("untracked.py"),
+        ]
+
+
+def test_get_files_changed_since_invalid_reference(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        _git("init")
+
+        with pytest.raises(GitChangedFilesError, match="Could not list files changed since git reference 'foo'"):
+            get_files_changed_since("foo")
+
+
+@pytest.mark.parametrize(
+    ("directories", "exclude", "ignore_notebooks", "expected"),
+    [
+        pytest.param(
+            (Path(),),
+            (),
+            False,
+            [Path("src/foo.py"), Path("src/bar.ipynb"), Path("tests/test_foo.py"), Path("setup.py")],
+            id="all Python files",
+        ),
+        pytest.param(
+            (Path(),),
+            (),
+            True,
+            [Path("src/foo.py"), Path("tests/test_foo.py"), Path("setup.py")],
+            id="ignore notebooks",
+        ),
+        pytest.param(
+            (Path(),),
+            ("tests", r"setup\.py"),
+            False,
+            [Path("src/foo.py"), Path("src/bar.ipynb")],
+            id="exclude",
+        ),
+        pytest.param(
+            (Path(),),
+            ("src/b",),
+            False,
+            [Path("src/foo.py"), Path("tests/test_foo.py"), Path("setup.py")],
+            id="exclude matching part of a file name",
+        ),
+        pytest.param(
+            (Path("src"), Path("tests")),
+            ("tests",),
+            False,
+            [Path("src/foo.py"), Path("src/bar.ipynb")],
+            id="exclude directory",
+        ),
+        pytest.param(
+            (Path("src"),),
+            (),
+            False,
+            [Path("src/foo.py"), Path("src/bar.ipynb")],
+            id="files outside of directories",
+        ),
+    ],
+)
+def test_filter_python_files(
+    directories: tuple[Path, ...],
+    exclude: tuple[str, ...],
+    ignore_notebooks: bool,
+    expected: list[Path],
+    tmp_path: Path,
+) -> None:
+    with run_within_dir(tmp_path):
+        files = [
+            Path("src/foo.py"),
+            Path("src/bar.ipynb"),
+            Path("src/data.json"),
+            Path("tests/test_foo.py"),
+            Path("setup.py"),
+            Path("src/foo.py"),
+        ]
+        create_files(files)
+
+        assert filter_python_files(files, directories, exclude, (), False, ignore_notebooks) == expected
+
+
+def test_filter_python_files_absolute_directory(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([Path("src/foo.py")])
+
+        assert filter_python_files([Path("src/foo.py")], (tmp_path / "src",), (), (), False) == [
+            tmp_path / "src/foo.py"
+        ]
+
+
+@pytest.mark.parametrize(
+    ("using_default_exclude", "expected"),
+    [
+        pytest.param(True, [Path("src/foo.py")], id="ignore files are honoured"),
+        pytest.param(
+            False,
+            [Path("src/foo.py"), Path("src/generated.py"), Path("build/bar.py")],
+            id="ignore files are not honoured",
+        ),
+    ],
+)
+def test_filter_python_files_ignore_files(using_default_exclude: bool, expected: list[Path], tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        _git("init")
+        files = [Path("src/foo.py"), Path("src/generated.py"), Path("build/bar.py"), Path("src/deleted.py")]
+        create_files(files[:-1])
+        Path(".gitignore").write_text("build/\n")
+        Path("src/.ignore").write_text("generated.py\n")
+
+        assert filter_python_files(files, (Path(),), (), (), using_default_exclude) == expected
@@ -11,6 +11,8 @@ import pytest
 from deptry.core import Core
 from deptry.dependency import Dependency
 from deptry.dependency_getter.base import DependenciesExtract
+from deptry.imports.cache import load_import_cache
+from deptry.imports.extract import get_import_table_from_list_of_files
 from deptry.imports.location import Location
 from deptry.module import Module
 from deptry.violations import (
@@ -19,7 +21,7 @@ from deptry.violations import (
     DEP003TransitiveDependencyViolation,
     DEP004MisplacedDevDependencyViolation,
 )
-from tests.utils import create_files, run_within_dir
+from tests.utils import create_core, create_files, run_within_dir
 
 
 @pytest.mark.parametrize(
@@ -119,17 +121,27 @@ def test__get_local_modules(
                 extend_exclude=(),
                 using_default_exclude=True,
                 ignore_notebooks=False,
+                walk_threads=0,
                 requirements_files=(),
                 requirements_files_dev=(),
                 known_first_party=known_first_party,
                 json_output="",
+                json_output_format="json",
+                sarif_output="",
                 package_module_name_map={},
                 optional_dependencies_dev_groups=(),
                 non_dev_dependency_groups=(),
                 using_default_requirements_files=True,
                 experimental_namespace_package=experimental_namespace_package,
+                experimental_import_scanner=False,
                 github_output=False,
                 github_warning_errors=(),
+                cache_dir=None,
+                changed_files=(),
+                since=None,
+                watch=False,
+                baseline=None,
+                update_baseline=False,
                 enforce_posix_paths=False,
             )._get_local_modules()
             == expected
@@ -173,17 +185,27 @@ def test_text_reporter_only(
             extend_exclude=(),
             using_default_exclude=True,
             ignore_notebooks=False,
+            walk_threads=0,
             requirements_files=(),
             requirements_files_dev=(),
             known_first_party=(),
             json_output="",
+            json_output_format="json",
+            sarif_output="",
             package_module_name_map={},
             optional_dependencies_dev_groups=(),
             non_dev_dependency_groups=(),
             using_default_requirements_files=True,
             experimental_namespace_package=False,
+            experimental_import_scanner=False,
             github_output=False,
             github_warning_errors=(),
+            cache_dir=None,
+            changed_files=(),
+            since=None,
+            watch=False,
+            baseline=None,
+            update_baseline=False,
             enforce_posix_paths=False,
         ).run()
 
@@ -209,17 +231,27 @@ def test_all_reporters(
             extend_exclude=(),
             using_default_exclude=True,
             ignore_notebooks=False,
+            walk_threads=0,
             requirements_files=(),
             requirements_files_dev=(),
             known_first_party=(),
             json_output="foo.json",
+            json_output_format="json",
+            sarif_output="",
             package_module_name_map={},
             optional_dependencies_dev_groups=(),
             non_dev_dependency_groups=(),
             using_default_requirements_files=True,
             experimental_namespace_package=False,
+            experimental_import_scanner=False,
             github_output=True,
             github_warning_errors=(),
+            cache_dir=None,
+            changed_files=(),
+            since=None,
+            watch=False,
+            baseline=None,
+            update_baseline=False,
             enforce_posix_paths=False,
         ).run()
 
@@ -291,3 +323,27 @@ def test__log_dependencies(
         Core._log_dependencies(DependenciesExtract(dependencies, dev_dependencies))
 
     assert caplog.messages == expected_logs
+
+
+@pytest.mark.parametrize(
+    ("index_options", "expected"),
+    [
+        pytest.param({}, [Path("a.py"), Path("b.py")], id="same options"),
+        pytest.param(None, None, id="no walk of the file tree"),
+        pytest.param({"extend_exclude": ("b",)}, None, id="other exclusions"),
+        pytest.param({"root": (Path("src"),)}, None, id="other root"),
+    ],
+)
+def test__find_python_files_incrementally(
+    index_options: dict[str, object] | None, expected: list[Path] | None, tmp_path: Path
+) -> None:
+    with run_within_dir(tmp_path):
+        create_files([Path("a.py"), Path("b.py")])
+
+        import_cache = load_import_cache(Path(".deptry_cache"))
+        get_import_table_from_list_of_files([Path("a.py")], import_cache)
+        if index_options is not None:
+            import_cache.index_scope = create_core(**index_options)._index_scope
+
+        # Files indexed in the cache are only used if they were found by walking the file tree with the same options.
+        assert create_core(changed_files=(Path("b.py"),))._find_python_files(import_cache) == expected
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 
-from deptry.dependency import Dependency, parse_pep_508_dependency
+from deptry.dependency import DependenciesIndex, Dependency, parse_pep_508_dependencies
 
 
 def test_simple_dependency() -> None:
@@ -24,20 +23,14 @@ def test_create_default_top_level_if_metadata_not_found() -> None:
     assert dependency.top_levels == {"foo_bar"}
 
 
-def test_read_top_level_from_top_level_txt() -> None:
+def test_read_top_level_from_metadata() -> None:
     """
-    Read the top-levels.txt file
+    Read the top-level module names from the metadata of the installed distribution.
     """
-
-    class MockDistribution:
-        def __init__(self) -> None:
-            pass
-
-        def read_text(self, file_name: str) -> str:
-            return "foo\nbar"
-
-    with patch("deptry.dependency.metadata.distribution") as mock:
-        mock.return_value = MockDistribution()
+    with (
+        patch("deptry.dependency.Dependency.find_distribution", return_value=object()),
+        patch("deptry.distributions.DistributionsIndex.get_top_levels", return_value={"foo", "bar"}),
+    ):
         dependency = Dependency("Foo-bar", Path("pyproject.toml"))
 
     assert dependency.name == "Foo-bar"
@@ -45,50 +38,35 @@ def test_read_top_level_from_top_level_txt() -> None:
     assert dependency.top_levels == {"foo", "bar"}
 
 
-def test_read_top_level_from_record() -> None:
-    """
-    Verify that if top-level.txt not found, an attempt is made to extract top-level module names from
-    the metadata RECORD file.
-    """
-
-    class MockDistribution:
-        def __init__(self) -> None:
-            pass
-
-        def read_text(self, file_name: str) -> str | None:
-            if file_name == "RECORD":
-                return """\
-../../../bin/black,sha256=<HASH>,247
-__pycache__/_black_version.cpython-311.pyc,,
-_black_version.py,sha256=<HASH>,19
-black/trans.cpython-39-darwin.so,sha256=<HASH>
-black/trans.py,sha256=<HASH>
-blackd/__init__.py,sha256=<HASH>
-blackd/__main__.py,sha256=<HASH>
-                """
-            return None
-
-    with patch("deptry.dependency.metadata.distribution") as mock:
-        mock.return_value = MockDistribution()
-        dependency = Dependency("Foo-bar", Path("pyproject.toml"))
-
-    assert dependency.name == "Foo-bar"
-    assert dependency.definition_file == Path("pyproject.toml")
-    assert dependency.top_levels == {"_black_version", "black", "blackd"}
-
-
 def test_read_top_level_from_predefined() -> None:
     """
     Verify that if there are predefined top-level module names it takes
     precedence over other lookup methods.
     """
-    with patch("deptry.dependency.metadata.distribution") as mock:
+    with (
+        patch("deptry.dependency.Dependency.find_distribution", return_value=object()),
+        patch("deptry.distributions.DistributionsIndex.get_top_levels") as mock,
+    ):
         dependency = Dependency("Foo-bar", Path("pyproject.toml"), module_names=["foo"])
 
     assert dependency.name == "Foo-bar"
     assert dependency.definition_file == Path("pyproject.toml")
     assert dependency.top_levels == {"foo"}
-    mock.return_value.read_text.assert_not_called()
+    mock.assert_not_called()
+
+
+def test_installed_without_top_level_metadata() -> None:
+    """
+    Use the fallback option of translating the package name if metadata does not define top-level module names.
+    """
+    with (
+        patch("deptry.dependency.Dependency.find_distribution", return_value=object()),
+        patch("deptry.distributions.DistributionsIndex.get_top_levels", return_value=None),
+    ):
+        dependency = Dependency("Foo-bar", Path("pyproject.toml"))
+
+    assert dependency.found
+    assert dependency.top_levels == {"foo_bar"}
 
 
 def test_not_predefined_and_not_installed() -> None:
@@ -96,8 +74,7 @@ def test_not_predefined_and_not_installed() -> None:
     Use the fallback option of translating the package name.
     """
 
-    with patch("deptry.dependency.metadata.distribution") as mock:
-        mock.side_effect = PackageNotFoundError
+    with patch("deptry.dependency.Dependency.find_distribution", return_value=None):
         dependency = Dependency("Foo-bar", Path("pyproject.toml"))
 
     assert dependency.name == "Foo-bar"
@@ -131,17 +108,44 @@ def test_not_predefined_and_not_installed() -> None:
         ),
     ],
 )
-def test_parse_pep_508_dependency(
+def test_parse_pep_508_dependencies_single_specification(
     specification: str,
     definition_file: Path,
     package_module_name_map: dict[str, list[str]],
     expected: dict[str, Any],
 ) -> None:
-    dependency = parse_pep_508_dependency(specification, definition_file, package_module_name_map)
+    [dependency] = parse_pep_508_dependencies([specification], definition_file, package_module_name_map)
 
     for dependency_key, expected_value in expected.items():
         assert getattr(dependency, dependency_key) == expected_value
 
 
-def test_parse_pep_508_dependency_invalid_definition() -> None:
-    assert parse_pep_508_dependency("an_incorrect_definition=1.2.3", Path("pyproject.toml"), {}) is None
+def test_parse_pep_508_dependencies_invalid_definition() -> None:
+    assert parse_pep_508_dependencies(["an_incorrect_definition=1.2.3"], Path("pyproject.toml"), {}) == []
+
+
+def test_parse_pep_508_dependencies() -> None:
+    with patch("deptry.distributions.DistributionsIndex.load_top_levels") as mock:
+        dependencies = parse_pep_508_dependencies(
+            ["foo>=1.0", "an_incorrect_definition=1.2.3", "bar[baz]; python_version < '3.10'"],
+            Path("pyproject.toml"),
+            {"bar": ["bar_module"]},
+        )
+
+    assert [dependency.name for dependency in dependencies] == ["foo", "bar"]
+    assert dependencies[1].top_levels == {"bar_module"}
+    mock.assert_called_once()
+    assert list(mock.call_args.args[0]) == ["foo"]
+
+
+def test_dependencies_index() -> None:
+    foo = Dependency("foo", Path("pyproject.toml"), module_names=["foo", "common"])
+    bar = Dependency("bar", Path("pyproject.toml"), module_names=["bar", "common"])
+
+    index = DependenciesIndex.from_dependencies([foo, bar])
+
+    assert index.has_dependency("foo")
+    assert not index.has_dependency("common")
+    assert index.get_dependencies_providing("foo") == [foo]
+    assert index.get_dependencies_providing("common") == [foo, bar]
+    assert index.get_dependencies_providing("baz") == []
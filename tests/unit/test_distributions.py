@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from importlib.metadata import PathDistribution
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from deptry.distributions import DistributionsIndex, normalize_distribution_name
+from deptry.rust import get_top_level_module_names
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _create_distribution(directory: Path, metadata_directory: str, name: str, top_levels: str | None = None) -> None:
+    (directory / metadata_directory).mkdir(parents=True)
+    (directory / metadata_directory / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+    if top_levels is not None:
+        (directory / metadata_directory / "top_level.txt").write_text(top_levels)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("foo", "foo"),
+        ("Foo-Bar", "foo_bar"),
+        ("foo.bar", "foo_bar"),
+        ("foo__-.bar", "foo_bar"),
+    ],
+)
+def test_normalize_distribution_name(name: str, expected: str) -> None:
+    assert normalize_distribution_name(name) == expected
+
+
+def test_distributions_index(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    _create_distribution(site_packages, "Foo_Bar-1.0.dist-info", "Foo-Bar", "foo\nbar")
+    _create_distribution(site_packages, "zope.interface-5.0.dist-info", "zope.interface")
+    _create_distribution(site_packages, "legacy-2.0-py3.10.egg-info", "legacy")
+    _create_distribution(site_packages, "develop.egg-info", "develop")
+    (site_packages / "foo").mkdir()
+
+    index = DistributionsIndex.from_paths([str(site_packages), str(tmp_path / "non-existing")])
+
+    assert sorted(index.distributions) == ["develop", "foo_bar", "legacy", "zope_interface"]
+
+    distribution = index.get_distribution("foo-bar")
+    assert distribution is not None
+    assert distribution.read_text("top_level.txt") == "foo\nbar"
+
+    assert index.get_package_name("FOO_BAR") == "Foo-Bar"
+    assert index.get_package_name("zope-interface") == "zope.interface"
+    assert index.get_package_name("legacy") == "legacy"
+    assert index.get_package_name("develop") == "develop"
+    assert index.get_distribution("baz") is None
+    assert index.get_package_name("baz") is None
+
+
+def test_distributions_index_precedence(tmp_path: Path) -> None:
+    _create_distribution(tmp_path / "first", "foo-1.0.dist-info", "foo", "first")
+    _create_distribution(tmp_path / "second", "foo-2.0.dist-info", "foo", "second")
+
+    index = DistributionsIndex.from_paths([str(tmp_path / "first"), str(tmp_path / "second")])
+
+    distribution = index.get_distribution("foo")
+    assert distribution is not None
+    assert distribution.read_text("top_level.txt") == "first"
+
+
+def test_distributions_index_memoizes_package_names(tmp_path: Path) -> None:
+    _create_distribution(tmp_path, "foo-1.0.dist-info", "Foo")
+    index = DistributionsIndex.from_paths([str(tmp_path)])
+
+    read_text = PathDistribution.read_text
+
+    with patch.object(PathDistribution, "read_text", side_effect=read_text, autospec=True) as mock:
+        assert index.get_package_name("foo") == "Foo"
+        assert index.get_package_name("FOO") == "Foo"
+
+    assert mock.call_count == 1
+
+
+def test_distributions_index_top_levels(tmp_path: Path) -> None:
+    _create_distribution(tmp_path, "foo-1.0.dist-info", "foo", "foo\n\nbar\n")
+    _create_distribution(tmp_path, "black-24.0.dist-info", "black")
+    (tmp_path / "black-24.0.dist-info" / "RECORD").write_text(
+        "../../../bin/black,sha256=<HASH>,247\n"
+        "__pycache__/_black_version.cpython-311.pyc,,\n"
+        "_black_version.py,sha256=<HASH>,19\n"
+        "black/trans.cpython-39-darwin.so,sha256=<HASH>\n"
+        "black/trans.py,sha256=<HASH>\n"
+        "blackd/__init__.py,sha256=<HASH>\n"
+        "blackd/__main__.py,sha256=<HASH>\n"
+        "__editable__.black-24.0.pth,sha256=<HASH>\n"
+        "black-24.0.dist-info/METADATA,sha256=<HASH>\n"
+        "setup.cfg,sha256=<HASH>\n"
+    )
+    _create_distribution(tmp_path, "bar-1.0.dist-info", "bar")
+
+    index = DistributionsIndex.from_paths([str(tmp_path)])
+
+    assert index.get_top_levels("foo") == {"foo", "bar"}
+    assert index.get_top_levels("Black") == {"_black_version", "black", "blackd"}
+    assert index.get_top_levels("bar") is None
+    assert index.get_top_levels("baz") is None
+
+
+def test_distributions_index_loads_top_levels_in_batch(tmp_path: Path) -> None:
+    _create_distribution(tmp_path, "foo-1.0.dist-info", "foo", "foo")
+    _create_distribution(tmp_path, "bar-1.0.dist-info", "bar", "bar")
+    index = DistributionsIndex.from_paths([str(tmp_path)])
+
+    with patch("deptry.distributions.get_top_level_module_names", side_effect=get_top_level_module_names) as mock:
+        index.load_top_levels(["foo", "Bar", "bar", "baz"])
+
+        assert index.get_top_levels("foo") == {"foo"}
+        assert index.get_top_levels("bar") == {"bar"}
+        assert index.get_top_levels("baz") is None
+
+    mock.assert_called_once_with([str(tmp_path / "foo-1.0.dist-info"), str(tmp_path / "bar-1.0.dist-info")])
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError
 from pathlib import Path
 from unittest.mock import patch
 
@@ -43,7 +42,7 @@ def test_local_module() -> None:
 
 def test_transitive_module() -> None:
     with (
-        patch("deptry.module.metadata", side_effect=PackageNotFoundError),
+        patch("deptry.distributions.DistributionsIndex.get_package_name", return_value=None),
         patch("deptry.module.find_spec", return_value="bar"),
     ):
         module = ModuleBuilder("foo", set(), frozenset()).build()
@@ -55,7 +54,7 @@ def test_transitive_module() -> None:
 
 def test_transitive_module_no_spec() -> None:
     with (
-        patch("deptry.module.metadata", side_effect=PackageNotFoundError),
+        patch("deptry.distributions.DistributionsIndex.get_package_name", return_value=None),
         patch("deptry.module.find_spec", return_value=None),
     ):
         module = ModuleBuilder("foo", set(), frozenset()).build()
@@ -68,7 +67,7 @@ def test_transitive_module_no_spec() -> None:
 @pytest.mark.parametrize("exception", [ModuleNotFoundError, ValueError])
 def test_transitive_module_spec_error(exception: Exception) -> None:
     with (
-        patch("deptry.module.metadata", side_effect=PackageNotFoundError),
+        patch("deptry.distributions.DistributionsIndex.get_package_name", return_value=None),
         patch("deptry.module.find_spec", side_effect=exception),
     ):
         module = ModuleBuilder("foo", set(), frozenset()).build()
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from deptry.python_file_finder import get_all_python_files_in
+from deptry.python_file_finder import get_all_python_files_and_directories_in, get_all_python_files_in
 from tests.utils import create_files, run_within_dir
 
 
@@ -126,6 +126,32 @@ def test_regex_argument(exclude: tuple[str], expected: list[Path], tmp_path: Pat
         assert sorted(files) == expected
 
 
+def test_literal_arguments(tmp_path: Path) -> None:
+    """
+    Test that patterns without special characters still match the start of paths, and only match whole paths when they
+    end with `$`.
+    """
+    with run_within_dir(tmp_path):
+        create_files([
+            Path(".cache/file1.py"),
+            Path(".cache/file2.py"),
+            Path("dir/subdir/file1.py"),
+            Path("dir/sub.py"),
+            Path("dir/other.py"),
+            Path("other_dir/file.py"),
+            Path("other_dir2/file.py"),
+        ])
+
+        files = get_all_python_files_in(
+            (Path(),),
+            exclude=("dir/sub", "other_dir$", r"\.cache/file1\.py$"),
+            extend_exclude=(),
+            using_default_exclude=False,
+        )
+
+        assert files == [Path(".cache/file2.py"), Path("dir/other.py"), Path("other_dir2/file.py")]
+
+
 @pytest.mark.parametrize(
     ("exclude", "expected"),
     [
@@ -176,6 +202,24 @@ def test_duplicates_are_removed(tmp_path: Path) -> None:
         assert sorted(files) == [Path("dir/subdir/file1.py")]
 
 
+def test_directories_are_returned(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([
+            Path("dir/subdir/file1.py"),
+            Path("dir/subdir/file.txt"),
+            Path("docs/index.md"),
+            Path("other_dir/subdir/file1.py"),
+        ])
+
+        files, directories = get_all_python_files_and_directories_in(
+            (Path(),), exclude=(), extend_exclude=("other_dir",), using_default_exclude=False
+        )
+
+        assert files == [Path("dir/subdir/file1.py")]
+        # Directories without Python files are returned too, as Python files can be created in them.
+        assert directories == [Path(), Path("dir"), Path("dir/subdir"), Path("docs")]
+
+
 def test_gitignore_used_in_git_project(tmp_path: Path) -> None:
     """Test that gitignore files are respected when project uses git."""
     git_project_path = tmp_path / "git_project"
@@ -281,3 +325,32 @@ def test_gitignore_ignored_in_non_git_project(tmp_path: Path) -> None:
             Path("file1.py"),
             Path("file2.py"),
         ]
+
+
+def test_overlapping_directories_are_deduplicated(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([Path("dir/subdir/file1.py"), Path("dir/file2.py"), Path("file3.py")])
+        Path("link").symlink_to("dir")
+
+        files = get_all_python_files_in(
+            (Path(), Path("dir"), Path("link")), exclude=(), extend_exclude=(), using_default_exclude=False
+        )
+
+        assert sorted(files) == [Path("dir/file2.py"), Path("dir/subdir/file1.py"), Path("file3.py")]
+
+
+@pytest.mark.parametrize("walk_threads", [0, 1, 4])
+def test_walk_threads(walk_threads: int, tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([
+            Path("b/file.py"),
+            Path("a/c/file.py"),
+            Path("a/file.py"),
+            Path("a.py"),
+        ])
+
+        files = get_all_python_files_in(
+            (Path(),), exclude=(), extend_exclude=(), using_default_exclude=False, walk_threads=walk_threads
+        )
+
+        assert files == [Path("a.py"), Path("a/c/file.py"), Path("a/file.py"), Path("b/file.py")]
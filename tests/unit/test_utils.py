@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -8,6 +10,11 @@ from deptry.exceptions import PyprojectFileNotFoundError
 from deptry.utils import load_pyproject_toml
 from tests.utils import run_within_dir
 
+if sys.version_info >= (3, 15):  # pragma: no cover
+    import tomllib
+else:
+    import tomli as tomllib
+
 
 def test_load_pyproject_toml(tmp_path: Path) -> None:
     pyproject_toml = """\
@@ -36,3 +43,20 @@ dev = ["foobar", "foobaz"]
 def test_load_pyproject_toml_not_found(tmp_path: Path) -> None:
     with run_within_dir(tmp_path), pytest.raises(PyprojectFileNotFoundError):
         load_pyproject_toml(Path("non_existing_pyproject.toml"))
+
+
+def test_load_pyproject_toml_is_cached(tmp_path: Path) -> None:
+    pyproject_toml_path = tmp_path / "pyproject.toml"
+    pyproject_toml_path.write_text('[project]\nname = "foo"\n')
+
+    with patch("deptry.utils.tomllib.load", side_effect=tomllib.load) as mock:
+        first = load_pyproject_toml(pyproject_toml_path)
+        second = load_pyproject_toml(pyproject_toml_path)
+
+        assert first is second
+        assert mock.call_count == 1
+
+        pyproject_toml_path.write_text('[project]\nname = "foobar"\n')
+
+        assert load_pyproject_toml(pyproject_toml_path) == {"project": {"name": "foobar"}}
+        assert mock.call_count == 2
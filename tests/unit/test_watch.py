@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deptry.changed_files import filter_python_files
+from deptry.python_file_finder import get_all_python_files_and_directories_in
+from deptry.watch import watch_files
+from tests.utils import create_files, run_within_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _change_soon(change: Callable[[], object]) -> None:
+    """Make a change once the watcher waits for changes, as changes made before that are not reported."""
+    timer = threading.Timer(0.5, change)
+    timer.start()
+
+
+def test_watch_files(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        create_files([Path("foo.py"), Path("bar.py"), Path("src/baz.py"), Path("pyproject.toml")])
+        walks = 0
+
+        def find_files() -> tuple[list[Path], list[Path]]:
+            nonlocal walks
+            walks += 1
+            return get_all_python_files_and_directories_in((Path(),), (), (), False)
+
+        def filter_files(files: list[Path]) -> list[Path]:
+            return filter_python_files(files, (Path(),), (), (), False)
+
+        # Changes are made from another thread, with absolute paths, so that they never apply outside `tmp_path`.
+        def replace_file() -> None:
+            (tmp_path / "bar.py").unlink()
+            (tmp_path / "new.py").touch()
+            (tmp_path / "data.json").touch()
+
+        def create_package() -> None:
+            (tmp_path / "pkg").mkdir()
+            (tmp_path / "pkg/mod.py").touch()
+
+        watcher = watch_files(find_files, filter_files, [Path("pyproject.toml")], debounce_delay=0.2)
+
+        _change_soon(lambda: (tmp_path / "foo.py").write_text("import foo"))
+        assert next(watcher) == ([Path("foo.py")], [Path("bar.py"), Path("foo.py"), Path("src/baz.py")])
+
+        # Files that are not watched (e.g. `data.json`) are not reported.
+        _change_soon(replace_file)
+        assert next(watcher) == ([Path("bar.py"), Path("new.py")], [Path("foo.py"), Path("src/baz.py"), Path("new.py")])
+
+        _change_soon(lambda: (tmp_path / "pyproject.toml").write_text("[project]"))
+        assert next(watcher) == ([Path("pyproject.toml")], [Path("foo.py"), Path("src/baz.py"), Path("new.py")])
+
+        _change_soon(create_package)
+        assert next(watcher) == (
+            [Path("pkg/mod.py")],
+            [Path("foo.py"), Path("new.py"), Path("pkg/mod.py"), Path("src/baz.py")],
+        )
+
+        _change_soon(lambda: shutil.rmtree(tmp_path / "src"))
+        assert next(watcher) == ([Path("src/baz.py")], [Path("foo.py"), Path("new.py"), Path("pkg/mod.py")])
+
+        # The file tree is only walked again when directories are created or deleted.
+        assert walks == 3
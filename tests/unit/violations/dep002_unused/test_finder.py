@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from deptry.dependency import Dependency
+from deptry.dependency import DependenciesIndex, Dependency
 from deptry.imports.location import Location
 from deptry.module import ModuleBuilder, ModuleLocations
 from deptry.violations import DEP002UnusedDependenciesFinder, DEP002UnusedDependencyViolation
@@ -65,3 +65,20 @@ def test_without_top_level() -> None:
     ]
 
     assert DEP002UnusedDependenciesFinder(modules_locations, dependencies, frozenset()).find() == []
+
+
+def test_with_shared_dependencies_index() -> None:
+    dependency_black = Dependency("black", Path("pyproject.toml"), module_names=("black", "blackd"))
+    dependency_toml = Dependency("toml", Path("pyproject.toml"))
+    dependencies = [dependency_black, dependency_toml]
+    dependencies_index = DependenciesIndex.from_dependencies(dependencies)
+    modules_locations = [
+        ModuleLocations(
+            ModuleBuilder("blackd", {"foo"}, frozenset(), dependencies, dependencies_index=dependencies_index).build(),
+            [Location(Path("foo.py"), 1, 2)],
+        )
+    ]
+
+    assert DEP002UnusedDependenciesFinder(
+        modules_locations, dependencies, frozenset(), dependencies_index=dependencies_index
+    ).find() == [DEP002UnusedDependencyViolation(dependency_toml, Location(Path("pyproject.toml")))]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from deptry.dependency import DependenciesIndex, Dependency
+from deptry.imports.location import Location
+from deptry.module import Module, ModuleLocations
+from deptry.violations.engine import ViolationsEngine
+
+if TYPE_CHECKING:
+    from deptry.violations import Violation
+
+RULES = frozenset({"DEP001", "DEP002", "DEP003", "DEP004", "DEP005"})
+
+
+def _get_modules_locations() -> list[ModuleLocations]:
+    """Modules with every combination of the properties that the rules depend on."""
+    modules_locations = []
+
+    for index, (standard_library, local_module, package, dev_top_levels, provided, dev_provided) in enumerate(
+        itertools.product(
+            (False, True),
+            (False, True),
+            (None, "package"),
+            (None, ["dev"], ["dev", "other_dev"]),
+            (False, True),
+            (False, True),
+        )
+    ):
+        module = Module(
+            f"module_{index}",
+            standard_library=standard_library,
+            local_module=local_module,
+            package=package,
+            dev_top_levels=dev_top_levels,
+            is_provided_by_dependency=provided,
+            is_provided_by_dev_dependency=dev_provided,
+        )
+        locations = [Location(Path(f"file_{index}.py"), line, 1) for line in (1, 2)]
+        modules_locations.append(ModuleLocations(module, locations))
+
+    return modules_locations
+
+
+def _get_dependencies() -> list[Dependency]:
+    return [
+        Dependency("package", Path("pyproject.toml")),
+        Dependency("unused", Path("pyproject.toml")),
+        Dependency("asyncio", Path("pyproject.toml")),
+        Dependency("module_0", Path("pyproject.toml")),
+        Dependency("unused_too", Path("requirements.txt")),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("rules", "ignored_modules"),
+    [
+        (RULES, {}),
+        (RULES - {"DEP002"}, {}),
+        (frozenset({"DEP001", "DEP005"}), {}),
+        (RULES, {"DEP001": frozenset({"module_0"}), "DEP002": frozenset({"unused"}), "DEP005": frozenset({"asyncio"})}),
+    ],
+)
+def test_same_violations_as_finders(rules: frozenset[str], ignored_modules: dict[str, frozenset[str]]) -> None:
+    modules_locations = _get_modules_locations()
+    dependencies = _get_dependencies()
+    standard_library_modules = frozenset({"asyncio", "module_0"})
+    dependencies_index = DependenciesIndex.from_dependencies(dependencies)
+
+    expected = [
+        violation
+        for finder in ViolationsEngine.FINDERS
+        if finder.violation.error_code in rules
+        for violation in finder(
+            modules_locations,
+            dependencies,
+            standard_library_modules,
+            tuple(ignored_modules.get(finder.violation.error_code, ())),
+            dependencies_index,
+        ).find()
+    ]
+
+    violations = ViolationsEngine(
+        modules_locations, dependencies, standard_library_modules, dependencies_index, rules, ignored_modules
+    ).find()
+
+    assert expected
+    assert _group_by_rule(violations) == _group_by_rule(expected)
+
+
+def _group_by_rule(violations: list[Violation]) -> dict[str, list[Violation]]:
+    # Violations are sorted afterwards, so only the order of the violations of each rule matters.
+    return {rule: [violation for violation in violations if violation.error_code == rule] for rule in RULES}
@@ -1,11 +1,86 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
+from typing import ClassVar
+
+import pytest
 
 from deptry.imports.location import Location
-from deptry.module import Module
-from deptry.violations import DEP001MissingDependencyViolation, DEP004MisplacedDevDependencyViolation
-from deptry.violations.finder import _filter_inline_ignored_violations, _get_sorted_violations
+from deptry.module import Module, ModuleLocations
+from deptry.violations import (
+    DEP001MissingDependencyViolation,
+    DEP004MisplacedDevDependencyViolation,
+    Violation,
+    ViolationsFinder,
+)
+from deptry.violations.finder import _filter_inline_ignored_violations, _get_sorted_violations, find_violations
+
+
+@dataclass
+class CustomViolation(Violation):
+    error_code: ClassVar[str] = "CUS001"
+    error_template: ClassVar[str] = "'{name}' imported from a custom rule"
+
+    def get_error_message(self) -> str:
+        return self.error_template.format(name=self.issue.name)
+
+
+@dataclass
+class CustomFinder(ViolationsFinder):
+    """Flag every imported module, to check that custom finders are run alongside the built-in rules."""
+
+    violation: ClassVar[type[Violation]] = CustomViolation
+
+    def find(self) -> list[Violation]:
+        return [
+            self.violation(module_with_locations.module, location)
+            for module_with_locations in self.imported_modules_with_locations
+            if module_with_locations.module.name not in self.ignored_modules
+            for location in module_with_locations.locations
+        ]
+
+
+@pytest.mark.parametrize(
+    ("ignore", "per_rule_ignores", "expected"),
+    [
+        pytest.param(
+            (),
+            {},
+            [
+                CustomViolation(Module("foo", local_module=True), Location(Path("foo.py"), 1, 0)),
+                CustomViolation(Module("bar", local_module=True), Location(Path("foo.py"), 2, 0)),
+            ],
+            id="no ignores",
+        ),
+        pytest.param(
+            (),
+            {"CUS001": ("bar",)},
+            [CustomViolation(Module("foo", local_module=True), Location(Path("foo.py"), 1, 0))],
+            id="per rule ignores",
+        ),
+        pytest.param(("CUS001",), {}, [], id="ignored rule"),
+    ],
+)
+def test_find_violations_with_extra_finders(
+    ignore: tuple[str, ...], per_rule_ignores: dict[str, tuple[str, ...]], expected: list[Violation]
+) -> None:
+    imported_modules_with_locations = [
+        ModuleLocations(Module("foo", local_module=True), [Location(Path("foo.py"), 1, 0)]),
+        ModuleLocations(Module("bar", local_module=True), [Location(Path("foo.py"), 2, 0)]),
+    ]
+
+    assert (
+        find_violations(
+            imported_modules_with_locations,
+            [],
+            ignore,
+            per_rule_ignores,
+            frozenset(),
+            extra_finders=(CustomFinder,),
+        )
+        == expected
+    )
 
 
 def test__get_sorted_violations() -> None:
@@ -28,6 +103,15 @@ def test__get_sorted_violations() -> None:
     ]
 
 
+def test__get_sorted_violations_sorts_files_as_paths() -> None:
+    files = [Path("a/b.py"), Path("a.b/c.py"), Path("a-b.py"), Path("a/b/c.py"), Path("ab.py"), Path("a.py")]
+    violations: list[Violation] = [
+        DEP001MissingDependencyViolation(Module("foo"), Location(file, 1, 0)) for file in files
+    ]
+
+    assert [violation.location.file for violation in _get_sorted_violations(violations)] == sorted(files)
+
+
 def test__filter_inline_ignored_violations_no_ignored_codes() -> None:
     violations = [
         DEP001MissingDependencyViolation(Module("foo"), Location(Path("foo.py"), 1, 0)),
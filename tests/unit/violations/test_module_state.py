@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from deptry.module import Module
+from deptry.violations.module_state import ModuleState, get_module_state
+
+
+@pytest.mark.parametrize(
+    ("module", "expected"),
+    [
+        (Module("foo", package="foo", is_provided_by_dependency=True), ModuleState.OK),
+        (
+            Module("foo", package="foo", is_provided_by_dependency=True, is_provided_by_dev_dependency=True),
+            ModuleState.OK,
+        ),
+        (Module("foo", package="foo", is_provided_by_dev_dependency=True), ModuleState.MISPLACED_DEV),
+        (Module("foo", dev_top_levels=["foo"], is_provided_by_dev_dependency=True), ModuleState.MISPLACED_DEV),
+        (Module("foo", dev_top_levels=["foo", "bar"], is_provided_by_dev_dependency=True), ModuleState.OK),
+        (
+            Module("foo", local_module=True, is_provided_by_dev_dependency=True, package="foo"),
+            ModuleState.MISPLACED_DEV,
+        ),
+        (Module("foo", local_module=True), ModuleState.OK),
+        (Module("foo", package="foo", local_module=True), ModuleState.OK),
+        (Module("foo"), ModuleState.MISSING),
+        (Module("foo", package="foo"), ModuleState.TRANSITIVE),
+    ],
+)
+def test_get_module_state(module: Module, expected: ModuleState) -> None:
+    assert get_module_state(module) is expected
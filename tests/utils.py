@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from deptry.core import Core
 from deptry.reporters.text import COLORS
 from tests.functional.utils import DEPTRY_WHEEL_DIRECTORY
 
@@ -127,15 +128,43 @@ class VirtualEnvironment:
     def run_deptry(
         self, arguments: str = "", enforce_posix_paths: bool = True, no_ansi: bool = True
     ) -> subprocess.CompletedProcess[str]:
-        command = f"deptry {arguments}"
+        return self.run(f"deptry {self._get_deptry_arguments(arguments, enforce_posix_paths, no_ansi)}")
 
+    def run_deptry_batch(
+        self, arguments: str = "", enforce_posix_paths: bool = True, no_ansi: bool = True
+    ) -> subprocess.CompletedProcess[str]:
+        script = self.project_path / ("Scripts/deptry-batch.exe" if sys.platform == "win32" else "bin/deptry-batch")
+
+        return self.run(
+            f"{script} {self._get_deptry_arguments(arguments, enforce_posix_paths, no_ansi)}",
+            from_python_executable=False,
+        )
+
+    def start_deptry(
+        self, arguments: str = "", enforce_posix_paths: bool = True, no_ansi: bool = True
+    ) -> subprocess.Popen[str]:
+        """Start deptry without waiting for it to exit, for commands that run until interrupted, like `--watch`."""
+        command = (
+            f"{self.python_executable} -m deptry {self._get_deptry_arguments(arguments, enforce_posix_paths, no_ansi)}"
+        )
+
+        return subprocess.Popen(
+            shlex.split(command, posix=sys.platform != "win32"),
+            env={**os.environ, "VIRTUAL_ENV": str(self.project_path)},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    @staticmethod
+    def _get_deptry_arguments(arguments: str, enforce_posix_paths: bool, no_ansi: bool) -> str:
         if enforce_posix_paths:
-            command += " --enforce-posix-paths"
+            arguments += " --enforce-posix-paths"
 
         if no_ansi:
-            command += " --no-ansi"
+            arguments += " --no-ansi"
 
-        return self.run(command)
+        return arguments
 
     @staticmethod
     def _get_path_to_wheel_file(directory: Path) -> Path:
@@ -189,3 +218,42 @@ def create_files(paths: list[Path]) -> None:
 
 def stylize(text: str, **kwargs: Any) -> str:
     return text.format(**kwargs, **COLORS)
+
+
+def create_core(**kwargs: object) -> Core:
+    """Create a `Core` with default options, overridden by `kwargs`."""
+    options: dict[str, object] = {
+        "root": (Path(),),
+        "config": Path("pyproject.toml"),
+        "no_ansi": False,
+        "per_rule_ignores": {},
+        "ignore": (),
+        "exclude": ("venv",),
+        "extend_exclude": (),
+        "using_default_exclude": True,
+        "ignore_notebooks": False,
+        "walk_threads": 0,
+        "requirements_files": ("requirements.txt",),
+        "using_default_requirements_files": True,
+        "requirements_files_dev": (),
+        "known_first_party": (),
+        "json_output": "",
+        "json_output_format": "json",
+        "sarif_output": "",
+        "package_module_name_map": {},
+        "optional_dependencies_dev_groups": (),
+        "non_dev_dependency_groups": (),
+        "experimental_namespace_package": False,
+        "experimental_import_scanner": False,
+        "enforce_posix_paths": False,
+        "github_output": False,
+        "github_warning_errors": (),
+        "cache_dir": None,
+        "changed_files": (),
+        "since": None,
+        "watch": False,
+        "baseline": None,
+        "update_baseline": False,
+        **kwargs,
+    }
+    return Core(**options)  # type: ignore[arg-type]